@@ -0,0 +1,87 @@
+"""
+Startup benchmark: time from spawning the stdio server to its first
+`list_tools` response, the cost a client pays for every new session.
+
+Each run starts a fresh `python src/server.py` process. Also reports how
+long the imports take inside a fresh interpreter (MCP SDK vs this
+server's own module), which is the bulk of the startup time.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+from pathlib import Path
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "src" / "server.py"
+
+IMPORT_PROBE = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+t0 = time.perf_counter()
+import mcp.server.fastmcp
+t1 = time.perf_counter()
+import src.server
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+async def time_to_list_tools() -> tuple[float, float, int]:
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER)], cwd=str(ROOT))
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull:
+        async with stdio_client(params, errlog=devnull) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                tools = await session.list_tools()
+                listed = time.perf_counter()
+    return initialized - start, listed - start, len(tools.tools)
+
+
+def import_times() -> tuple[float, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE, str(ROOT)], capture_output=True, text=True, check=True
+    ).stdout
+    sdk, server = out.split()
+    return float(sdk), float(server)
+
+
+def summarize(label: str, values: list[float]) -> None:
+    ms = [v * 1000 for v in values]
+    print(f"{label:<36}median {statistics.median(ms):8.1f} ms   min {min(ms):8.1f}   max {max(ms):8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    initialize, list_tools, tool_count = [], [], 0
+    for _ in range(args.runs):
+        t_init, t_list, tool_count = asyncio.run(time_to_list_tools())
+        initialize.append(t_init)
+        list_tools.append(t_list)
+
+    sdk, server = zip(*(import_times() for _ in range(args.runs)))
+
+    print(f"{args.runs} runs, {tool_count} tools")
+    summarize("spawn -> initialize response", initialize)
+    summarize("spawn -> first list_tools response", list_tools)
+    summarize("import mcp.server.fastmcp", list(sdk))
+    summarize("import src.server (after SDK)", list(server))
+
+
+if __name__ == "__main__":
+    main()
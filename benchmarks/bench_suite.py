@@ -0,0 +1,431 @@
+"""
+Benchmark suite: every tool and resource, driven through the MCP protocol.
+
+Each tool is called with synthetic inputs of increasing size (100 B to
+10 MB by default), over an in-process client session and over stdio
+against a spawned `python src/server.py`. Resources are read once per
+transport. For every case it records:
+
+- latency (p50 / p95 / max) and throughput (calls/s, input MB/s)
+- response size
+- the server's peak resident memory (from `comms://metrics`, so it is
+  measured the same way over both transports)
+- peak `tracemalloc` allocations during one extra call (in-process only)
+
+The result cache and the shared analysis cache are off by default, so
+repeated calls do the full work each time (--with-cache keeps them).
+Inputs large enough for the process pool are parsed in worker processes,
+whose memory is not part of the server's peak RSS.
+
+Results are written as JSON. With --baseline, they are compared against
+an earlier results file and the script exits with status 1 if any case
+got slower or heavier than --tolerance allows.
+
+Usage:
+    python benchmarks/bench_suite.py [--transports memory,stdio] [--sizes 100,10k,1m,10m]
+        [--repeat 5] [--max-seconds 10] [--output bench_results.json]
+        [--baseline baseline.json] [--tolerance 0.25]
+"""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "src" / "server.py"
+
+MB = 1024 * 1024
+# Differences smaller than these are noise, whatever the ratio
+FLOORS = {"p50_ms": 2.0, "tracemalloc_peak_mb": 1.0, "peak_rss_mb": 16.0}
+
+# ============================================================================
+# Synthetic inputs
+# ============================================================================
+
+PROSE = [
+    "Hey team, quick update on the migration plan for the billing service.",
+    "When you get a chance, can you take a look at the rollout doc?",
+    "We still need a decision on the database cutover - thoughts?",
+    "This is BLOCKING the release!!! Please respond ASAP.",
+    "No rush, but it would be nice to have the dashboards by Friday.",
+    "I'm not sure what they meant by 'phase two' in yesterday's email.",
+    "Per my last message, the config change was already approved.",
+]
+NOTES = [
+    "## Status",
+    "Decision: we ship the new onboarding flow behind a feature flag.",
+    "Action: @sam to update the runbook by Friday.",
+    "Priya will draft the customer email before next sprint.",
+    "Q: who owns the on-call rotation after the reorg?",
+    "Blocker: staging is down until the certificate is renewed.",
+    "- Follow up with legal on the data retention policy EOD Thursday",
+]
+THREAD = [
+    "[10:{minute:02d} AM] Alice: Any update on the release {n}? We need it by end of day.",
+    "[10:{minute:02d} AM] Bob: Still blocked on the review for change {n}, can someone take a look?",
+    "[10:{minute:02d} AM] Carol: +1 on the release {n}, we agreed to ship once the review is done.",
+    "[10:{minute:02d} AM] Dan: I'll pick up the review for change {n} this afternoon.",
+]
+DOCUMENT = [
+    "# Section {n}: design notes",
+    "This section describes the approach taken for component {n} and the reasons behind it.",
+    "The interface is kept deliberately small, so that callers depend on as little as possible.",
+    "- Requirement {n}.1: responses stay under one second",
+    "- Requirement {n}.2: failures are retried with backoff",
+    "| Option | Cost | Risk |\n| --- | --- | --- |\n| A{n} | low | medium |",
+    "```\nconfig = load('component_{n}.yaml')\n```",
+]
+
+
+def synthesize(lines: list[str], size: int, separator: str = "\n") -> str:
+    """Text of `size` UTF-8 bytes (or just under) cycling through `lines`, numbered per round."""
+    out, total, n = [], 0, 0
+    while total < size:
+        for line in lines:
+            piece = line.format(n=n, minute=n % 60) + separator
+            out.append(piece)
+            total += len(piece.encode("utf-8"))
+        n += 1
+    text = "".join(out).encode("utf-8")[:size]
+    return text.decode("utf-8", "ignore")
+
+
+def prose(size: int) -> str:
+    return synthesize(PROSE, size, " ")
+
+
+def notes(size: int) -> str:
+    return synthesize(NOTES, size)
+
+
+def thread(size: int) -> str:
+    return synthesize(THREAD, size)
+
+
+def document(size: int) -> str:
+    return synthesize(DOCUMENT, size, "\n\n")
+
+
+def batch(size: int, field: str) -> list[dict]:
+    count = max(1, min(500, size // 200))  # MAX_BATCH_SIZE is 500
+    return [{field: prose(size // count)} for _ in range(count)]
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+# Tool name (as reported) -> (MCP tool name, arguments for an input of `size` bytes)
+TOOLS = {
+    "check_message": ("check_message", lambda size: {"draft": prose(size), "recipient": "manager"}),
+    "check_message_batch": ("check_message_batch", lambda size: {"drafts": batch(size, "draft")}),
+    "decode_message": ("decode_message", lambda size: {"message": prose(size), "sender": "manager"}),
+    "prep_meeting": ("prep_meeting", lambda size: {"title": "Planning", "your_role": "tech lead", "agenda": notes(size)}),
+    "scaffold_document": ("scaffold_document", lambda size: {"document_content": document(size)}),
+    "scaffold_document[chunked]": (
+        "scaffold_document", lambda size: {"document_content": document(size), "chunked": True}
+    ),
+    "check_tone": ("check_tone", lambda size: {"message": prose(size), "relationship": "peer"}),
+    "check_tone_batch": ("check_tone_batch", lambda size: {"messages": batch(size, "message")}),
+    "call_or_text": ("call_or_text", lambda size: {"situation": prose(size), "urgency": "today"}),
+    "synthesize_thoughts": ("synthesize_thoughts", lambda size: {"brain_dump": prose(size)}),
+    "catch_up_thread": ("catch_up_thread", lambda size: {"thread_content": thread(size)}),
+    "summarize_meeting": ("summarize_meeting", lambda size: {"meeting_notes": notes(size)}),
+    "ask_clarity": ("ask_clarity", lambda size: {"confusing_situation": prose(size)}),
+    "unstuck_reading": ("unstuck_reading", lambda size: {"document_description": document(size)}),
+    "search_rules": ("search_rules", lambda size: {"query": prose(size), "k": 5}),
+    "open_meeting": ("open_meeting", lambda size: {"meeting_title": prose(min(size, 200))}),
+    # meeting_id is filled in per call (see prepare_call)
+    "append_meeting_notes": ("append_meeting_notes", lambda size: {"notes_chunk": notes(size)}),
+    "get_meeting_summary": ("get_meeting_summary", lambda size: {"notes": notes(size)}),
+}
+
+STATIC_RESOURCES = [
+    "comms://rules/message-clarity",
+    "comms://rules/context-interpretation",
+    "comms://rules/tone-calibration",
+    "comms://rules/meeting-structure",
+    "comms://rules/document-scaffolding",
+    "comms://rules/manifest",
+    "comms://frameworks/manifest",
+    "comms://cache/stats",
+    "comms://locales",
+    "comms://metrics",
+]
+
+
+async def prepare_call(session: ClientSession, target: str, arguments: dict) -> dict:
+    """Set up the state a call needs (a live meeting) before it is timed."""
+    if target == "append_meeting_notes":
+        return {"meeting_id": await open_meeting(session), **arguments}
+    if target == "get_meeting_summary":
+        meeting_id = await open_meeting(session)
+        await call(session, "append_meeting_notes", {"meeting_id": meeting_id, "notes_chunk": arguments["notes"]})
+        return {"meeting_id": meeting_id}
+    return arguments
+
+
+async def open_meeting(session: ClientSession) -> str:
+    return json.loads(await call(session, "open_meeting", {}))["meeting_id"]
+
+
+async def call(session: ClientSession, name: str, arguments: dict) -> str:
+    result = await session.call_tool(name, arguments)
+    text = result.content[0].text if result.content else ""
+    if result.isError:
+        raise RuntimeError(f"{name} failed: {text[:300]}")
+    return text
+
+
+async def resource_uris(session: ClientSession) -> list[str]:
+    """Static resources plus one of each templated kind (rule section, framework, document section)."""
+    uris = list(STATIC_RESOURCES)
+    found = json.loads(await call(session, "search_rules", {"query": "tone red flags", "k": 1}))
+    uris += [result["uri"] for result in found["results"]]
+    frameworks = json.loads((await session.read_resource("comms://frameworks/manifest")).contents[0].text)
+    uris += [info["uri"] for info in frameworks.values()][:1]
+    scaffold = json.loads(await call(session, "scaffold_document", {"document_content": document(20_000), "chunked": True}))
+    uris.append(scaffold["document_structure"][0]["uri"])
+    return uris
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+async def peak_rss_mb(session: ClientSession) -> float | None:
+    snapshot = json.loads((await session.read_resource("comms://metrics")).contents[0].text)
+    peak = snapshot.get("peak_rss_bytes")
+    return round(peak / MB, 1) if peak else None
+
+
+async def measure(session: ClientSession, request, input_bytes: int, repeat: int, max_seconds: float, traced: bool) -> dict:
+    """Time `request()` (an awaitable factory) up to `repeat` times or `max_seconds`."""
+    latencies, response_bytes, errors, error = [], 0, 0, None
+    started = time.perf_counter()
+    while len(latencies) + errors < repeat and (not latencies or time.perf_counter() - started < max_seconds):
+        prepared = await request.prepare()
+        start = time.perf_counter()
+        try:
+            text = await request.send(prepared)
+        except Exception as exc:  # Report and keep going with the other cases
+            errors += 1
+            error = str(exc)[:300]
+            if not latencies:
+                break
+            continue
+        latencies.append(time.perf_counter() - start)
+        response_bytes = len(text.encode("utf-8"))
+
+    row = {"calls": len(latencies), "errors": errors}
+    if error:
+        row["error"] = error
+    if latencies:
+        ms = sorted(value * 1000 for value in latencies)
+        busy = sum(latencies)
+        row.update({
+            "p50_ms": round(statistics.median(ms), 3),
+            "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+            "max_ms": round(ms[-1], 3),
+            "calls_per_s": round(len(ms) / busy, 2),
+            "input_mb_per_s": round(input_bytes * len(ms) / busy / MB, 2),
+            "response_bytes": response_bytes,
+        })
+        if traced:
+            prepared = await request.prepare()
+            tracemalloc.start()
+            try:
+                await request.send(prepared)
+                row["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / MB, 2)
+            finally:
+                tracemalloc.stop()
+    row["peak_rss_mb"] = await peak_rss_mb(session)
+    return row
+
+
+class ToolRequest:
+    def __init__(self, session: ClientSession, target: str, name: str, arguments: dict):
+        self.session, self.target, self.name, self.arguments = session, target, name, arguments
+
+    async def prepare(self) -> dict:
+        return await prepare_call(self.session, self.target, self.arguments)
+
+    async def send(self, arguments: dict) -> str:
+        return await call(self.session, self.name, arguments)
+
+
+class ResourceRequest:
+    def __init__(self, session: ClientSession, uri: str):
+        self.session, self.uri = session, uri
+
+    async def prepare(self) -> None:
+        return None
+
+    async def send(self, _) -> str:
+        result = await self.session.read_resource(self.uri)
+        return result.contents[0].text
+
+
+@asynccontextmanager
+async def connect(transport: str, env: dict):
+    if transport == "memory":
+        os.environ.update(env)
+        sys.path.insert(0, str(ROOT))
+        from mcp.shared.memory import create_connected_server_and_client_session
+        from src.server import mcp
+
+        logging.getLogger("mcp").setLevel(logging.WARNING)  # one log line per request otherwise
+        async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+            yield session
+    else:
+        params = StdioServerParameters(command=sys.executable, args=[str(SERVER)], env={**os.environ, **env}, cwd=str(ROOT))
+        # The server logs every request to stderr; failures still come back as tool errors
+        with open(os.devnull, "w") as errlog:
+            async with stdio_client(params, errlog=errlog) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    yield session
+
+
+async def run_transport(transport: str, sizes: list[int], targets: list[str], args) -> list[dict]:
+    env = {} if args.with_cache else {"COMMS_CACHE_MAX_BYTES": "0", "COMMS_ANALYSIS_CACHE_MAX_BYTES": "0"}
+    env["COMMS_METRICS_LOG"] = ""
+    traced = transport == "memory"
+    rows = []
+    async with connect(transport, env) as session:
+        for size in sizes:
+            for target in targets:
+                name, build = TOOLS[target]
+                arguments = build(size)
+                request = ToolRequest(session, target, name, arguments)
+                row = await measure(session, request, size, args.repeat, args.max_seconds, traced)
+                rows.append(report({"transport": transport, "kind": "tool", "target": target, "size": size, **row}))
+        if args.resources:
+            for uri in await resource_uris(session):
+                row = await measure(session, ResourceRequest(session, uri), 0, args.repeat, args.max_seconds, traced)
+                rows.append(report({"transport": transport, "kind": "resource", "target": uri, "size": 0, **row}))
+    return rows
+
+
+def report(row: dict) -> dict:
+    if row["calls"]:
+        allocated, rss = row.get("tracemalloc_peak_mb"), row["peak_rss_mb"]
+        print(
+            f"{row['transport']:>7} {row['target'][:44]:<44}{format_size(row['size']):>7}"
+            f"{row['calls']:>6}{row['p50_ms']:>11.2f}{row['p95_ms']:>11.2f}{row['input_mb_per_s']:>9.2f}"
+            f"{'-' if allocated is None else f'{allocated:.1f}':>10}{'-' if rss is None else f'{rss:.1f}':>9}",
+            flush=True,
+        )
+    else:
+        print(f"{row['transport']:>7} {row['target'][:44]:<44}{format_size(row['size']):>7}  ERROR {row.get('error')}", flush=True)
+    return row
+
+
+# ============================================================================
+# Baseline comparison
+# ============================================================================
+
+def compare(rows: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Regressions of `rows` against `baseline`, as printable lines."""
+    before = {(row["transport"], row["target"], row["size"]): row for row in baseline}
+    regressions = []
+    for row in rows:
+        old = before.get((row["transport"], row["target"], row["size"]))
+        if old is None:
+            continue
+        if old.get("calls") and not row.get("calls"):
+            regressions.append(f"{row['transport']} {row['target']} {format_size(row['size'])}: now fails ({row.get('error')})")
+            continue
+        for metric, floor in FLOORS.items():
+            new_value, old_value = row.get(metric), old.get(metric)
+            if new_value is None or old_value is None:
+                continue
+            if new_value > old_value * (1 + tolerance) and new_value - old_value > floor:
+                regressions.append(
+                    f"{row['transport']} {row['target']} {format_size(row['size'])}: "
+                    f"{metric} {old_value:g} -> {new_value:g} (+{(new_value / old_value - 1) * 100 if old_value else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower().rstrip("b")
+    factor = {"k": 1000, "m": 1000 * 1000}.get(value[-1:], 1)
+    return int(float(value.rstrip("km")) * factor)
+
+
+def format_size(size: int) -> str:
+    for unit, factor in (("MB", 1000 * 1000), ("kB", 1000)):
+        if size >= factor:
+            return f"{size / factor:g}{unit}"
+    return f"{size}B" if size else "-"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transports", default="memory,stdio", help="comma-separated: memory, stdio")
+    parser.add_argument("--sizes", default="100,10k,1m,10m", help="comma-separated input sizes in bytes (k/m suffixes)")
+    parser.add_argument("--tools", default="", help="comma-separated subset of tools (default: all)")
+    parser.add_argument("--no-resources", dest="resources", action="store_false", help="skip the resource reads")
+    parser.add_argument("--repeat", type=int, default=5, help="calls per case")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="stop repeating a case after this long")
+    parser.add_argument("--with-cache", action="store_true", help="keep the result and analysis caches on")
+    parser.add_argument("--output", default=str(ROOT / "bench_results.json"), help="JSON results file")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown/growth")
+    args = parser.parse_args()
+
+    sizes = sorted(parse_size(size) for size in args.sizes.split(","))
+    targets = [target for target in args.tools.split(",") if target] or list(TOOLS)
+    unknown = set(targets) - set(TOOLS)
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(sorted(unknown))}")
+
+    print(f"{'':>7} {'target':<44}{'size':>7}{'calls':>6}{'p50 ms':>11}{'p95 ms':>11}{'MB/s':>9}{'alloc MB':>10}{'RSS MB':>9}")
+    rows = []
+    for transport in args.transports.split(","):
+        rows += asyncio.run(run_transport(transport, sizes, targets, args))
+
+    results = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "sizes": sizes,
+            "repeat": args.repeat,
+            "with_cache": args.with_cache,
+        },
+        "results": rows,
+    }
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {len(rows)} results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+        regressions = compare(rows, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Microbenchmark: per-call cost of building tool responses.
+
+Compares the old approach (build the full nested dict, then
+json.dumps(indent=2)) with rendering the pre-serialized template,
+and checks that both produce identical output.
+
+Usage:
+    python benchmarks/bench_templates.py [--number N]
+"""
+
+from pathlib import Path
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src import server  # noqa: E402
+
+DRAFT = "Hey team, quick update on the migration. " * 8
+ENGLISH = server.locale_packs().get("en")
+LANGUAGE = {"locale": "en", "name": "English", "confidence": 1.0, "source": "detected"}
+
+CASES = {
+    "check_message": (server.CHECK_MESSAGE_RESPONSE, {
+        "draft": DRAFT, "recipient": "manager", "context": "Not provided",
+        "draft_signals": server._draft_signals(DRAFT),
+    }),
+    "decode_message": (server.DECODE_MESSAGE_RESPONSE, {
+        "message": DRAFT, "sender": "manager", "relationship": "Not specified",
+        "language": LANGUAGE,
+        "vague_phrases_found": ENGLISH.vague_phrases.find(DRAFT),
+    }),
+    "prep_meeting": (server.PREP_MEETING_RESPONSE, {
+        "meeting_title": "Architecture review", "your_role": "tech lead", "agenda": "No agenda provided",
+        "detected_in_agenda": "No agenda provided",
+    }),
+    "check_tone": (server.CHECK_TONE_RESPONSE, {
+        "message": DRAFT, "recipient": "Not specified", "relationship": "peer",
+        "language": LANGUAGE,
+        "detected_red_flags": ENGLISH.red_flags.scan(DRAFT),
+    }),
+    "call_or_text": (server.CALL_OR_TEXT_RESPONSE, {
+        "situation": DRAFT, "urgency": "today", "complexity": "Not specified",
+        "recommendation": server.call_or_text_table().decide(DRAFT, "today"),
+    }),
+    "ask_clarity": (server.ASK_CLARITY_RESPONSE, {
+        "situation": DRAFT, "asking": "Not specified",
+        "detected_in_situation": {
+            "language": LANGUAGE,
+            "vague_phrases": ENGLISH.vague_phrases.find(DRAFT),
+            "questions": [],
+        },
+    }),
+    "unstuck_reading": (server.UNSTUCK_READING_RESPONSE, {
+        "document": "Design doc for the new auth service", "blocking_issue": "Not specified",
+        "text_metrics": "Not measured", "reading_plan": "Not measured",
+    }),
+}
+
+
+def per_call_us(func, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def allocated_bytes(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'tool':<18}{'before (us)':>13}{'after (us)':>12}{'speedup':>9}{'before peak B':>15}{'after peak B':>14}")
+    for name, (template, values) in CASES.items():
+        def before():
+            return json.dumps(template.as_dict(**values), indent=2)
+
+        def after():
+            return template.render(**values)
+
+        assert before() == after(), f"{name}: rendered output differs"
+        t_before = per_call_us(before, args.number)
+        t_after = per_call_us(after, args.number)
+        print(
+            f"{name:<18}{t_before:>13.2f}{t_after:>12.2f}{t_before / t_after:>8.1f}x"
+            f"{allocated_bytes(before):>15}{allocated_bytes(after):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
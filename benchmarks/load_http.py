@@ -0,0 +1,138 @@
+"""
+Load test for the streamable HTTP transport: throughput and tail latency
+of tool calls as the number of concurrent client sessions grows.
+
+Starts `python src/server.py --transport streamable-http` on a free port,
+then for each concurrency level opens that many independent MCP sessions
+and has each one call tools back to back for a fixed duration. Every call
+gets a different input, and the result and analysis caches are off unless
+--with-cache is given, so each call does the full work.
+
+Throughput is reported against the first (smallest) level: `speedup` is
+calls/s relative to it and `scaling` is speedup per added session (1.0 is
+linear). Throughput that stays flat while p99 grows means calls are being
+queued, not run concurrently.
+
+Usage:
+    python benchmarks/load_http.py [--concurrency 1,4,16,64] [--duration 5] [--with-cache]
+"""
+
+from pathlib import Path
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = ROOT / "src" / "server.py"
+
+DRAFT = "Hey team, when you get a chance, thoughts on the migration plan? " * 6
+
+# A mix of cheap and heavier calls; each session cycles through them
+CALLS = [
+    ("check_message", {"draft": DRAFT, "recipient": "manager"}),
+    ("decode_message", {"message": DRAFT, "sender": "manager"}),
+    ("check_tone", {"message": DRAFT, "relationship": "peer"}),
+    ("catch_up_thread", {"thread_content": "\n\n".join(f"Alex: update {i}\n{DRAFT}" for i in range(40))}),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server did not start listening on port {port}")
+
+
+async def session_worker(url: str, index: int, stop_at: float, latencies: list[float], errors: list[int]) -> None:
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            step = index
+            while time.perf_counter() < stop_at:
+                name, arguments = CALLS[step % len(CALLS)]
+                # Vary one argument so calls aren't all served from the result cache
+                arguments = {**arguments, next(iter(arguments)): f"{next(iter(arguments.values()))} #{index}-{step}"}
+                start = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                latencies.append(time.perf_counter() - start)
+                if result.isError:
+                    errors.append(1)
+                step += 1
+
+
+async def run_level(url: str, concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors: list[int] = []
+    start = time.perf_counter()
+    stop_at = start + duration
+    await asyncio.gather(*(session_worker(url, i, stop_at, latencies, errors) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    ms = sorted(v * 1000 for v in latencies)
+    return {
+        "concurrency": concurrency,
+        "calls": len(ms),
+        "errors": len(errors),
+        "throughput": len(ms) / elapsed,
+        "p50": statistics.median(ms),
+        "p99": ms[min(len(ms) - 1, int(len(ms) * 0.99))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,4,16,64", help="comma-separated session counts")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per concurrency level")
+    parser.add_argument("--with-cache", action="store_true", help="keep the result and analysis caches on")
+    args = parser.parse_args()
+
+    env = {**os.environ, "COMMS_METRICS_LOG": ""}
+    if not args.with_cache:
+        env.update(COMMS_CACHE_MAX_BYTES="0", COMMS_ANALYSIS_CACHE_MAX_BYTES="0")
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, str(SERVER), "--transport", "streamable-http", "--port", str(port)],
+        cwd=str(ROOT),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    try:
+        wait_for_port(port)
+        url = f"http://127.0.0.1:{port}/mcp"
+        print(f"{'sessions':>8}{'calls':>8}{'errors':>8}{'calls/s':>10}{'speedup':>9}{'scaling':>9}{'p50 ms':>10}{'p99 ms':>10}")
+        first = None
+        for level in (int(c) for c in args.concurrency.split(",")):
+            row = asyncio.run(run_level(url, level, args.duration))
+            first = first or row
+            speedup = row["throughput"] / first["throughput"] if first["throughput"] else 0.0
+            scaling = speedup / (level / first["concurrency"])
+            print(
+                f"{row['concurrency']:>8}{row['calls']:>8}{row['errors']:>8}"
+                f"{row['throughput']:>10.1f}{speedup:>9.2f}{scaling:>9.2f}{row['p50']:>10.2f}{row['p99']:>10.2f}"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
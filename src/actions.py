@@ -0,0 +1,333 @@
+"""
+Spotting action items, deadlines and blockers in notes and messages.
+
+`find_action(line, reference)` decides whether one line reads as an
+action item and, if so, splits it into who / what / when. A line counts
+as an action item if it has:
+
+- an `Action:` / `AI:` / `TODO:` / `Follow-up:` prefix
+- an unchecked checkbox (`- [ ] ...`)
+- an `@name` mention
+- an owner phrase: "Sam will ...", "Sam to ...", "I'll ...", "we need to ..."
+- an imperative verb at the start: "Send the deck ...", "Follow up with ..."
+  (not if the line is a question: "Review the budget?")
+- a request to the reader: "Can you send ...?" (owned by "You")
+
+Due dates are found with `src.dates`, relative to a reference date.
+
+`ActionScan` runs over whole notes or thread messages in one pass, line
+by line (and sentence by sentence within a line), and collects the
+action items, the deadlines (date phrases after "by" / "due" / "before",
+or in an action item) and the blockers ("blocked on", "waiting for", ...)
+as structured candidates, each capped at MAX_CANDIDATES.
+`DECISION_RE` is the decision cue shared by live meeting sessions and
+incremental thread catch-up.
+`decode_agenda` reads a meeting agenda the same way and says what each
+item is likely to expect of the attendees.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+import re
+
+from src.dates import DateMatch, find_dates
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•+]\s+|\d{1,3}[.)]\s+)?(?P<box>\[[ _]?\]\s*)?")
+_DONE_BOX_RE = re.compile(r"^\s*(?:[-*•+]\s+)?\[[xX✓]\]")
+_PREFIX_RE = re.compile(r"^(?:action(?: item)?|ai|todo|to ?do|follow[- ]?up|next step)s?\s*[:\-–]\s*", re.IGNORECASE)
+_MENTION_RE = re.compile(r"(?<![\w.])@(?P<who>[A-Za-z][\w.\-]*[\w])")
+_OWNER_RE = re.compile(
+    r"^(?P<who>I|[Ww]e|[A-Z][\w\-']*(?: [A-Z][\w\-']*)?)"
+    r"(?P<verb>'ll| will| to| needs? to| (?:is|are|am) going to| owns| (?:is|are) on)\s+(?P<what>\S.*)$"
+)
+# "Notes" style capitalized words that are not people
+_NOT_OWNERS = {"It", "This", "That", "There", "They", "He", "She", "You", "Who", "What", "Need", "Needs", "Plan", "Goal"}
+
+IMPERATIVE_VERBS = (
+    "add", "ask", "book", "build", "call", "check", "circulate", "clean up", "confirm", "create", "decide",
+    "deploy", "document", "draft", "email", "estimate", "figure out", "file", "finalize", "finalise", "find",
+    "fix", "follow up", "get", "investigate", "look into", "make sure", "merge", "move", "open", "ping",
+    "prepare", "reach out", "remind", "remove", "reply", "respond", "review", "schedule", "send", "set up",
+    "share", "sync", "talk to", "test", "update", "upload", "verify", "write",
+)
+# Many of the verbs are nouns too ("Update on the migration", "Review of the design",
+# "Test results look good"), so a verb followed by a colon, by one of these words, or
+# by a word and then a verb like "is" / "looks" doesn't count
+_IMPERATIVE_RE = re.compile(
+    r"^(?:please\s+)?(?:" + "|".join(verb.replace(" ", r"\s+") for verb in IMPERATIVE_VERBS) + r")\b"
+    r"(?![:\-–])(?!\s+(?:on|from|of|about|for|is|was|are|were|went|has|had|and|meeting|questions?)\b)"
+    r"(?!\s+\S+\s+(?:is|are|was|were|went|has|have|had|looks?|seems?)\b)\s+\S",
+    re.IGNORECASE,
+)
+# "Can you send ...?": an ask of the reader, when an imperative verb follows
+_REQUEST_RE = re.compile(r"^(?:can|could|would|will) you (?:please )?(?P<what>\S.*?)\??$", re.IGNORECASE)
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+(?=\S)")
+# A "sentence" that is only mentions ("... by Friday. @sam") belongs to the one before
+_MENTIONS_ONLY_RE = re.compile(r"^(?:@[\w.\-]+[\s,]*)+$")
+# Words right before a date phrase that make it a deadline rather than a mention
+_DUE_CUE_RE = re.compile(r"\b(?:by|due|before|until|till|deadline(?: is)?|no later than|latest)\s*:?\s*$", re.IGNORECASE)
+_DUE_PHRASE_RE = re.compile(
+    r"^(?:by|due|before|until|eod|eow|eom|eoq|end of|close of|cob|asap|this sprint|next (?:sprint|week|month|quarter))\b",
+    re.IGNORECASE,
+)
+_BLOCKER_RE = re.compile(
+    r"\b(?:(?:blocked|held up|stuck) (?:on|by)|waiting (?:on|for)|depends on|dependent on|pending)\s+(?P<on>[^.,;!?\n]{1,80})"
+    r"|\b(?:blocked|blocker|blocking|stuck|on hold|can't (?:proceed|continue|move forward)"
+    r"|cannot (?:proceed|continue|move forward))\b",
+    re.IGNORECASE,
+)
+# Decisions: a "Decision:" style label, or a decided / agreed / going with phrase
+DECISION_RE = re.compile(
+    r"^(?:decision|decided|agreed|resolution|outcome|resolved)s?\s*[:\-–]"
+    r"|\b(?:decided|agreed|approved|signed off|settled on|final call|going with"
+    r"|(?:we|we'll|we will|let's|let us) go with|going forward)\b",
+    re.IGNORECASE,
+)
+_BLOCKED_WHO_RE = re.compile(r"^(?P<who>I|[Ww]e|[A-Z][\w\-']*)(?:'m|'re| (?:is|am|are|was|were|still|now))* (?:blocked|stuck|waiting|held up)\b")
+
+# Longest action text kept
+MAX_ACTION_CHARS = 300
+
+# Most candidates of each kind listed by an ActionScan (later ones are counted, not kept)
+MAX_CANDIDATES = 100
+
+
+@dataclass(frozen=True)
+class ActionItem:
+    """An action item candidate: who does what, by when."""
+
+    who: str | None
+    what: str
+    due: DateMatch | None
+
+    def as_dict(self) -> dict:
+        return {
+            "who": self.who or "Unassigned",
+            "what": self.what,
+            "due": self.due.as_dict() if self.due else None,
+        }
+
+
+def find_action(line: str, reference: date | None = None, dates: list[DateMatch] | None = None) -> ActionItem | None:
+    """
+    Return the action item in one line of notes, or None if it isn't one.
+
+    Args:
+        line: One line (or sentence) of notes
+        reference: Date that relative due dates are counted from (default: today)
+        dates: `find_dates(line, reference)`, if the caller already has it
+
+    Returns:
+        The action item candidate, or None
+    """
+    if _DONE_BOX_RE.match(line):
+        return None
+    bullet = _BULLET_RE.match(line)
+    text = line[bullet.end():].strip()
+    if not text:
+        return None
+
+    is_action = bullet.group("box") is not None
+    prefix = _PREFIX_RE.match(text)
+    if prefix:
+        text = text[prefix.end():]
+        is_action = True
+
+    who = None
+    owner = _OWNER_RE.match(text)
+    if owner and owner.group("who") not in _NOT_OWNERS:
+        who = owner.group("who")
+        text = owner.group("what")
+        is_action = True
+    mention = _MENTION_RE.search(text)
+    if mention:
+        who = who or mention.group("who")
+        is_action = True
+    request = _REQUEST_RE.match(text)
+    if request and _IMPERATIVE_RE.match(request.group("what")):
+        who = who or "You"
+        text = request.group("what")
+        is_action = True
+    if not is_action and _IMPERATIVE_RE.match(text) and not text.rstrip().endswith("?"):
+        is_action = True
+
+    if not is_action:
+        return None
+    if dates is None:
+        dates = find_dates(text, reference)
+        line = text
+    return ActionItem(who=who, what=text.rstrip(" .;")[:MAX_ACTION_CHARS], due=_due_date(line, dates))
+
+
+def _is_deadline(sentence: str, match: DateMatch) -> bool:
+    return bool(_DUE_PHRASE_RE.match(match.phrase) or _DUE_CUE_RE.search(sentence[max(0, match.start - 24):match.start]))
+
+
+def _due_date(sentence: str, dates: list[DateMatch]) -> DateMatch | None:
+    """The date phrase `sentence` gives as a deadline ("by Friday"), else its first date phrase."""
+    return next((match for match in dates if _is_deadline(sentence, match)), dates[0] if dates else None)
+
+
+class ActionScan:
+    """Action items, deadlines and blockers collected in one pass over notes or messages."""
+
+    def __init__(self, reference: date | None = None, max_candidates: int = MAX_CANDIDATES):
+        """
+        Args:
+            reference: Date that relative dates are counted from (default: today)
+            max_candidates: Most candidates of each kind kept
+        """
+        self.reference = reference or date.today()
+        self.max_candidates = max_candidates
+        self.lines = 0
+        self.found: dict[str, list[dict]] = {"action_items": [], "deadlines": [], "blockers": []}
+        self.counts = dict.fromkeys(self.found, 0)
+
+    def feed(self, text: str, context: dict | None = None) -> None:
+        """
+        Scan `text` (notes, or one message of a thread).
+
+        Args:
+            text: Text to scan
+            context: Added to every candidate found (e.g. the sender of a
+                message); without it, candidates carry their line number
+        """
+        for line in text.split("\n"):
+            self.lines += 1
+            if not line.strip():
+                continue
+            where = context if context is not None else {"line": self.lines}
+            sentences = _SENTENCE_END_RE.split(line)
+            if len(sentences) > 1 and _MENTIONS_ONLY_RE.match(sentences[-1]):
+                sentences[-2:] = [f"{sentences[-2]} {sentences[-1]}"]
+            for sentence in sentences:
+                self._scan(sentence, where)
+
+    def _scan(self, sentence: str, where: dict) -> None:
+        dates = find_dates(sentence, self.reference)
+        action = find_action(sentence, self.reference, dates)
+        if action is not None:
+            self._add("action_items", {**action.as_dict(), **where})
+        for match in dates:
+            if action is not None or _is_deadline(sentence, match):
+                self._add("deadlines", {
+                    **match.as_dict(),
+                    "owner": action.who if action is not None else None,
+                    "text": sentence.strip()[:MAX_ACTION_CHARS],
+                    **where,
+                })
+        blocker = _BLOCKER_RE.search(sentence)
+        if blocker:
+            blocked = _BLOCKED_WHO_RE.match(sentence.strip())
+            self._add("blockers", {
+                "who": blocked.group("who") if blocked else None,
+                "waiting_on": blocker.group("on").strip() if blocker.group("on") else None,
+                "text": sentence.strip()[:MAX_ACTION_CHARS],
+                **where,
+            })
+
+    def _add(self, kind: str, candidate: dict) -> None:
+        self.counts[kind] += 1
+        if len(self.found[kind]) < self.max_candidates:
+            self.found[kind].append(candidate)
+
+    def as_dict(self) -> dict:
+        result = {"reference_date": self.reference.isoformat(), **self.found}
+        not_listed = {kind: self.counts[kind] - len(items) for kind, items in self.found.items() if self.counts[kind] > len(items)}
+        if not_listed:
+            result["not_listed"] = not_listed
+        return result
+
+
+def scan_text(text: str, reference: date | None = None) -> dict:
+    """Action items, deadlines and blockers in `text`, by line (see `ActionScan`)."""
+    scan = ActionScan(reference)
+    scan.feed(text)
+    return scan.as_dict()
+
+
+def scan_messages(messages: list, reference: date | None = None, first: int = 1) -> dict:
+    """
+    Action items, deadlines and blockers in the messages of a thread, by message.
+
+    Args:
+        messages: Parsed messages (`src.threads.Message`)
+        reference: Date that relative dates are counted from (default: today)
+        first: Number of the first message, for candidates to point back to it
+    """
+    scan = ActionScan(reference)
+    for number, message in enumerate(messages, first):
+        scan.feed(message.text, {"message": number, "sender": message.sender or "Unknown"})
+    return scan.as_dict()
+
+
+_AGENDA_ITEM_RE = re.compile(
+    r"^\s*(?:[-*•+]\s+|\d{1,3}[.)]\s+)?(?:\d{1,2}[:.]\d{2}\s*(?:[AaPp][Mm])?\s*[-–]?\s*)?(?P<item>.*?)"
+    # "(Owner)" or "(10 min)" notes, before and/or after a "- 10 min" time slot
+    r"(?:\s*[(\[](?P<note>[^()\[\]]{1,60})[)\]])?"
+    r"(?:\s*[-–,]\s*(?P<slot>\d{1,3}\s*(?:m|min|mins|minutes)))?"
+    r"(?:\s*[(\[](?P<note_after>[^()\[\]]{1,60})[)\]])?\s*$",
+    re.IGNORECASE,
+)
+_MINUTES_RE = re.compile(r"^(?P<minutes>\d{1,3})\s*(?:m|min|mins|minutes)$", re.IGNORECASE)
+_AGENDA_KINDS = (
+    ("decision", re.compile(r"\b(?:decide|decision|approve|approval|sign[- ]?off|go/no[- ]go|vote|choose|pick|finali[sz]e)\b", re.IGNORECASE),
+     "A decision is expected - know your position and what you'd need to decide"),
+    ("review", re.compile(r"\b(?:review|feedback|walk-?through|retro|retrospective|post-?mortem|critique)\b", re.IGNORECASE),
+     "Read the material beforehand and come with specific feedback"),
+    ("planning", re.compile(r"\b(?:plan|planning|roadmap|prioriti[sz]\w*|estimate|estimation|sprint|capacity|scope|timeline|okrs?)\b", re.IGNORECASE),
+     "Priorities or dates get set - know your capacity, dependencies and what you'd push for"),
+    ("discussion", re.compile(r"\b(?:discuss|discussion|brainstorm|ideas|options|open floor|q&a|aob|any other business|concerns)\b", re.IGNORECASE),
+     "Open discussion - bring the one or two points you want heard"),
+    ("update", re.compile(r"\b(?:update|updates|status|report|demo|announcements?|fyi|news|progress|recap|round-?robin|check-?in|intro|introductions?)\b", re.IGNORECASE),
+     "Someone reports - listen for what affects you; have your own status ready if it goes round the room"),
+)
+_UNCLEAR_AGENDA_ITEM = "Not clear from the wording - ask the organizer what's expected, or listen for the first minute"
+
+
+def decode_agenda(agenda: str, reference: date | None = None) -> list[dict]:
+    """
+    What each line of a meeting agenda is likely to expect.
+
+    Args:
+        agenda: The agenda, one item per line
+        reference: Date that relative dates are counted from (default: today)
+
+    Returns:
+        One entry per item: its text, kind (decision / review / planning /
+        discussion / update / topic), what is expected, the owner, the
+        due date and the time slot in minutes, where the agenda says
+    """
+    reference = reference or date.today()
+    items = []
+    for number, line in enumerate(agenda.split("\n"), 1):
+        parsed = _AGENDA_ITEM_RE.match(line)
+        item = parsed.group("item").strip()
+        if not item:
+            continue
+        notes = [note.strip() for note in (parsed.group("note"), parsed.group("note_after")) if note]
+        minutes = next(filter(None, map(_MINUTES_RE.match, [parsed.group("slot") or "", *notes])), None)
+        note = next((note for note in notes if not _MINUTES_RE.match(note)), None)
+        dates = find_dates(item, reference)
+        action = find_action(item, reference, dates)
+        kind, expected = next(
+            ((name, expected) for name, pattern, expected in _AGENDA_KINDS if pattern.search(item)),
+            ("topic", _UNCLEAR_AGENDA_ITEM),
+        )
+        owner = action.who if action is not None else None
+        due = _due_date(item, dates)
+        if owner is None and note:
+            owner = note
+        items.append({
+            "line": number,
+            "item": item[:MAX_ACTION_CHARS],
+            "kind": kind,
+            "expected": expected,
+            "owner": owner,
+            "due": due.as_dict() if due else None,
+            "minutes": int(minutes.group("minutes")) if minutes else None,
+        })
+        if len(items) >= MAX_CANDIDATES:
+            break
+    return items
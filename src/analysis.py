@@ -0,0 +1,195 @@
+"""
+Shared text analysis, memoized by content hash.
+
+Several tools are often called on the same text in a row (check_message,
+then check_tone, then ask_clarity on one draft). Instead of each tool
+tokenizing and scanning its argument again, they all read from one
+`TextAnalysis` per distinct text, held in an `AnalysisCache` keyed by the
+SHA-256 of the content. Its stages are computed on first use and kept:
+
+    normalized -> words -> sentences -> paragraphs / list items
+               -> phrase hits, tone red flags, readability metrics
+    language
+
+so the second and third tool call on a draft reuse everything the first
+one computed. Stages that need server state (the detected language, the
+locale's phrase tables, the process pool) are computed through
+`stage(name, compute)` or take the table as an argument.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable
+import hashlib
+import re
+import sys
+import threading
+
+_WORD_RE = re.compile(r"\w+(?:['’]\w+)*")
+# A sentence runs to its end punctuation or the end of the line
+_SENTENCE_RE = re.compile(r"[^\s.!?][^.!?\n]*(?:[.!?]+[\"')\]]*|$)", re.MULTILINE)
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n\s*")
+_LIST_ITEM_RE = re.compile(r"^[ \t]*(?:[-*+•]|\d{1,3}[.)])[ \t]+\S[^\n]*", re.MULTILINE)
+
+# Longest sentence text included in a profile
+MAX_SENTENCE_CHARS = 200
+
+
+def content_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class TextAnalysis:
+    """Lazily computed analysis stages of one text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._stages: dict = {}
+
+    def stage(self, name, compute: Callable[["TextAnalysis"], object]):
+        """
+        The result of `compute(self)`, computed on first use and kept.
+
+        Two threads asking for a missing stage at once may both compute it;
+        the first result stored wins, so every caller sees the same value.
+        """
+        try:
+            return self._stages[name]
+        except KeyError:
+            return self._stages.setdefault(name, compute(self))
+
+    @property
+    def normalized(self) -> str:
+        """Lowercased, curly quotes folded; same length as the text, so offsets carry over."""
+        def compute(analysis):
+            from src.phrases import fold
+            return fold(analysis.text)
+        return self.stage("normalized", compute)
+
+    @property
+    def word_starts(self) -> array:
+        """Offset of each word."""
+        return self.stage("words", lambda analysis: array("l", (m.start() for m in _WORD_RE.finditer(analysis.normalized))))
+
+    @property
+    def sentences(self) -> list[tuple[int, int]]:
+        """(start, end) of each sentence (a line without end punctuation is one sentence)."""
+        return self.stage("sentences", lambda analysis: [m.span() for m in _SENTENCE_RE.finditer(analysis.text)])
+
+    @property
+    def paragraphs(self) -> list[tuple[int, int]]:
+        """(start, end) of each paragraph (separated by blank lines)."""
+        def compute(analysis):
+            text, spans, start = analysis.text, [], 0
+            for match in _PARAGRAPH_BREAK_RE.finditer(text):
+                if text[start:match.start()].strip():
+                    spans.append((start, match.start()))
+                start = match.end()
+            if text[start:].strip():
+                spans.append((start, len(text.rstrip())))
+            return spans
+        return self.stage("paragraphs", compute)
+
+    @property
+    def list_items(self) -> list[tuple[int, int]]:
+        """(start, end) of each bulleted or numbered line."""
+        return self.stage("list_items", lambda analysis: [m.span() for m in _LIST_ITEM_RE.finditer(analysis.text)])
+
+    def words_in(self, start: int, end: int) -> int:
+        """Number of words starting between `start` and `end`."""
+        starts = self.word_starts
+        return bisect_left(starts, end) - bisect_left(starts, start)
+
+    @property
+    def questions(self) -> list[str]:
+        """Sentences that end in a question mark."""
+        return self.stage(
+            "questions",
+            lambda analysis: [
+                analysis.text[start:end][:MAX_SENTENCE_CHARS]
+                for start, end in analysis.sentences
+                if analysis.text[start:end].rstrip("\"')]").endswith("?")
+            ],
+        )
+
+    def red_flags(self, scanner) -> dict:
+        """Tone red flags found by a `src.tone.RedFlagScanner`."""
+        return self.stage(("red_flags", id(scanner)), lambda analysis: scanner.scan(analysis.text, analysis.normalized))
+
+    def phrase_hits(self, table) -> list[dict]:
+        """Phrases from a `PhraseTable` found in the text."""
+        return self.stage(("phrases", id(table)), lambda analysis: table.find(analysis.text, analysis.normalized))
+
+    @property
+    def profile(self) -> dict:
+        """Counts describing the shape of the text."""
+        def compute(analysis):
+            sentence_words = [analysis.words_in(start, end) for start, end in analysis.sentences]
+            longest = max(range(len(sentence_words)), key=sentence_words.__getitem__, default=None)
+            return {
+                "words": len(analysis.word_starts),
+                "sentences": len(sentence_words),
+                "paragraphs": len(analysis.paragraphs),
+                "list_items": len(analysis.list_items),
+                "questions": len(analysis.questions),
+                "avg_sentence_words": round(sum(sentence_words) / len(sentence_words), 1) if sentence_words else 0.0,
+                "longest_sentence_words": sentence_words[longest] if sentence_words else 0,
+            }
+        return self.stage("profile", compute)
+
+
+class AnalysisCache:
+    """LRU cache of `TextAnalysis` objects keyed by content hash, with a byte budget."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, TextAnalysis] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> TextAnalysis:
+        """The analysis of `text`, shared with earlier calls on the same content."""
+        if self.max_bytes <= 0:
+            return TextAnalysis(text)
+        key = content_key(text)
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return analysis
+            self.misses += 1
+
+        analysis = TextAnalysis(text)
+        # Stages can take about as much memory as the text itself, so entries count double
+        size = 2 * sys.getsizeof(text)
+        if size > self.max_bytes:
+            return analysis
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._entries[key] = analysis
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+        return analysis
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,178 @@
+"""
+Fitting tool responses into a size budget.
+
+Every tool takes optional `max_tokens` / `max_bytes` arguments. When the
+rendered response is over budget, `fit` shrinks the template's slots in
+the template's `elide` order (raw content such as an echoed document
+first, derived data later; the constant framework is never cut):
+
+- strings keep their beginning
+- lists keep their first items
+- dicts keep their first keys (the first one that doesn't fit is shrunk)
+
+and adds an `elided` section to the response listing what was cut and
+how to get it.
+
+Token counts come from `estimate_tokens`, a local heuristic over byte
+classes (word runs, punctuation, line breaks, non-ASCII bytes) that needs
+no tokenizer and runs at memory speed. It approximates common BPE
+tokenizers on English text and JSON, erring on the high side.
+"""
+
+import json
+import math
+import string
+
+DEFAULT_FETCH = "Call the tool again with a larger max_tokens / max_bytes, or without them"
+# Placeholder left in a slot that was dropped entirely
+ELIDED = "[elided - see \"elided\" below]"
+
+
+def _classes() -> bytes:
+    table = bytearray(b"u" * 256)  # non-ASCII (UTF-8) bytes
+    for byte in range(128):
+        table[byte] = ord("p")
+    for byte in (string.ascii_letters + string.digits + "_").encode():
+        table[byte] = ord("a")
+    for byte in b" \t\r\v\f":
+        table[byte] = ord(" ")
+    table[ord("\n")] = ord("n")
+    return bytes(table)
+
+
+_CLASSES = _classes()
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate number of tokens in `text` for a typical BPE tokenizer."""
+    data = text.encode("utf-8", "surrogatepass").translate(_CLASSES)
+    letters = data.count(b"a")
+    words = data.count(b" a") + data.count(b"na") + data.count(b"pa") + data.count(b"ua") + data.startswith(b"a")
+    # Common words are one token, long ones about one per 3-4 characters;
+    # punctuation often merges with a neighbour (`":`, `",`); an indented line break is about one token
+    return math.ceil(max(words, letters / 3.5) + 0.7 * data.count(b"p") + data.count(b"n") + data.count(b"u") / 2)
+
+
+class Budget:
+    """Size limits for one response (0 = no limit)."""
+
+    def __init__(self, max_tokens: int = 0, max_bytes: int = 0):
+        if max_tokens < 0 or max_bytes < 0:
+            raise ValueError("max_tokens and max_bytes must be positive (or 0 for no limit)")
+        self.max_tokens = max_tokens
+        self.max_bytes = max_bytes
+
+    def __bool__(self) -> bool:
+        return bool(self.max_tokens or self.max_bytes)
+
+    def usage(self, text: str) -> float:
+        """Fraction of the budget `text` takes (over 1: too large)."""
+        used = 0.0
+        if self.max_tokens:
+            used = estimate_tokens(text) / self.max_tokens
+        if self.max_bytes:
+            used = max(used, len(text.encode("utf-8", "surrogatepass")) / self.max_bytes)
+        return used
+
+    def limits(self) -> dict:
+        return {name: value for name, value in (("max_tokens", self.max_tokens), ("max_bytes", self.max_bytes)) if value}
+
+
+def fit(template, budget: Budget, values: dict) -> str:
+    """
+    Render `template`, shrinking its `elide` slots in order until the response fits `budget`.
+
+    Args:
+        template: A ResponseTemplate
+        budget: Limits to fit
+        values: Slot values
+
+    Returns:
+        The rendered response; when anything was cut, it ends with an
+        `elided` section. If the response is still too large with every
+        elidable slot dropped, it is returned anyway with a note saying so.
+    """
+    text = template.render(**values)
+    if budget.usage(text) <= 1:
+        return text
+
+    values = dict(values)
+    fields = []
+    for name, fetch in template.elide.items():
+        full = values[name]
+        if len(json.dumps(full)) <= len(json.dumps(ELIDED)):
+            continue  # Nothing to gain
+        entry = {"field": name, "kept": "nothing", "how_to_get_it": fetch or DEFAULT_FETCH}
+        fields.append(entry)
+        values[name] = ELIDED
+        text = _with_report(template.render(**values), budget, fields)
+        allowance = 1 - budget.usage(text)
+        # Nested slots are indented further than `json.dumps` of the value alone, so retry a bit smaller
+        for _ in range(3):
+            shrunk = _shrink(full, allowance, budget) if allowance > 0 else None
+            if shrunk is None:
+                break
+            value, entry["kept"] = shrunk
+            attempt = _with_report(template.render(**{**values, name: value}), budget, fields)
+            if budget.usage(attempt) <= 1:
+                return attempt
+            allowance -= budget.usage(attempt) - 1 + 0.01
+        entry["kept"] = "nothing"
+        if budget.usage(text) <= 1:
+            return text
+    return _with_report(template.render(**values), budget, fields, over=True, template=template)
+
+
+def _with_report(text: str, budget: Budget, fields: list[dict], over: bool = False, template=None) -> str:
+    report = {"budget": budget.limits(), "fields": fields}
+    if over:
+        report["note"] = "Still over budget: the parts that are always kept are larger than the limit"
+        if template is not None and template.framework_uri:
+            report["note"] += " - call with framework_ref=True to get it as a link"
+    # Every template renders as a JSON object ending in "\n}"
+    return text[:-2] + ',\n  "elided": ' + json.dumps(report, indent=2).replace("\n", "\n  ") + "\n}"
+
+
+def _shrink(value, allowance: float, budget: Budget):
+    """(value cut to fit `allowance` of the budget, description of what was kept), or None."""
+    total = budget.usage(json.dumps(value, indent=2))
+    if total <= allowance:
+        return value, "everything"
+    if isinstance(value, str):
+        chars = int(len(value) * allowance / total * 0.95)
+        while chars > 0:
+            cut = value[:chars] + f"... [{len(value) - chars} more characters elided]"
+            if budget.usage(json.dumps(cut)) <= allowance:
+                return cut, f"first {chars} of {len(value)} characters"
+            chars = int(chars * 0.8)
+        return None
+    if isinstance(value, list):
+        costs = [budget.usage(json.dumps(item, indent=2)) for item in value]
+        count, used = 0, 0.0
+        while count < len(value) and used + costs[count] <= allowance * 0.95:
+            used += costs[count]
+            count += 1
+        while count > 0:
+            cut = value[:count] + [f"[{len(value) - count} more items elided]"]
+            if budget.usage(json.dumps(cut, indent=2)) <= allowance:
+                return cut, f"first {count} of {len(value)} items"
+            count = int(count * 0.8)
+        return None
+    if isinstance(value, dict):
+        kept, used = {}, 0.0
+        for key, item in value.items():
+            cost = budget.usage(json.dumps({key: item}, indent=2))
+            if used + cost > allowance * 0.95:
+                shrunk = _shrink(item, allowance * 0.95 - used, budget)
+                if shrunk is not None:
+                    kept[key] = shrunk[0]
+                break
+            kept[key] = item
+            used += cost
+        if not kept:
+            return None
+        dropped = [key for key in value if key not in kept]
+        if dropped:
+            kept["elided_keys"] = dropped
+        return kept, f"{len(kept) - bool(dropped)} of {len(value)} keys"
+    return None
@@ -0,0 +1,135 @@
+"""
+Content-addressed LRU cache for tool results.
+
+Tool responses depend only on their arguments, so a repeated call (for
+example re-running `check_message` on an unchanged draft) can be answered
+from memory. Entries are keyed by a SHA-256 of the tool name and its
+arguments (bound against the signature, so defaults and positional vs
+keyword calls hash the same) and evicted least recently used first once
+the total size passes the byte budget.
+"""
+
+from collections import OrderedDict
+from typing import Callable
+import functools
+import hashlib
+import inspect
+import json
+import sys
+import threading
+
+
+class ResultCache:
+    """LRU cache of tool results with a byte budget and hit/miss counters."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= sys.getsizeof(old)
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def memoize(self, bypass: Callable[..., bool] | None = None, vary: Callable[..., str] | None = None):
+        """Decorator caching a tool function's result.
+
+        Args:
+            bypass: Called with the bound arguments; return True to skip the
+                cache for that call (e.g. when the call has side effects)
+            vary: Called with the bound arguments; its result is added to the
+                key, for results that also depend on something outside them
+                (e.g. today's date)
+        """
+
+        def decorator(fn):
+            signature = inspect.signature(fn)
+            name = fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if self.max_bytes <= 0:
+                    return fn(*args, **kwargs)
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                if bypass is not None and bypass(**bound.arguments):
+                    return fn(*args, **kwargs)
+
+                arguments = bound.arguments if vary is None else {**bound.arguments, "\0vary": vary(**bound.arguments)}
+                key = cache_key(name, arguments)
+                result = self.get(key)
+                if result is None:
+                    result = fn(*args, **kwargs)
+                    self.put(key, result)
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+def cache_key(name: str, arguments: dict) -> str:
+    """Hash a tool name and its arguments without concatenating large strings."""
+    digest = hashlib.sha256(name.encode("utf-8"))
+    for arg in sorted(arguments):
+        value = arguments[arg]
+        if isinstance(value, str):
+            data = value.encode("utf-8", "surrogatepass")
+        else:
+            data = json.dumps(value, sort_keys=True, default=_jsonable).encode("utf-8")
+        digest.update(f"\0{arg}\0{type(value).__name__}\0{len(data)}\0".encode("utf-8"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _jsonable(value):
+    # Pydantic models (structured tool arguments)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
@@ -0,0 +1,153 @@
+"""
+Finding date phrases in notes and resolving them to calendar dates.
+
+`find_dates(text, reference)` returns every date phrase in `text` with
+the date it refers to, counted from `reference` (usually today):
+
+- absolute dates: `2024-05-10`, `May 10`, `10 May 2024`, `by 5/10` (month
+  first; a bare `5/10` is too often a fraction or score to count)
+- relative days: `today`, `tonight`, `EOD`, `tomorrow`, `in 3 days`
+- weekdays: `Friday`, `by Fri`, `this Friday` (the next one, today
+  included), `next Friday` (the one in the following week)
+- periods: `end of week`/`EOW` (Friday), `next week` (its Monday),
+  `end of month`/`EOM`, `in 2 weeks`
+
+Phrases that can't be resolved without more context (`next sprint`,
+`end of quarter`, `ASAP`) are still returned, with `date` set to None.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+import calendar
+import re
+
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+# Full names, or abbreviations that aren't also common words ("sat", "sun")
+_WEEKDAY = r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|tues|wed|thu|thur|thurs|fri)"
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b\.?"
+)
+_DAY = r"\d{1,2}(?:st|nd|rd|th)?"
+
+# Matched against the lowercased text: case-insensitive matching is several
+# times slower, and the lookahead skips words no date phrase can start with
+_DATE_RE = re.compile(
+    r"\b(?=[\dabcdefijmnostuw])(?:"
+    r"(?P<iso>\d{4}-\d{2}-\d{2})"
+    r"|(?P<month_day>" + _MONTH + r" " + _DAY + r"(?:,? \d{4})?)"
+    r"|(?P<day_month>" + _DAY + r" " + _MONTH + r"(?:,? \d{4})?)"
+    r"|(?:(?:by|on|due|before|until) )(?P<numeric>\d{1,2}/\d{1,2}(?:/\d{2,4})?)"
+    r"|(?P<in_n>in (?P<n>\d{1,3}|a|one|two|three) (?P<unit>day|week|month)s?)"
+    r"|(?P<next_weekday>next (?P<nw>" + _WEEKDAY + r"))"
+    r"|(?:this |eod |end of day )?(?P<weekday>" + _WEEKDAY + r")"
+    r"|(?P<today>today|tonight|eod|end of (?:the )?day|cob|close of business)"
+    r"|(?P<tomorrow>tomorrow|tmrw)"
+    r"|(?P<end_of_week>eow|end of (?:the |this )?week)"
+    r"|(?P<next_week>next week)"
+    r"|(?P<end_of_month>eom|end of (?:the |this )?month)"
+    r"|(?P<vague>asap|next sprint|this sprint|end of (?:the )?sprint|end of (?:the )?quarter|eoq|next quarter|next month)"
+    r")\b"
+)
+_DATE_ANY_CASE_RE = re.compile(_DATE_RE.pattern, re.IGNORECASE)
+
+_NUMBER_WORDS = {"a": 1, "one": 1, "two": 2, "three": 3}
+
+
+@dataclass(frozen=True)
+class DateMatch:
+    """A date phrase found in text, and the date it resolves to (if it can be resolved)."""
+
+    start: int
+    end: int
+    phrase: str
+    date: date | None
+
+    def as_dict(self) -> dict:
+        return {"phrase": self.phrase, "date": self.date.isoformat() if self.date else None}
+
+
+def _weekday_index(name: str) -> int:
+    return _WEEKDAYS.index(name[:3].lower())
+
+
+def _month_index(name: str) -> int:
+    return _MONTHS.index(name[:3].lower()) + 1
+
+
+def _safe_date(year: int, month: int, day: int) -> date | None:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _with_year(month: int, day: int, year: str | None, reference: date) -> date | None:
+    """A date with no year is taken to be the next such date on or after `reference`."""
+    if year:
+        year_number = int(year)
+        return _safe_date(year_number + 2000 if year_number < 100 else year_number, month, day)
+    resolved = _safe_date(reference.year, month, day)
+    if resolved is not None and resolved < reference:
+        resolved = _safe_date(reference.year + 1, month, day)
+    return resolved
+
+
+def _resolve(match: re.Match, reference: date) -> date | None:
+    kind = match.lastgroup
+    text = match.group(kind).lower()
+    if kind == "iso":
+        return _safe_date(*map(int, text.split("-")))
+    if kind in ("month_day", "day_month"):
+        parts = re.findall(r"[a-z]+|\d+", text)
+        month_name = next(part for part in parts if part.isalpha() and part not in ("st", "nd", "rd", "th"))
+        numbers = [part for part in parts if part.isdigit()]
+        return _with_year(_month_index(month_name), int(numbers[0]), numbers[1] if len(numbers) > 1 else None, reference)
+    if kind == "numeric":
+        parts = text.split("/")
+        return _with_year(int(parts[0]), int(parts[1]), parts[2] if len(parts) > 2 else None, reference)
+    if kind == "in_n":
+        n = match.group("n").lower()
+        count = _NUMBER_WORDS.get(n) or int(n)
+        unit = match.group("unit").lower()
+        if unit == "month":
+            month = reference.month - 1 + count
+            year = reference.year + month // 12
+            month = month % 12 + 1
+            return date(year, month, min(reference.day, calendar.monthrange(year, month)[1]))
+        return reference + timedelta(days=count * (7 if unit == "week" else 1))
+    if kind == "next_weekday":
+        next_monday = reference + timedelta(days=7 - reference.weekday())
+        return next_monday + timedelta(days=_weekday_index(match.group("nw")))
+    if kind == "weekday":
+        return reference + timedelta(days=(_weekday_index(text) - reference.weekday()) % 7)
+    if kind == "today":
+        return reference
+    if kind == "tomorrow":
+        return reference + timedelta(days=1)
+    if kind == "end_of_week":
+        return reference + timedelta(days=(4 - reference.weekday()) % 7)
+    if kind == "next_week":
+        return reference + timedelta(days=7 - reference.weekday())
+    if kind == "end_of_month":
+        return date(reference.year, reference.month, calendar.monthrange(reference.year, reference.month)[1])
+    return None
+
+
+def find_dates(text: str, reference: date | None = None) -> list[DateMatch]:
+    """
+    Find date phrases in `text`.
+
+    Args:
+        text: Text to search
+        reference: Date that relative phrases are counted from (default: today)
+
+    Returns:
+        One DateMatch per phrase, in order of appearance
+    """
+    reference = reference or date.today()
+    folded = text.lower()
+    # A few characters lowercase to more than one, which would shift the offsets
+    matches = _DATE_RE.finditer(folded) if len(folded) == len(text) else _DATE_ANY_CASE_RE.finditer(text)
+    return [DateMatch(m.start(), m.end(), text[m.start():m.end()], _resolve(m, reference)) for m in matches]
@@ -0,0 +1,145 @@
+"""
+Local decision table for call_or_text.
+
+The free-text `urgency` and `complexity` arguments (and, where they say
+nothing, the situation itself) are classified onto fixed levels by phrase
+matching, and the pair of levels is looked up in a rule table giving the
+method (call / text / video), the reasoning and an alternative. Phrases
+and rules live in a data file (resources/call-or-text.json) and are
+compiled once into `PhraseMatcher`s and a dict, so a decision costs one
+pass over the inputs.
+
+Each axis is classified from the first source that matches a phrase:
+
+- the argument itself (weight 1.0), where scale words like "high" count too
+- the situation text (weight 0.7)
+- the axis default (weight 0.3)
+
+An axis's confidence is that weight times the share of matched phrases
+that agree with the chosen level; the decision's confidence is the mean
+of the two axes. Below the table's `min_confidence` the result is marked
+for review against the full decision framework.
+"""
+
+from collections import Counter
+from pathlib import Path
+import json
+
+from src.phrases import PhraseMatch, PhraseMatcher, normalize_phrase
+
+ARGUMENT_WEIGHT = 1.0
+SITUATION_WEIGHT = 0.7
+DEFAULT_WEIGHT = 0.3
+
+
+class _Axis:
+    """Levels of one axis with their phrase matchers."""
+
+    def __init__(self, name: str, spec: dict):
+        self.name = name
+        self.levels = list(spec["levels"])
+        self.default = spec["default"]
+        if self.default not in self.levels:
+            raise ValueError(f"{name}: default level '{self.default}' is not one of its levels")
+        self.situation_phrases = _phrase_levels(name, spec["levels"])
+        argument_words = _phrase_levels(name, spec.get("argument_words", {}))
+        repeated = argument_words.keys() & self.situation_phrases.keys()
+        if repeated:
+            raise ValueError(f"{name}: {sorted(repeated)} are in both levels and argument_words")
+        self.argument_phrases = {**self.situation_phrases, **argument_words}
+        self.situation_matcher = PhraseMatcher(self.situation_phrases)
+        self.argument_matcher = PhraseMatcher(self.argument_phrases)
+
+    def classify(self, argument: str, situation: str, folded_situation: str | None = None) -> dict:
+        sources = (
+            ("argument", ARGUMENT_WEIGHT, self.argument_matcher, self.argument_phrases, argument, None),
+            ("situation", SITUATION_WEIGHT, self.situation_matcher, self.situation_phrases, situation, folded_situation),
+        )
+        for source, weight, matcher, phrases, text, folded in sources:
+            matches = _outermost(matcher.find(text, folded)) if text else []
+            if not matches:
+                continue
+            votes = Counter(phrases[match.phrase] for match in matches)
+            # Ties go to the level listed first (the more urgent / more complex one)
+            level = min(votes, key=lambda name: (-votes[name], self.levels.index(name)))
+            return {
+                "level": level,
+                "from": f"{self.name} argument" if source == "argument" else "situation",
+                "matched": sorted({match.phrase for match in matches if phrases[match.phrase] == level}),
+                "confidence": round(weight * votes[level] / len(matches), 2),
+            }
+        return {"level": self.default, "from": "default", "matched": [], "confidence": DEFAULT_WEIGHT}
+
+
+def _phrase_levels(axis: str, levels: dict[str, list[str]]) -> dict[str, str]:
+    """Normalized phrase -> level, refusing a phrase listed under two levels."""
+    phrase_levels = {}
+    for level, phrases in levels.items():
+        for phrase in phrases:
+            phrase = normalize_phrase(phrase)
+            if phrase_levels.setdefault(phrase, level) != level:
+                raise ValueError(f"{axis}: '{phrase}' is listed under both '{phrase_levels[phrase]}' and '{level}'")
+    return phrase_levels
+
+
+def _outermost(matches: list[PhraseMatch]) -> list[PhraseMatch]:
+    """Matches not overlapping an earlier or longer one ("not urgent" hides "urgent")."""
+    kept, end = [], -1
+    for match in sorted(matches, key=lambda match: (match.start, -match.end)):
+        if match.start >= end:
+            kept.append(match)
+            end = match.end
+    return kept
+
+
+class DecisionTable:
+    """Urgency / complexity levels and the method rule for each pair of them."""
+
+    def __init__(self, data: dict):
+        self.min_confidence = data.get("min_confidence", 0.5)
+        self.urgency = _Axis("urgency", data["axes"]["urgency"])
+        self.complexity = _Axis("complexity", data["axes"]["complexity"])
+        self.rules = {(rule["urgency"], rule["complexity"]): rule for rule in data["rules"]}
+        missing = [
+            f"{urgency}/{complexity}"
+            for urgency in self.urgency.levels
+            for complexity in self.complexity.levels
+            if (urgency, complexity) not in self.rules
+        ]
+        if missing:
+            raise ValueError(f"No rule for {', '.join(missing)}")
+
+    @classmethod
+    def from_file(cls, path: Path) -> "DecisionTable":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def decide(self, situation: str, urgency: str = "", complexity: str = "", folded_situation: str | None = None) -> dict:
+        """
+        Recommend a communication method.
+
+        Args:
+            situation: What needs communicating
+            urgency: Free-text urgency ("asap", "by Friday", "low"), optional
+            complexity: Free-text complexity ("needs discussion", "simple"), optional
+            folded_situation: `phrases.fold(situation)`, if already computed
+
+        Returns:
+            method, reasoning, alternative, confidence, how each axis was
+            classified, and whether the result needs review
+        """
+        urgency_level = self.urgency.classify(urgency, situation, folded_situation)
+        complexity_level = self.complexity.classify(complexity, situation, folded_situation)
+        rule = self.rules[(urgency_level["level"], complexity_level["level"])]
+        confidence = round((urgency_level["confidence"] + complexity_level["confidence"]) / 2, 2)
+        decision = {
+            "method": rule["method"],
+            "reasoning": rule["reasoning"],
+            "alternative": rule["alternative"],
+            "confidence": confidence,
+            "urgency": urgency_level,
+            "complexity": complexity_level,
+            "needs_review": confidence < self.min_confidence,
+        }
+        if decision["needs_review"]:
+            decision["review"] = "Little to go on - weigh the situation against the decision framework before recommending"
+        return decision
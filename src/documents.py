@@ -0,0 +1,154 @@
+"""
+Section splitting and storage for large documents.
+
+`split_sections` finds the heading structure of a document in one pass
+(Markdown `#` headings and `===`/`---` underlined headings, ignoring
+anything inside fenced code blocks). `DocumentStore` keeps recently
+scaffolded documents in memory so their sections can be served one at a
+time instead of echoing the whole document back in a tool response.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+import hashlib
+import re
+import threading
+
+# Sections longer than this are split further at paragraph boundaries
+MAX_SECTION_CHARS = 32_000
+
+_STRUCTURE_RE = re.compile(
+    r"^(?P<fence>```|~~~)"
+    r"|^(?P<hashes>#{1,6})[ \t]+(?P<title>[^\n]*?)[ \t#]*$"
+    r"|^(?P<setext>[ \t]{0,3}[^\s>|][^\n]*)\n(?P<underline>=+|-+)[ \t]*$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class Section:
+    """A heading-delimited slice of a document (offsets into the text)."""
+
+    index: int
+    title: str
+    level: int
+    start: int
+    end: int
+
+
+def content_hash(text: str) -> str:
+    """Short, stable content hash used in document and section identifiers."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def split_sections(text: str, max_chars: int = MAX_SECTION_CHARS) -> list[Section]:
+    """Split `text` into sections at its headings.
+
+    Text before the first heading becomes a level-0 "Preamble" section.
+    Sections longer than `max_chars` are split into numbered parts.
+    """
+    headings = []  # (start offset, level, title)
+    in_fence = None
+    for match in _STRUCTURE_RE.finditer(text):
+        fence = match.group("fence")
+        if fence:
+            if in_fence is None:
+                in_fence = fence
+            elif in_fence == fence:
+                in_fence = None
+            continue
+        if in_fence is not None:
+            continue
+        if match.group("hashes"):
+            headings.append((match.start(), len(match.group("hashes")), match.group("title")))
+        else:
+            level = 1 if match.group("underline")[0] == "=" else 2
+            headings.append((match.start(), level, match.group("setext").strip()))
+
+    bounds = []
+    if not headings or headings[0][0] > 0:
+        first = headings[0][0] if headings else len(text)
+        if text[:first].strip() or not headings:
+            bounds.append((0, first, 0, "Preamble"))
+    for i, (start, level, title) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        bounds.append((start, end, level, title))
+
+    sections = []
+    for start, end, level, title in bounds:
+        parts = _split_long(text, start, end, max_chars)
+        for part, (part_start, part_end) in enumerate(parts, 1):
+            part_title = title if len(parts) == 1 else f"{title} (part {part})"
+            sections.append(Section(len(sections), part_title, level, part_start, part_end))
+    return sections
+
+
+def _split_long(text: str, start: int, end: int, max_chars: int) -> list[tuple[int, int]]:
+    parts = []
+    while end - start > max_chars:
+        cut = text.rfind("\n\n", start + 1, start + max_chars)
+        cut = cut + 2 if cut != -1 else start + max_chars
+        parts.append((start, cut))
+        start = cut
+    parts.append((start, end))
+    return parts
+
+
+@dataclass(frozen=True)
+class StoredDocument:
+    """A document held in memory along with its section offsets."""
+
+    doc_id: str
+    text: str
+    sections: list[Section]
+
+    def section_text(self, index: int) -> str:
+        section = self.sections[index]
+        return self.text[section.start:section.end]
+
+
+class DocumentStore:
+    """Bounded in-memory store of documents, evicting least recently used first."""
+
+    def __init__(self, max_chars: int = 64_000_000):
+        self.max_chars = max_chars
+        self._documents: OrderedDict[str, StoredDocument] = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+
+    def add(self, text: str, split: Callable[[str], list[Section]] = split_sections) -> StoredDocument:
+        """
+        Store `text` (or refresh it if already stored) and return its entry.
+
+        Args:
+            text: Document text
+            split: Splits a new document into sections (only called if not already stored)
+
+        Returns:
+            The stored document
+        """
+        doc_id = content_hash(text)
+        with self._lock:
+            document = self._documents.get(doc_id)
+            if document is not None:
+                self._documents.move_to_end(doc_id)
+                return document
+
+        document = StoredDocument(doc_id, text, split(text))
+        with self._lock:
+            if doc_id not in self._documents:
+                self._documents[doc_id] = document
+                self._total_chars += len(text)
+                while self._total_chars > self.max_chars and len(self._documents) > 1:
+                    _, evicted = self._documents.popitem(last=False)
+                    self._total_chars -= len(evicted.text)
+        return document
+
+    def get(self, doc_id: str) -> StoredDocument | None:
+        """Return the stored document, or None if unknown or evicted."""
+        with self._lock:
+            document = self._documents.get(doc_id)
+            if document is not None:
+                self._documents.move_to_end(doc_id)
+            return document
@@ -0,0 +1,184 @@
+"""
+Locale packs and local language detection.
+
+The per-language data used by the tools lives in `resources/<locale>/`:
+
+- pack.json: the language's name, the safe opening phrases for
+  ask_clarity and the red-flag phrases for check_tone
+- vague-phrases.json: vague phrases and their meanings for decode_message
+- sample.txt: ordinary workplace text, which the language detector
+  learns the language from
+
+`LocalePacks` only lists the directories up front. A pack is read and
+compiled (phrase matcher, red-flag regexes) the first time a text in its
+language needs it and is kept from then on, so startup time and memory
+don't grow with the number of languages.
+
+The detector is a naive Bayes classifier over character trigrams of the
+words (padded with spaces, so " th" and "ed " carry word boundaries),
+trained on the sample texts on first use. Only the first
+MAX_DETECT_CHARS characters are looked at. Evidence is capped at
+EVIDENCE_TRIGRAMS trigrams, so the confidence says how clearly the text
+looks like one language rather than growing with its length. The
+default locale gets a head start (DEFAULT_ODDS), and texts too short or
+too ambiguous to tell fall back to it.
+"""
+
+from collections import Counter
+from pathlib import Path
+import json
+import math
+import re
+import threading
+
+DEFAULT_LOCALE = "en"
+
+# Characters of a text the detector looks at
+MAX_DETECT_CHARS = 2000
+
+# Fewer trigrams than this (about two short words) is not enough to tell languages apart
+MIN_TRIGRAMS = 8
+
+# Trigrams' worth of evidence the confidence is based on at most
+EVIDENCE_TRIGRAMS = 40
+
+# Below this confidence the default locale is used instead
+MIN_CONFIDENCE = 0.6
+
+# Most inputs are in the default language; a short text has to look this
+# many times likelier to be in another language before that one is picked
+DEFAULT_ODDS = 5.0
+
+# Additive smoothing for trigrams missing from a language's sample
+SMOOTHING = 0.5
+
+_LETTERS_RE = re.compile(r"[^\W\d_]+")
+
+
+def trigrams(text: str) -> Counter:
+    """Character trigrams of the words in `text` (lowercased, padded with a space on each side)."""
+    counts = Counter()
+    for word in _LETTERS_RE.findall(text.lower()):
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            counts[padded[i:i + 3]] += 1
+    return counts
+
+
+class LanguageDetector:
+    """Character-trigram language classifier trained on one sample text per locale."""
+
+    def __init__(self, samples: dict[str, str], default: str = DEFAULT_LOCALE):
+        """
+        Args:
+            samples: Locale -> text in that language
+            default: Locale used for texts too short or too ambiguous to tell
+        """
+        if default not in samples:
+            raise ValueError(f"No sample text for the default locale '{default}'")
+        self.default = default
+        counts = {locale: trigrams(text) for locale, text in samples.items()}
+        vocabulary = len(set().union(*counts.values()))
+        self._log_probs: dict[str, dict[str, float]] = {}
+        self._unseen: dict[str, float] = {}
+        for locale, grams in counts.items():
+            total = math.log(sum(grams.values()) + SMOOTHING * vocabulary)
+            self._log_probs[locale] = {gram: math.log(n + SMOOTHING) - total for gram, n in grams.items()}
+            self._unseen[locale] = math.log(SMOOTHING) - total
+
+    def detect(self, text: str) -> dict:
+        """
+        The language of `text`.
+
+        Returns:
+            {"locale", "confidence", "source"}: source is "detected", or
+            "default" when there was too little to go on
+        """
+        grams = trigrams(text[:MAX_DETECT_CHARS])
+        observed = sum(grams.values())
+        if observed < MIN_TRIGRAMS:
+            return {"locale": self.default, "confidence": 0.0, "source": "default"}
+
+        scale = min(1.0, EVIDENCE_TRIGRAMS / observed)
+        scores = {}
+        for locale, log_probs in self._log_probs.items():
+            unseen = self._unseen[locale]
+            scores[locale] = scale * sum(n * log_probs.get(gram, unseen) for gram, n in grams.items())
+        scores[self.default] += math.log(DEFAULT_ODDS)
+        best = max(scores.values())
+        weights = {locale: math.exp(score - best) for locale, score in scores.items()}
+        total = sum(weights.values())
+        locale = max(weights, key=weights.get)
+        confidence = weights[locale] / total
+        if confidence < MIN_CONFIDENCE:
+            return {"locale": self.default, "confidence": round(weights[self.default] / total, 2), "source": "default"}
+        return {"locale": locale, "confidence": round(confidence, 2), "source": "detected"}
+
+
+class LocalePack:
+    """The phrase tables of one language, compiled when the pack is loaded."""
+
+    def __init__(self, locale: str, directory: Path):
+        from src.phrases import PhraseTable
+        from src.tone import RedFlagScanner
+
+        directory = Path(directory)
+        data = json.loads((directory / "pack.json").read_text(encoding="utf-8"))
+        self.locale = locale
+        self.name = data["name"]
+        self.safe_opening_phrases = list(data["safe_opening_phrases"])
+        self.vague_phrases = PhraseTable.from_file(directory / "vague-phrases.json")
+        red_flags = data["red_flags"]
+        self.red_flags = RedFlagScanner(red_flags["sarcasm_phrases"], red_flags["curt_words"], red_flags["greetings"])
+
+
+class LocalePacks:
+    """The locale packs under a directory, each loaded on first use."""
+
+    def __init__(self, directory: Path, default: str = DEFAULT_LOCALE):
+        self.directory = Path(directory)
+        self.default = default
+        self._locales: list[str] | None = None
+        self._packs: dict[str, LocalePack] = {}
+        self._detector: LanguageDetector | None = None
+        self._lock = threading.Lock()
+
+    def locales(self) -> list[str]:
+        """Locales that have a pack (subdirectories with a pack.json)."""
+        if self._locales is None:
+            self._locales = sorted(path.parent.name for path in self.directory.glob("*/pack.json"))
+        return self._locales
+
+    def get(self, locale: str = "") -> LocalePack:
+        """
+        The pack for `locale` (the default locale if empty), loading it if not done yet.
+
+        Raises:
+            ValueError: There is no pack for `locale`
+        """
+        locale = (locale or self.default).strip().lower()
+        pack = self._packs.get(locale)
+        if pack is not None:
+            return pack
+        if locale not in self.locales():
+            raise ValueError(f"No locale pack for '{locale}'; available: {', '.join(self.locales())}")
+        with self._lock:
+            if locale not in self._packs:
+                self._packs[locale] = LocalePack(locale, self.directory / locale)
+            return self._packs[locale]
+
+    def detector(self) -> LanguageDetector:
+        """Language detector over every locale's sample text, trained on first use."""
+        if self._detector is None:
+            with self._lock:
+                if self._detector is None:
+                    samples = {
+                        locale: (self.directory / locale / "sample.txt").read_text(encoding="utf-8")
+                        for locale in self.locales()
+                    }
+                    self._detector = LanguageDetector(samples, self.default)
+        return self._detector
+
+    def loaded(self) -> list[str]:
+        """Locales whose packs have been loaded so far."""
+        return sorted(self._packs)
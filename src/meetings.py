@@ -0,0 +1,174 @@
+"""
+Live meeting notes: an append-only session per meeting.
+
+While notes are being taken, a client opens a session, appends each new
+chunk of notes, and asks for the summary whenever it likes. Each chunk is
+scanned once, line by line, as it arrives:
+
+- action items: who / what / when (see `src.actions`)
+- decisions: "Decision: ...", "we agreed ...", "decided to ...", ...
+- questions: "Q: ...", or lines ending in "?"; a question is closed again
+  when the next note line answers it ("A: ...")
+
+Only the extracted items are kept, not the notes themselves, and each list
+is capped at MAX_ITEMS, so a session's memory stays bounded however long
+the meeting runs. Sessions not used for `idle_timeout` seconds are evicted.
+"""
+
+from collections import OrderedDict
+from datetime import date
+import re
+import threading
+import time
+import uuid
+
+from src.actions import DECISION_RE, find_action
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•+]\s+|\d{1,3}[.)]\s+)?")
+_QUESTION_RE = re.compile(r"^(?:q|question|open question|tbd|unclear|unknown)\s*[:\-–]|\?\s*$", re.IGNORECASE)
+_ANSWER_RE = re.compile(r"^(?:a|answer|ans)\s*[:\-–]", re.IGNORECASE)
+
+# Most items of each kind kept per session (later ones are counted, not stored)
+MAX_ITEMS = 200
+# A "line" longer than this with no newline is scanned anyway
+MAX_PENDING_CHARS = 10_000
+# Longest decision or question text kept
+MAX_ITEM_CHARS = 300
+
+# Which list each kind of line goes into
+_ITEM_LISTS = {"decision": "decisions", "action_item": "action_items", "question": "open_questions"}
+
+
+def classify_line(line: str, reference: date) -> tuple[str, dict] | None:
+    """
+    What one line of notes is: an answer, decision, action item or question.
+
+    Returns:
+        (kind, item), or None for an ordinary note line
+    """
+    text = line[_BULLET_RE.match(line).end():].strip()
+    if not text:
+        return None
+    if _ANSWER_RE.match(text):
+        return "answer", {"text": text[:MAX_ITEM_CHARS]}
+    if DECISION_RE.search(text):
+        return "decision", {"text": text[:MAX_ITEM_CHARS]}
+    action = find_action(line, reference)
+    # "Review the budget?" and "Open question: ..." start with an imperative verb but
+    # ask rather than assign; only an action with an owner wins over a question
+    if _QUESTION_RE.search(text) and (action is None or action.who is None):
+        return "question", {"text": text[:MAX_ITEM_CHARS]}
+    if action is not None:
+        return "action_item", action.as_dict()
+    return None
+
+
+class MeetingSession:
+    """Items extracted so far from one meeting's notes."""
+
+    def __init__(self, meeting_id: str, title: str, reference: date):
+        self.meeting_id = meeting_id
+        self.title = title
+        self.reference = reference
+        self.last_used = time.monotonic()
+        self.characters = 0
+        self.lines = 0
+        self.items: dict[str, list[dict]] = {"decisions": [], "action_items": [], "open_questions": []}
+        self.answered_questions = 0
+        self.dropped = 0
+        self._pending = ""
+        self._last_kind: str | None = None
+        self._lock = threading.Lock()
+
+    def append(self, chunk: str) -> dict[str, list[dict]]:
+        """Scan a new chunk of notes; return the items it added."""
+        with self._lock:
+            self.characters += len(chunk)
+            lines = (self._pending + chunk).split("\n")
+            self._pending = lines.pop()
+            if len(self._pending) > MAX_PENDING_CHARS:
+                lines.append(self._pending)
+                self._pending = ""
+
+            added = {name: [] for name in self.items}
+            for line in lines:
+                self.lines += 1
+                self._add(line, added)
+            return added
+
+    def summary(self) -> dict:
+        """Everything extracted so far, including an unfinished last line."""
+        with self._lock:
+            result = {name: list(items) for name, items in self.items.items()}
+            classified = classify_line(self._pending, self.reference)
+            if classified is not None:
+                kind, item = classified
+                if kind == "answer":
+                    if self._last_kind == "question" and result["open_questions"]:
+                        result["open_questions"].pop()
+                elif len(result[_ITEM_LISTS[kind]]) < MAX_ITEMS:
+                    result[_ITEM_LISTS[kind]].append({**item, "line": self.lines + 1})
+            return result
+
+    def _add(self, line: str, added: dict[str, list[dict]]) -> None:
+        if not line.strip():
+            return
+        classified = classify_line(line, self.reference)
+        if classified is None:
+            self._last_kind = None
+            return
+        kind, item = classified
+        if kind == "answer":
+            # An answer closes the question on the note line right before it
+            if self._last_kind == "question" and self.items["open_questions"]:
+                self.items["open_questions"].pop()
+                self.answered_questions += 1
+        else:
+            name = _ITEM_LISTS[kind]
+            if len(self.items[name]) < MAX_ITEMS:
+                item["line"] = self.lines
+                self.items[name].append(item)
+                added[name].append(item)
+            else:
+                self.dropped += 1
+        self._last_kind = kind
+
+
+class MeetingSessions:
+    """Open meeting sessions, evicting idle ones and the least recently used past `max_sessions`."""
+
+    def __init__(self, max_sessions: int = 64, idle_timeout: float = 4 * 3600):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions: OrderedDict[str, MeetingSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, title: str, reference: date | None = None) -> MeetingSession:
+        """Start a new session; relative dates in the notes are counted from `reference` (default: today)."""
+        session = MeetingSession(uuid.uuid4().hex[:16], title, reference or date.today())
+        with self._lock:
+            self._evict_idle()
+            self._sessions[session.meeting_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, meeting_id: str) -> MeetingSession:
+        """Return an open session, raising ValueError if it is unknown or was evicted."""
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(meeting_id)
+            if session is None:
+                raise ValueError(f"Unknown or expired meeting_id {meeting_id!r}; call open_meeting to start a new session")
+            self._sessions.move_to_end(meeting_id)
+            session.last_used = time.monotonic()
+            return session
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        # Least recently used first, so stop at the first session still in use
+        while self._sessions:
+            meeting_id, session = next(iter(self._sessions.items()))
+            if session.last_used >= cutoff:
+                break
+            del self._sessions[meeting_id]
@@ -0,0 +1,177 @@
+"""
+Per-tool and per-resource latency and payload-size metrics.
+
+`Metrics.instrument()` wraps a tool or resource function and records the
+call count, errors, latency and input/output sizes. Latencies go into a
+fixed log-scale histogram (each bucket 25% wider than the one before, from
+10 µs to ~2 minutes), so recording is O(1) memory per name and
+percentiles are accurate to within one bucket.
+
+If a JSON-lines path is given, one line per call is appended to it as well.
+Snapshots also report the process's peak resident memory.
+"""
+
+from bisect import bisect_left
+from typing import Callable
+import functools
+import json
+import sys
+import threading
+import time
+
+_BUCKET_RATIO = 1.25
+_BUCKET_BOUNDS = [10e-6 * _BUCKET_RATIO ** i for i in range(75)]  # seconds
+
+
+def payload_bytes(value) -> int:
+    """UTF-8 size of the text in an argument or result (strings, lists, models)."""
+    if isinstance(value, str):
+        if value.isascii():
+            return len(value)
+        return len(value.encode("utf-8", "surrogatepass"))
+    if isinstance(value, (list, tuple)):
+        return sum(map(payload_bytes, value))
+    if isinstance(value, dict):
+        return sum(map(payload_bytes, value.values()))
+    if hasattr(value, "model_dump"):
+        return payload_bytes(value.model_dump())
+    return 0
+
+
+def peak_rss_bytes() -> int | None:
+    """Highest resident memory of this process so far (None where the platform doesn't report it)."""
+    try:
+        # Linux: unlike ru_maxrss, not inherited from the parent across fork/exec
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, KiB elsewhere
+
+
+class _Series:
+    """Counters and latency histogram for one tool or resource."""
+
+    __slots__ = ("calls", "errors", "buckets", "total_s", "max_s", "input_bytes", "output_bytes", "max_output_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.buckets = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.max_output_bytes = 0
+
+    def record(self, seconds: float, input_bytes: int, output_bytes: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.buckets[bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.total_s += seconds
+        self.max_s = max(self.max_s, seconds)
+        self.input_bytes += input_bytes
+        self.output_bytes += output_bytes
+        self.max_output_bytes = max(self.max_output_bytes, output_bytes)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (seconds) of the bucket holding the given fraction of calls."""
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(_BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max_s, self.max_s)
+        return 0.0
+
+    def summary(self) -> dict:
+        ms = 1000
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms": {
+                "mean": round(self.total_s / self.calls * ms, 3) if self.calls else 0.0,
+                "p50": round(self.percentile(0.50) * ms, 3),
+                "p95": round(self.percentile(0.95) * ms, 3),
+                "p99": round(self.percentile(0.99) * ms, 3),
+                "max": round(self.max_s * ms, 3),
+            },
+            "input_bytes": {
+                "total": self.input_bytes,
+                "mean": self.input_bytes // self.calls if self.calls else 0,
+            },
+            "output_bytes": {
+                "total": self.output_bytes,
+                "mean": self.output_bytes // self.calls if self.calls else 0,
+                "max": self.max_output_bytes,
+            },
+        }
+
+
+class Metrics:
+    """Registry of call metrics, keyed by kind ("tool"/"resource") and name."""
+
+    def __init__(self, log_path: str | None = None):
+        self.started = time.time()
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+        self._log = open(log_path, "a", buffering=1, encoding="utf-8") if log_path else None
+
+    def record(self, kind: str, name: str, seconds: float, input_bytes: int, output_bytes: int, error: bool = False) -> None:
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series()
+            series.record(seconds, input_bytes, output_bytes, error)
+            if self._log is not None:
+                self._log.write(json.dumps({
+                    "ts": round(time.time(), 3),
+                    "kind": kind,
+                    "name": name,
+                    "latency_ms": round(seconds * 1000, 3),
+                    "input_bytes": input_bytes,
+                    "output_bytes": output_bytes,
+                    "error": error,
+                }) + "\n")
+
+    def instrument(self, kind: str) -> Callable:
+        """Decorator recording every call of a tool or resource function."""
+
+        def decorator(fn):
+            name = fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                input_bytes = sum(map(payload_bytes, args)) + sum(map(payload_bytes, kwargs.values()))
+                start = time.perf_counter()
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception:
+                    self.record(kind, name, time.perf_counter() - start, input_bytes, 0, error=True)
+                    raise
+                self.record(kind, name, time.perf_counter() - start, input_bytes, payload_bytes(result))
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def snapshot(self) -> dict:
+        """Summary of every tool and resource called so far."""
+        with self._lock:
+            result = {
+                "uptime_s": round(time.time() - self.started, 1),
+                "peak_rss_bytes": peak_rss_bytes(),
+                "tools": {},
+                "resources": {},
+            }
+            for (kind, name), series in sorted(self._series.items()):
+                result[f"{kind}s"][name] = series.summary()
+        return result
@@ -0,0 +1,169 @@
+"""
+Near-duplicate detection with MinHash and locality-sensitive hashing.
+
+Threads and pasted notes often repeat the same content with small
+changes: forwarded text, "+1" replies restating a message, notes copied
+from the agenda. `group_near_duplicates` finds texts whose word 3-gram
+sets overlap by at least `threshold` (Jaccard similarity) without
+comparing every pair:
+
+- each text is reduced to a MinHash signature: every shingle is hashed
+  once and kept as the minimum of one of SIGNATURE_BINS bins (one
+  permutation hashing; empty bins borrow from the next filled bin)
+- signatures are cut into BANDS bands; texts that agree on a whole band
+  land in the same bucket and become candidates
+- candidates sharing the most bands are checked first (at most
+  MAX_CANDIDATES of them); one counts as a near duplicate if the exact
+  Jaccard similarity of the two shingle sets is at least `threshold`
+  (the signature estimate is far too high for short texts, whose bins
+  are mostly densified copies of each other)
+
+Texts that are identical after case and whitespace normalization
+(`fingerprint`) are grouped first, however short. Otherwise texts with
+fewer than MIN_SHINGLES shingles are never grouped: a changed date or
+ticket number in a one-line message is a real difference.
+
+Work is linear in the total number of words, plus a bounded number of
+bucket lookups and candidate checks per text (each bucket keeps its
+MAX_BUCKET_SIZE most recent texts), so it grows linearly with the number
+of messages instead of with the number of pairs.
+
+Shingles are hashed with blake2b, so signatures are the same in every
+process and every run.
+"""
+
+from collections import Counter
+from hashlib import blake2b, sha1
+import re
+
+SHINGLE_WORDS = 3
+SIGNATURE_BINS = 64
+BANDS = 16  # of SIGNATURE_BINS // BANDS rows each
+THRESHOLD = 0.8
+MIN_SHINGLES = 4
+MAX_BUCKET_SIZE = 32
+MAX_CANDIDATES = 4
+
+_ROWS = SIGNATURE_BINS // BANDS
+_WORD_RE = re.compile(r"\w+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n\s*")
+
+
+def fingerprint(text: str) -> str:
+    """Identity of a message's text, ignoring case and whitespace differences."""
+    normalized = " ".join(text.split()).lower()
+    return sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def shingles(text: str) -> frozenset[int] | None:
+    """Hashed word 3-grams of `text`, or None if it has fewer than MIN_SHINGLES."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_WORDS + MIN_SHINGLES - 1:
+        return None
+    hashed = frozenset(
+        _stable_hash(" ".join(words[i:i + SHINGLE_WORDS])) for i in range(len(words) - SHINGLE_WORDS + 1)
+    )
+    return hashed if len(hashed) >= MIN_SHINGLES else None
+
+
+def signature(hashes: frozenset[int]) -> tuple[int, ...]:
+    """MinHash signature of a set of hashed shingles (see `shingles`)."""
+    # Largest first, so the smallest hash of each bin is written last
+    minimums = {value % SIGNATURE_BINS: value for value in sorted(hashes, reverse=True)}
+    bins = list(map(minimums.get, range(SIGNATURE_BINS)))
+    if None in bins:
+        # Densify: an empty bin takes the value of the next filled bin (wrapping around), tagged with the distance
+        source = max(i for i, value in enumerate(bins) if value is not None) - SIGNATURE_BINS
+        for index in range(SIGNATURE_BINS - 1, -1, -1):
+            if bins[index] is None:
+                bins[index] = _stable_hash(f"{bins[source]}:{source - index}")
+            else:
+                source = index
+    return tuple(bins)
+
+
+def jaccard(first: frozenset[int], second: frozenset[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    return len(first & second) / len(first | second)
+
+
+def _stable_hash(text: str) -> int:
+    return int.from_bytes(blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def group_near_duplicates(texts: list[str], threshold: float = THRESHOLD) -> list[list[int]]:
+    """
+    Group texts that are near duplicates of an earlier text.
+
+    Args:
+        texts: Texts in order (messages, paragraphs)
+        threshold: Minimum Jaccard similarity of word 3-grams
+
+    Returns:
+        Groups of indices into `texts`, in order of their first member; the
+        first index of each group is its representative
+    """
+    groups: list[list[int]] = []
+    representatives: list[frozenset[int] | None] = []  # per group, shingles of its representative
+    buckets: dict[tuple, list[int]] = {}  # band key -> group numbers
+    exact: dict[str, int] = {}  # fingerprint -> group number
+    for index, text in enumerate(texts):
+        key = fingerprint(text) if text.strip() else None
+        if key in exact:
+            groups[exact[key]].append(index)
+            continue
+        hashes = shingles(text)
+        if hashes is None:
+            if key is not None:
+                exact[key] = len(groups)
+            groups.append([index])
+            representatives.append(None)
+            continue
+        sig = signature(hashes)
+
+        bands = [(band, sig[band * _ROWS:(band + 1) * _ROWS]) for band in range(BANDS)]
+        shared = Counter([group for band in bands for group in buckets.get(band, ())])
+        match = next(
+            (group for group, _ in shared.most_common(MAX_CANDIDATES) if jaccard(hashes, representatives[group]) >= threshold),
+            None,
+        )
+
+        if match is not None:
+            groups[match].append(index)
+            exact[key] = match
+            continue
+        group = len(groups)
+        exact[key] = group
+        groups.append([index])
+        representatives.append(hashes)
+        for band in bands:
+            bucket = buckets.setdefault(band, [])
+            bucket.append(group)
+            if len(bucket) > MAX_BUCKET_SIZE:
+                del bucket[0]
+    return groups
+
+
+def collapse_paragraphs(text: str, threshold: float = THRESHOLD) -> tuple[str, int]:
+    """
+    Replace repeated paragraphs with their first occurrence and a repeat count.
+
+    Args:
+        text: Notes or any text with blank-line separated paragraphs
+        threshold: See `group_near_duplicates`
+
+    Returns:
+        (text, number of paragraphs removed); the text is returned unchanged
+        if nothing was repeated
+    """
+    paragraphs = [paragraph for paragraph in _PARAGRAPH_BREAK_RE.split(text.strip()) if paragraph.strip()]
+    groups = group_near_duplicates(paragraphs, threshold)
+    if len(groups) == len(paragraphs):
+        return text, 0
+    collapsed = []
+    for group in groups:
+        paragraph = paragraphs[group[0]]
+        if len(group) > 1:
+            paragraph += f"\n[Repeated {len(group) - 1} more time{'s' if len(group) > 2 else ''} in the notes]"
+        collapsed.append(paragraph)
+    return "\n\n".join(collapsed), len(paragraphs) - len(groups)
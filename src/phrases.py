@@ -0,0 +1,160 @@
+"""
+Multi-phrase matching with an Aho-Corasick automaton.
+
+`PhraseMatcher` finds every dictionary phrase in a text in one pass, so
+matching time depends on the length of the text (plus the number of
+matches), not on how many phrases are in the dictionary. Matching is
+case-insensitive, treats any run of whitespace as a single space, folds
+curly quotes to straight ones, and only reports matches that start and
+end on word boundaries.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+import json
+
+_FOLD = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+
+
+def fold(text: str) -> str:
+    """Lowercase `text` and fold curly quotes, keeping every character at its original offset."""
+    folded = text.translate(_FOLD).lower()
+    if len(folded) != len(text):
+        # A few characters lowercase to two code points; keep offsets aligned
+        folded = "".join(ch.lower()[0] for ch in text.translate(_FOLD))
+    return folded
+
+
+def normalize_phrase(phrase: str) -> str:
+    return " ".join(fold(phrase).split())
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """A dictionary phrase found in a text (offsets into the original text)."""
+
+    phrase: str
+    start: int
+    end: int
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over a set of phrases."""
+
+    def __init__(self, phrases):
+        # State 0 is the root. _goto[state] maps a character to the next state,
+        # _fail[state] is the longest proper suffix state, _out[state] lists
+        # the phrases (by index) that end in that state.
+        self.phrases: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for phrase in phrases:
+            normalized = normalize_phrase(phrase)
+            if normalized:
+                self._add(normalized)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def _add(self, phrase: str) -> None:
+        state = 0
+        for ch in phrase:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        if not self._out[state]:
+            self._out[state] = (len(self.phrases),)
+            self.phrases.append(phrase)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str, folded: str | None = None) -> list[PhraseMatch]:
+        """Return all phrase occurrences in `text`, in order of where they end.
+
+        `folded` is `fold(text)`, if the caller already has it.
+        """
+        goto, fail, out, phrases = self._goto, self._fail, self._out, self.phrases
+        matches = []
+        # Original offset of each normalized character, so spans can be mapped
+        # back after whitespace runs were collapsed
+        positions = []
+        state = 0
+        prev_space = True
+        for index, ch in enumerate(folded if folded is not None else fold(text)):
+            if ch.isspace():
+                if prev_space:
+                    continue
+                ch = " "
+                prev_space = True
+            else:
+                prev_space = False
+            positions.append(index)
+
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for phrase_index in out[state]:
+                    phrase = phrases[phrase_index]
+                    start = positions[len(positions) - len(phrase)]
+                    if _on_boundaries(text, phrase, start, index + 1):
+                        matches.append(PhraseMatch(phrase, start, index + 1))
+        return matches
+
+
+def _on_boundaries(text: str, phrase: str, start: int, end: int) -> bool:
+    if phrase[0].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if phrase[-1].isalnum() and end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+class PhraseTable:
+    """Phrases with their meanings, compiled into a `PhraseMatcher`."""
+
+    def __init__(self, meanings: dict[str, str]):
+        self.meanings = {normalize_phrase(phrase): meaning for phrase, meaning in meanings.items()}
+        self.matcher = PhraseMatcher(self.meanings)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "PhraseTable":
+        """Load a JSON file of the form {"phrases": {"phrase": "meaning", ...}}."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data["phrases"])
+
+    def __len__(self) -> int:
+        return len(self.matcher)
+
+    def find(self, text: str, folded: str | None = None) -> list[dict]:
+        """Phrases present in `text` with their meaning and character span (`folded`: see PhraseMatcher.find)."""
+        return [
+            {
+                "phrase": match.phrase,
+                "meaning": self.meanings[match.phrase],
+                "start": match.start,
+                "end": match.end,
+                "text": text[match.start:match.end],
+            }
+            for match in self.matcher.find(text, folded)
+        ]
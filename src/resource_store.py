@@ -0,0 +1,103 @@
+"""
+In-memory store for the communication rule files.
+
+Rule files are read on first access and then served from memory. Each
+file is re-checked (stat only, no read) at most once per `check_interval`
+seconds; if its mtime or size changed, the new contents are loaded and
+swapped in as a single immutable entry, so readers never see a
+half-updated file.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import hashlib
+import threading
+import time
+
+
+@dataclass(frozen=True)
+class RuleFile:
+    """A loaded rule file and the stat info it was loaded from."""
+
+    name: str
+    text: str
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+class ResourceStore:
+    """Serves `<name>.md` files from a directory out of memory."""
+
+    def __init__(self, directory: Path, pattern: str = "*.md", check_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.check_interval = check_interval
+        self._files: dict[str, RuleFile] = {}
+        self._checked_at: dict[str, float] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load every file matching the pattern into memory."""
+        for path in sorted(self.directory.glob(self.pattern)):
+            self._reload(path.stem)
+        self._loaded = True
+
+    def names(self) -> list[str]:
+        """Names (file stems) of all files, loading them if not done yet."""
+        if not self._loaded:
+            self.load()
+        return sorted(self._files)
+
+    def get(self, name: str) -> RuleFile:
+        """Return the current entry for `name`, reloading it if the file changed."""
+        entry = self._files.get(name)
+        now = time.monotonic()
+        if entry is not None and now - self._checked_at.get(name, 0.0) < self.check_interval:
+            return entry
+
+        path = self._path(name)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            if entry is None:
+                raise
+            # Keep serving the last good copy if the file disappears mid-edit
+            return entry
+
+        self._checked_at[name] = now
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+        return self._reload(name)
+
+    def read(self, name: str) -> str:
+        """Return the text of `name`."""
+        return self.get(name).text
+
+    def manifest(self) -> dict[str, dict]:
+        """Content hash and size for every file, keyed by name."""
+        result = {}
+        for name in self.names():
+            entry = self.get(name)
+            result[name] = {"sha256": entry.sha256, "size": entry.size}
+        return result
+
+    def _path(self, name: str) -> Path:
+        return self.directory / self.pattern.replace("*", name, 1)
+
+    def _reload(self, name: str) -> RuleFile:
+        path = self._path(name)
+        with self._lock:
+            stat = path.stat()
+            data = path.read_bytes()
+            entry = RuleFile(
+                name=name,
+                text=data.decode("utf-8"),
+                sha256=hashlib.sha256(data).hexdigest(),
+                size=len(data),
+                mtime_ns=stat.st_mtime_ns,
+            )
+            self._files[name] = entry
+            self._checked_at[name] = time.monotonic()
+        return entry
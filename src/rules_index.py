@@ -0,0 +1,177 @@
+"""
+Section-level keyword search over the rule files.
+
+Each rule file is split at its headings (with `split_sections`) into
+sections addressed as `comms://rules/{topic}/{section}`, where `section`
+is a slug of the heading. An inverted index maps every keyword to the
+sections it appears in, and `search` ranks sections with BM25, counting
+words in the heading twice (a query word with no exact match falls back
+to indexed words with the same first few letters). Only the matching
+sections are returned, so a client doesn't have to load whole rule files
+to find the relevant guideline.
+
+The index is built on first use and rebuilt whenever a rule file
+changes on disk (the `ResourceStore` content hashes are compared).
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import NamedTuple
+import math
+import re
+import threading
+
+from src.documents import split_sections
+from src.resource_store import ResourceStore
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by do for from how i if in is it its of on or so that the this to was what when "
+    "where which who why will with you your".split()
+)
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+# A query word with no exact match matches indexed words sharing its first
+# PREFIX_CHARS letters ("sarcastic" -> "sarcasm"), at PREFIX_WEIGHT of the score
+PREFIX_CHARS = 5
+PREFIX_WEIGHT = 0.5
+
+
+def keywords(text: str) -> list[str]:
+    """Lowercased words of `text` without stopwords, with plural -s stripped."""
+    words = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def slugify(title: str) -> str:
+    return _SLUG_RE.sub("-", title.lower()).strip("-") or "section"
+
+
+def _with_prefix(vocabulary: list[str], prefix: str) -> list[str]:
+    start = end = bisect_left(vocabulary, prefix)
+    while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+        end += 1
+    return vocabulary[start:end]
+
+
+@dataclass(frozen=True)
+class RuleSection:
+    """One heading-level section of a rule file."""
+
+    topic: str
+    slug: str
+    title: str
+    text: str
+
+    @property
+    def uri(self) -> str:
+        return f"comms://rules/{self.topic}/{self.slug}"
+
+
+class _Index(NamedTuple):
+    sections: list[RuleSection]
+    by_uri: dict[str, RuleSection]
+    postings: dict[str, list[tuple[int, int]]]  # keyword -> [(section, term frequency)]
+    lengths: list[int]  # keywords per section
+    vocabulary: list[str]  # sorted keywords, for prefix matches
+
+
+class RulesIndex:
+    """Sections of every rule file in a ResourceStore, with a keyword index over them."""
+
+    def __init__(self, store: ResourceStore):
+        self.store = store
+        self._version: tuple | None = None
+        self._index = _Index([], {}, {}, [], [])
+        self._lock = threading.Lock()
+
+    def sections(self) -> list[RuleSection]:
+        """All sections, in file and heading order."""
+        self._refresh()
+        return self._index.sections
+
+    def section(self, topic: str, slug: str) -> RuleSection | None:
+        """The section with this topic and slug, or None."""
+        self._refresh()
+        return self._index.by_uri.get(f"comms://rules/{topic}/{slug}")
+
+    def search(self, query: str, k: int = 5) -> list[tuple[float, RuleSection]]:
+        """
+        The `k` sections that best match `query`.
+
+        Args:
+            query: Free-text query
+            k: Number of sections to return
+
+        Returns:
+            (score, section) pairs, best first; sections with no matching keyword are left out
+        """
+        self._refresh()
+        sections, _, postings, lengths, vocabulary = self._index
+        if not sections:
+            return []
+        average_length = sum(lengths) / len(lengths)
+        scores: Counter[int] = Counter()
+        for word in set(keywords(query)):
+            if word in postings:
+                terms = [(word, 1.0)]
+            elif len(word) >= PREFIX_CHARS:
+                terms = [(term, PREFIX_WEIGHT) for term in _with_prefix(vocabulary, word[:PREFIX_CHARS])]
+            else:
+                continue
+            for term, weight in terms:
+                matches = postings.get(term, ())
+                idf = math.log(1 + (len(sections) - len(matches) + 0.5) / (len(matches) + 0.5))
+                for index, tf in matches:
+                    norm = _K1 * (1 - _B + _B * lengths[index] / average_length)
+                    scores[index] += weight * idf * tf * (_K1 + 1) / (tf + norm)
+        return [(round(score, 4), sections[index]) for index, score in scores.most_common(k)]
+
+    def _refresh(self) -> None:
+        version = tuple((name, self.store.get(name).sha256) for name in self.store.names())
+        if version == self._version:
+            return
+        with self._lock:
+            if version != self._version:
+                self._build(version)
+
+    def _build(self, version: tuple) -> None:
+        sections, by_uri, lengths = [], {}, []
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for name, _ in version:
+            text = self.store.read(name)
+            for part in split_sections(text):
+                body = text[part.start:part.end]
+                # A heading with nothing under it (e.g. the file's title) isn't a useful fragment
+                if len(body.strip().splitlines()) < 2:
+                    continue
+                slug = base = slugify(part.title)
+                number = 2
+                while f"comms://rules/{name}/{slug}" in by_uri:
+                    slug = f"{base}-{number}"
+                    number += 1
+                section = RuleSection(name, slug, part.title, body.strip())
+                index = len(sections)
+                sections.append(section)
+                by_uri[section.uri] = section
+
+                counts = Counter(keywords(body))
+                counts.update(keywords(part.title))  # heading words count twice
+                lengths.append(sum(counts.values()))
+                for word, tf in counts.items():
+                    postings.setdefault(word, []).append((index, tf))
+
+        # Swapped in as one object so concurrent searches see either the old or the new index
+        self._index = _Index(sections, by_uri, postings, lengths, sorted(postings))
+        self._version = version
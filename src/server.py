@@ -7,13 +7,113 @@ professionals in technical workplaces.
 
 from mcp.server.fastmcp import FastMCP
 from pathlib import Path
+from pydantic import BaseModel
+import functools
 import json
+import os
+import sys
+
+if __package__ in (None, ""):
+    # Running as a script (python src/server.py): make the `src` package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analysis import AnalysisCache
+from src.budget import Budget
+from src.cache import ResultCache
+from src.metrics import Metrics
+from src.resource_store import ResourceStore
+from src.templates import FrameworkRegistry, ResponseTemplate, Slot
+from src.workers import Workers
+
+# Startup is kept to registering tools and resources. Rule files, the locale
+# packs and the parsing modules (src.documents, src.phrases, src.threads,
+# src.tone) are loaded on first use.
 
 # Initialize MCP server
 mcp = FastMCP("Neurodivergent Communications")
 
-# Load resources
+# Rule files are read on first access, then served from memory and reloaded only when a file changes
 RESOURCES_DIR = Path(__file__).parent / "resources"
+rules = ResourceStore(RESOURCES_DIR)
+
+
+@functools.cache
+def locale_packs():
+    """Per-language vague phrases, safe openers and red flags (resources/<locale>/), each pack loaded on first use."""
+    from src.locales import LocalePacks
+    return LocalePacks(RESOURCES_DIR)
+
+
+@functools.cache
+def call_or_text_table():
+    """Urgency/complexity phrases and method rules for call_or_text, compiled on first use."""
+    from src.decisions import DecisionTable
+    return DecisionTable.from_file(RESOURCES_DIR / "call-or-text.json")
+
+
+@functools.cache
+def document_store():
+    """Documents scaffolded in chunked mode, so sections can be served on demand."""
+    from src.documents import DocumentStore
+    return DocumentStore()
+
+
+@functools.cache
+def rules_index():
+    """Heading-level sections of the rule files, with a keyword index for search_rules."""
+    from src.rules_index import RulesIndex
+    return RulesIndex(rules)
+
+
+@functools.cache
+def meeting_sessions():
+    """Live meeting sessions for open_meeting / append_meeting_notes / get_meeting_summary."""
+    from src.meetings import MeetingSessions
+    return MeetingSessions()
+
+
+@functools.cache
+def thread_sessions():
+    """Per-thread state for incremental catch_up_thread calls."""
+    from src.thread_sessions import ThreadSessions
+    return ThreadSessions()
+
+
+# Most drafts accepted by a single batch tool call
+MAX_BATCH_SIZE = 500
+
+# Most questions from a draft listed in a response
+MAX_LISTED_QUESTIONS = 20
+
+# How to get back an input field cut to fit max_tokens / max_bytes
+ECHOED_INPUT = "This is your own input echoed back - refer to what you sent"
+
+# Directories that file:// URI / path inputs may be read from (COMMS_FILE_ROOTS, os.pathsep-separated);
+# none unless set, since any argument that looks like a path - even one copied from a pasted message - is read
+FILE_ROOTS = [Path(root) for root in os.environ.get("COMMS_FILE_ROOTS", "").split(os.pathsep) if root]
+
+# Call counts, latency and payload sizes per tool/resource (COMMS_METRICS_LOG=path.jsonl to also log each call)
+metrics = Metrics(log_path=os.environ.get("COMMS_METRICS_LOG") or None)
+
+# Tools run in worker threads so one long call doesn't hold up other sessions,
+# and inputs over COMMS_PROCESS_THRESHOLD characters are parsed in a process pool
+workers = Workers(
+    max_threads=int(os.environ.get("COMMS_WORKER_THREADS", 8)),
+    max_processes=int(os.environ.get("COMMS_WORKER_PROCESSES", 2)),
+    process_threshold=int(os.environ.get("COMMS_PROCESS_THRESHOLD", 256 * 1024)),
+    timeout=float(os.environ.get("COMMS_TASK_TIMEOUT", 60)),
+)
+
+# Tool results keyed by tool name + arguments (set COMMS_CACHE_MAX_BYTES=0 to disable)
+result_cache = ResultCache(max_bytes=int(os.environ.get("COMMS_CACHE_MAX_BYTES", 32 * 1024 * 1024)))
+
+# Constant framework sections of tool responses, readable once as resources so
+# tools called with framework_ref=True can return a link to them instead
+frameworks = FrameworkRegistry("comms://frameworks/")
+
+# Tokens, sentences, phrase hits, red flags and metrics of recently seen texts,
+# shared by every tool so chained calls on one draft analyze it once
+analysis_cache = AnalysisCache(max_bytes=int(os.environ.get("COMMS_ANALYSIS_CACHE_MAX_BYTES", 32 * 1024 * 1024)))
 
 
 # ============================================================================
@@ -21,46 +121,167 @@ RESOURCES_DIR = Path(__file__).parent / "resources"
 # ============================================================================
 
 @mcp.resource("comms://rules/message-clarity")
+@metrics.instrument("resource")
 def get_message_clarity_rules() -> str:
     """Communication clarity guidelines and patterns"""
-    rules_path = RESOURCES_DIR / "message-clarity.md"
-    return rules_path.read_text()
+    return rules.read("message-clarity")
 
 
 @mcp.resource("comms://rules/context-interpretation")
+@metrics.instrument("resource")
 def get_context_interpretation_rules() -> str:
     """Guidelines for interpreting implicit context and subtext in messages"""
-    rules_path = RESOURCES_DIR / "context-interpretation.md"
-    return rules_path.read_text()
+    return rules.read("context-interpretation")
 
 
 @mcp.resource("comms://rules/tone-calibration")
+@metrics.instrument("resource")
 def get_tone_calibration_rules() -> str:
     """Guidelines for assessing and calibrating message tone"""
-    rules_path = RESOURCES_DIR / "tone-calibration.md"
-    return rules_path.read_text()
+    return rules.read("tone-calibration")
 
 
 @mcp.resource("comms://rules/meeting-structure")
+@metrics.instrument("resource")
 def get_meeting_structure_rules() -> str:
     """Guidelines for preparing, participating in, and following up on meetings"""
-    rules_path = RESOURCES_DIR / "meeting-structure.md"
-    return rules_path.read_text()
+    return rules.read("meeting-structure")
 
 
 @mcp.resource("comms://rules/document-scaffolding")
+@metrics.instrument("resource")
 def get_document_scaffolding_rules() -> str:
     """Guidelines for scaffolding and previewing complex documents"""
-    rules_path = RESOURCES_DIR / "document-scaffolding.md"
-    return rules_path.read_text()
+    return rules.read("document-scaffolding")
+
+
+@mcp.resource("comms://rules/manifest", mime_type="application/json")
+@metrics.instrument("resource")
+def get_rules_manifest() -> str:
+    """Content hash and size of each rule file, so clients can skip re-fetching unchanged rules"""
+    return json.dumps({
+        name: {"uri": f"comms://rules/{name}", **info}
+        for name, info in rules.manifest().items()
+    }, indent=2)
+
+
+@mcp.resource("comms://rules/{topic}/{section}")
+@metrics.instrument("resource")
+def get_rule_section(topic: str, section: str) -> str:
+    """One heading-level section of a rule file (find them with search_rules)"""
+    found = rules_index().section(topic, section)
+    if found is None:
+        raise ValueError(f"Unknown rule section '{topic}/{section}' - use search_rules to find sections")
+    return found.text
+
+
+@mcp.resource("comms://frameworks/manifest", mime_type="application/json")
+@metrics.instrument("resource")
+def get_frameworks_manifest() -> str:
+    """URI (with content hash) and size of each tool's response framework, for calls with framework_ref=True"""
+    return json.dumps(frameworks.manifest(), indent=2)
+
+
+@mcp.resource("comms://frameworks/{name}@{version}", mime_type="application/json")
+@metrics.instrument("resource")
+def get_framework(name: str, version: str) -> str:
+    """The constant guidance sections of one tool's responses, linked from responses instead when framework_ref=True"""
+    return frameworks.read(name, version)
+
+
+@mcp.resource("comms://doc/{document_id}/section/{n}")
+@metrics.instrument("resource")
+def get_document_section(document_id: str, n: int) -> str:
+    """One section of a document previously scaffolded with chunked=True"""
+    document = document_store().get(document_id)
+    if document is None:
+        raise ValueError(f"Unknown document '{document_id}' - run scaffold_document with chunked=True again")
+    if not 0 <= n < len(document.sections):
+        raise ValueError(f"Document '{document_id}' has sections 0-{len(document.sections) - 1}, not {n}")
+    return document.section_text(n)
+
+
+@mcp.resource("comms://cache/stats", mime_type="application/json")
+@metrics.instrument("resource")
+def get_cache_stats() -> str:
+    """Hit/miss counters and size of the tool result cache and the shared text-analysis cache"""
+    return json.dumps({**result_cache.stats(), "analysis": analysis_cache.stats()}, indent=2)
+
+
+@mcp.resource("comms://locales", mime_type="application/json")
+@metrics.instrument("resource")
+def get_locales() -> str:
+    """Languages with a locale pack, the default one, and the packs loaded so far"""
+    packs = locale_packs()
+    return json.dumps({"default": packs.default, "available": packs.locales(), "loaded": packs.loaded()}, indent=2)
+
+
+@mcp.resource("comms://metrics", mime_type="application/json")
+def get_metrics() -> str:
+    """Call counts, latency percentiles and payload sizes for each tool and resource"""
+    return json.dumps(metrics.snapshot(), indent=2)
 
 
 # ============================================================================
 # TOOLS - Functions the LLM can execute
 # ============================================================================
 
+CHECK_MESSAGE_RESPONSE = ResponseTemplate({
+    "input": {
+        "draft": Slot("draft"),
+        "recipient": Slot("recipient"),
+        "context": Slot("context")
+    },
+    "draft_signals": Slot("draft_signals"),
+    "analysis_framework": {
+        "clarity_check": {
+            "questions": [
+                "Is the ask/point clear?",
+                "Is context sufficient?",
+                "Are there ambiguous terms?",
+                "Would recipient know what to do next?"
+            ]
+        },
+        "tone_assessment": {
+            "questions": [
+                "Professional level appropriate?",
+                "Emotional tone clear?",
+                "Any unintended subtext?",
+                "Matches relationship with recipient?"
+            ]
+        },
+        "structure": {
+            "questions": [
+                "Key info upfront?",
+                "Organized logically?",
+                "Appropriate length?",
+                "Easy to skim?"
+            ]
+        },
+        "completeness": {
+            "questions": [
+                "All necessary context included?",
+                "Questions answered proactively?",
+                "Action items clear?",
+                "Timeline specified if needed?"
+            ]
+        }
+    },
+    "output_format": {
+        "strengths": "List what works well",
+        "issues": "List what needs fixing (be specific)",
+        "revised_version": "Show improved version if issues found",
+        "quick_fix": "One-liner summary of main change needed"
+    }
+}, elide={"draft": ECHOED_INPUT, "context": ECHOED_INPUT, "draft_signals": None})
+frameworks.publish("check_message", CHECK_MESSAGE_RESPONSE)
+
+
 @mcp.tool()
-def check_message(draft: str, recipient: str = "", context: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def check_message(draft: str, recipient: str = "", context: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Analyze a message draft before sending.
 
@@ -70,70 +291,219 @@ def check_message(draft: str, recipient: str = "", context: str = "") -> str:
     - Structure (key info upfront, organized logically, appropriate length)
     - Completeness (all necessary context, action items clear, timeline specified)
 
+    Detected locally (shared with check_tone, decode_message and ask_clarity
+    on the same text): length and sentence shape, questions asked, vague
+    phrases and the number of tone red flags.
+
     Args:
         draft: The message text to analyze
         recipient: Who will receive this message (optional, helps with tone assessment)
         context: Additional context about the situation (optional)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured analysis with strengths, issues, revised version, and quick fix
     """
 
-    # Build the analysis prompt
-    analysis_sections = {
+    budget = Budget(max_tokens, max_bytes)
+    return CHECK_MESSAGE_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        **_check_message_input(draft, recipient, context),
+        draft_signals=_draft_signals(draft),
+    )
+
+
+def _check_message_input(draft: str, recipient: str, context: str) -> dict:
+    return {
         "draft": draft,
         "recipient": recipient if recipient else "Not specified",
         "context": context if context else "Not provided"
     }
 
-    # Return structured format for LLM to fill in
-    return json.dumps({
-        "input": analysis_sections,
-        "analysis_framework": {
-            "clarity_check": {
-                "questions": [
-                    "Is the ask/point clear?",
-                    "Is context sufficient?",
-                    "Are there ambiguous terms?",
-                    "Would recipient know what to do next?"
-                ]
-            },
-            "tone_assessment": {
-                "questions": [
-                    "Professional level appropriate?",
-                    "Emotional tone clear?",
-                    "Any unintended subtext?",
-                    "Matches relationship with recipient?"
-                ]
-            },
-            "structure": {
-                "questions": [
-                    "Key info upfront?",
-                    "Organized logically?",
-                    "Appropriate length?",
-                    "Easy to skim?"
-                ]
-            },
-            "completeness": {
-                "questions": [
-                    "All necessary context included?",
-                    "Questions answered proactively?",
-                    "Action items clear?",
-                    "Timeline specified if needed?"
-                ]
+
+class MessageDraft(BaseModel):
+    """One draft in a check_message_batch call."""
+
+    draft: str
+    recipient: str = ""
+    context: str = ""
+
+
+CHECK_MESSAGE_BATCH_RESPONSE = ResponseTemplate({
+    "item_count": Slot("item_count"),
+    **CHECK_MESSAGE_RESPONSE.framework,
+    "items": Slot("items")
+}, elide={"items": "Split the drafts into smaller batches"})
+frameworks.publish("check_message", CHECK_MESSAGE_BATCH_RESPONSE)
+
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def check_message_batch(drafts: list[MessageDraft], framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Analyze many message drafts in one call (e.g. a queue of announcements).
+
+    Same checks as check_message. The analysis framework is included once
+    and applies to every item; each item carries its own input.
+
+    Args:
+        drafts: Drafts to analyze, each with its own optional recipient and context
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        Shared analysis framework plus one entry per draft
+    """
+
+    budget = Budget(max_tokens, max_bytes)
+    _check_batch_size(drafts)
+    return CHECK_MESSAGE_BATCH_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        item_count=len(drafts),
+        items=[
+            {
+                "index": i,
+                "input": _check_message_input(item.draft, item.recipient, item.context),
+                "draft_signals": _draft_signals(item.draft)
             }
-        },
-        "output_format": {
-            "strengths": "List what works well",
-            "issues": "List what needs fixing (be specific)",
-            "revised_version": "Show improved version if issues found",
-            "quick_fix": "One-liner summary of main change needed"
+            for i, item in enumerate(drafts)
+        ],
+    )
+
+
+def _file_source(value: str):
+    """The FileSource a text argument refers to, or None for inline text."""
+    from src.sources import looks_like_file, open_source
+    return open_source(value, FILE_ROOTS) if looks_like_file(value) else None
+
+
+def _is_file_argument(value: str) -> bool:
+    # Results for file inputs aren't cached: the file can change under the same path
+    from src.sources import looks_like_file
+    return looks_like_file(value)
+
+
+def _reference_day(value: str) -> str:
+    # Without a date argument, "Friday" and "EOD" resolve against today, so cached results last one day
+    from datetime import date
+    return value or date.today().isoformat()
+
+
+def _store_document(text: str):
+    """Add `text` to the document store; return it with its section map."""
+    from src.documents import content_hash, split_sections
+
+    document = document_store().add(text, split=functools.partial(workers.run, split_sections, size=len(text)))
+    structure = [
+        {
+            "section": section.index,
+            "title": section.title,
+            "level": section.level,
+            "characters": section.end - section.start,
+            "sha256": content_hash(document.section_text(section.index)),
+            "uri": f"comms://doc/{document.doc_id}/section/{section.index}"
         }
-    }, indent=2)
+        for section in document.sections
+    ]
+    return document, structure
+
+
+def _text_metrics(text: str, by_section: bool = True, all_sections: bool = False) -> dict:
+    """
+    Readability and structure metrics for `text`, shared through the analysis cache.
+
+    Large inputs are measured in the process pool.
+
+    Args:
+        text: Text to measure
+        by_section: Include per-section difficulty
+        all_sections: List every section, not just the first MAX_SECTIONS
+    """
+    from src.text_metrics import MAX_SECTIONS, analyze, analyze_document
+
+    analysis = analysis_cache.get(text)
+    if not by_section:
+        return analysis.stage("metrics", lambda a: workers.run(analyze, a.text, size=len(a.text)))
+    metrics = analysis.stage("document_metrics", lambda a: workers.run(analyze_document, a.text, None, size=len(a.text)))
+    # A copy: the cached result is shared
+    return {**metrics, "sections": metrics["sections"] if all_sections else metrics["sections"][:MAX_SECTIONS]}
+
+
+def _language(text: str, language: str = ""):
+    """
+    The locale pack for `text`, and which language it is for and why.
+
+    Args:
+        text: Text the pack is for
+        language: Locale to use instead of detecting it from the text (optional)
+
+    Returns:
+        (pack, {"locale", "name", "confidence", "source"})
+    """
+    packs = locale_packs()
+    if language:
+        pack = packs.get(language)
+        detected = {"locale": pack.locale, "confidence": 1.0, "source": "argument"}
+    else:
+        detected = analysis_cache.get(text).stage("language", lambda a: packs.detector().detect(a.text))
+        pack = packs.get(detected["locale"])
+    return pack, {"locale": pack.locale, "name": pack.name, "confidence": detected["confidence"], "source": detected["source"]}
+
+
+def _draft_signals(text: str) -> dict:
+    """Locally detected language, shape, vague phrases, questions and red flags of a draft."""
+    analysis = analysis_cache.get(text)
+    pack, language = _language(text)
+    return {
+        "language": language["locale"],
+        "shape": analysis.profile,
+        "questions": analysis.questions[:MAX_LISTED_QUESTIONS],
+        "vague_phrases": analysis.phrase_hits(pack.vague_phrases),
+        "red_flag_count": analysis.red_flags(pack.red_flags)["total"],
+    }
+
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f"Batch has {len(items)} items; the limit is {MAX_BATCH_SIZE} - split it into smaller batches")
+
+
+DECODE_MESSAGE_RESPONSE = ResponseTemplate({
+    "input": {
+        "message": Slot("message"),
+        "sender": Slot("sender"),
+        "relationship": Slot("relationship")
+    },
+    "decode_framework": {
+        "explicit_ask": "What they literally said they want",
+        "implicit_ask": "What they actually want (read between the lines)",
+        "actual_deadline": "Real timeline (decode vague phrases like 'when you get a chance')",
+        "success_criteria": "What does 'done' look like? What are they trying to unblock?",
+        "expected_response": "Do they want: action, information, acknowledgment, or something else?",
+        "communication_pattern": "Identify pattern (e.g., 'polite urgent request', 'checking in', 'soft deadline')"
+    },
+    "language": Slot("language"),
+    "vague_phrases_found": Slot("vague_phrases_found")
+}, elide={"message": ECHOED_INPUT, "vague_phrases_found": None})
+frameworks.publish("decode_message", DECODE_MESSAGE_RESPONSE)
 
 
 @mcp.tool()
-def decode_message(message: str, sender: str = "", relationship: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def decode_message(message: str, sender: str = "", relationship: str = "", language: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Decode confusing or vague messages to extract actual meaning.
 
@@ -145,43 +515,69 @@ def decode_message(message: str, sender: str = "", relationship: str = "") -> st
     - Expected response (do they want action, info, or just acknowledgment?)
     - Common pattern (identifies typical workplace communication patterns)
 
+    Vague phrases from the phrase dictionary of the message's language
+    (resources/<locale>/vague-phrases.json) that appear in the message are
+    returned with their usual meaning and character offsets. The language
+    is detected locally unless given.
+
     Args:
         message: The confusing message to decode
         sender: Who sent it (e.g., "manager", "peer", "direct report")
         relationship: Nature of relationship (optional, helps with context)
+        language: Locale of the message, e.g. "en", "es", "fr", "de" (optional, detected if not given)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured breakdown of explicit vs implicit meaning
     """
 
-    analysis_data = {
-        "message": message,
-        "sender": sender if sender else "Not specified",
-        "relationship": relationship if relationship else "Not specified"
-    }
-
-    return json.dumps({
-        "input": analysis_data,
-        "decode_framework": {
-            "explicit_ask": "What they literally said they want",
-            "implicit_ask": "What they actually want (read between the lines)",
-            "actual_deadline": "Real timeline (decode vague phrases like 'when you get a chance')",
-            "success_criteria": "What does 'done' look like? What are they trying to unblock?",
-            "expected_response": "Do they want: action, information, acknowledgment, or something else?",
-            "communication_pattern": "Identify pattern (e.g., 'polite urgent request', 'checking in', 'soft deadline')"
-        },
-        "common_vague_phrases": {
-            "when you get a chance": "Usually means within 1-2 days unless stated otherwise",
-            "no rush": "Often still has implicit deadline - check context",
-            "thoughts?": "Usually wants specific feedback or approval to proceed",
-            "can you take a look?": "Wants review/feedback, possibly approval",
-            "just checking in": "Either needs status update or gentle deadline reminder"
-        }
-    }, indent=2)
+    budget = Budget(max_tokens, max_bytes)
+    pack, detected_language = _language(message, language)
+    return DECODE_MESSAGE_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        message=message,
+        sender=sender if sender else "Not specified",
+        relationship=relationship if relationship else "Not specified",
+        language=detected_language,
+        vague_phrases_found=analysis_cache.get(message).phrase_hits(pack.vague_phrases),
+    )
+
+
+PREP_MEETING_RESPONSE = ResponseTemplate({
+    "input": {
+        "meeting_title": Slot("meeting_title"),
+        "your_role": Slot("your_role"),
+        "agenda": Slot("agenda")
+    },
+    "preparation_framework": {
+        "your_contribution": "What you'll likely need to speak about based on your role",
+        "talking_points": "2-3 concise points to communicate (structure: context → options → ask)",
+        "questions_to_ask": "What you should clarify or ask others",
+        "your_asks": "What you need from others in this meeting",
+        "blockers_to_raise": "Issues that might block progress",
+        "decoded_agenda": "What each agenda item actually means / what's expected"
+    },
+    "meeting_structure_tips": {
+        "opening": "State your point upfront if asked to speak",
+        "middle": "Provide necessary context only",
+        "closing": "End with clear question or next step",
+        "fallback": "If unsure when to speak, ask 'Would it help if I shared context on X?'"
+    },
+    "detected_in_agenda": Slot("detected_in_agenda")
+}, elide={"agenda": ECHOED_INPUT, "detected_in_agenda": None})
+frameworks.publish("prep_meeting", PREP_MEETING_RESPONSE)
 
 
 @mcp.tool()
-def prep_meeting(title: str, your_role: str, agenda: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize(vary=lambda meeting_date, **_: _reference_day(meeting_date))
+def prep_meeting(title: str, your_role: str, agenda: str = "", meeting_date: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Prepare for an upcoming meeting.
 
@@ -193,42 +589,100 @@ def prep_meeting(title: str, your_role: str, agenda: str = "") -> str:
     - Potential blockers to raise
     - Decoded agenda items (what each item really means)
 
+    Each agenda line is decoded locally into a pre-filled candidate: its
+    kind (decision, review, planning, ...), what that usually expects of
+    you, and the owner, due date and time slot where the agenda says.
+
     Args:
         title: Meeting title/subject
         your_role: Your role in the meeting (e.g., "tech lead", "IC contributor", "project owner")
         agenda: Meeting agenda if available (optional)
+        meeting_date: Date of the meeting as YYYY-MM-DD, for resolving "Friday",
+            "next week" etc. in the agenda (optional, default today)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured meeting preparation guide
     """
 
-    prep_data = {
-        "meeting_title": title,
-        "your_role": your_role,
-        "agenda": agenda if agenda else "No agenda provided"
+    from datetime import date
+
+    from src.actions import decode_agenda
+
+    budget = Budget(max_tokens, max_bytes)
+    reference = date.fromisoformat(meeting_date) if meeting_date else None
+    return PREP_MEETING_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        meeting_title=title,
+        your_role=your_role,
+        agenda=agenda if agenda else "No agenda provided",
+        detected_in_agenda=decode_agenda(agenda, reference) if agenda else "No agenda provided",
+    )
+
+
+SCAFFOLDING_FRAMEWORK = {
+    "core_purpose": "What this document is trying to accomplish (1 sentence)",
+    "key_entities": "Main concepts, systems, or terms with brief definitions",
+    "structure_map": {
+        "description": "List sections and what each covers",
+        "format": "Section name → What it contains"
+    },
+    "required_action": "What the reader needs to do after reading",
+    "prerequisite_knowledge": "What you need to know before this makes sense",
+    "reading_strategy": {
+        "start_with": "Which section to read first",
+        "focus_on": "Key information to prioritize",
+        "skip_if_needed": "Less critical parts you can skim",
+        "watch_for": "Important details not to miss"
     }
-
-    return json.dumps({
-        "input": prep_data,
-        "preparation_framework": {
-            "your_contribution": "What you'll likely need to speak about based on your role",
-            "talking_points": "2-3 concise points to communicate (structure: context → options → ask)",
-            "questions_to_ask": "What you should clarify or ask others",
-            "your_asks": "What you need from others in this meeting",
-            "blockers_to_raise": "Issues that might block progress",
-            "decoded_agenda": "What each agenda item actually means / what's expected"
-        },
-        "meeting_structure_tips": {
-            "opening": "State your point upfront if asked to speak",
-            "middle": "Provide necessary context only",
-            "closing": "End with clear question or next step",
-            "fallback": "If unsure when to speak, ask 'Would it help if I shared context on X?'"
-        }
-    }, indent=2)
+}
+
+SCAFFOLD_DOCUMENT_RESPONSE = ResponseTemplate({
+    "input": {
+        "document_title": Slot("document_title"),
+        "content_length": Slot("content_length")
+    },
+    "text_metrics": Slot("text_metrics"),
+    "reading_plan": Slot("reading_plan"),
+    "scaffolding_framework": SCAFFOLDING_FRAMEWORK,
+    "document_content": Slot("document_content")
+}, elide={
+    "document_content": ECHOED_INPUT,
+    "text_metrics": "Call again with chunked=True for the metrics with a section map instead of the text",
+})
+frameworks.publish("scaffold_document", SCAFFOLD_DOCUMENT_RESPONSE)
+
+SCAFFOLD_DOCUMENT_CHUNKED_RESPONSE = ResponseTemplate({
+    "input": {
+        "document_title": Slot("document_title"),
+        "source": Slot("source"),
+        "content_length": Slot("content_length"),
+        "document_id": Slot("document_id"),
+        "section_count": Slot("section_count")
+    },
+    "text_metrics": Slot("text_metrics"),
+    "reading_plan": Slot("reading_plan"),
+    "scaffolding_framework": SCAFFOLDING_FRAMEWORK,
+    "document_structure": Slot("document_structure"),
+    "reading_sections": "Section text is not included inline - read each section's uri when you need it"
+}, elide={
+    "document_structure": "Section n of the document is at comms://doc/{document_id}/section/{n}",
+    "text_metrics": None,
+})
+frameworks.publish("scaffold_document_chunked", SCAFFOLD_DOCUMENT_CHUNKED_RESPONSE)
 
 
 @mcp.tool()
-def scaffold_document(document_content: str, document_title: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+# chunked docs are cached by the DocumentStore
+@result_cache.memoize(bypass=lambda document_content, chunked, **_: chunked or _is_file_argument(document_content))
+def scaffold_document(document_content: str, document_title: str = "", chunked: bool = False, framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Preview document structure before deep reading.
 
@@ -245,43 +699,102 @@ def scaffold_document(document_content: str, document_title: str = "") -> str:
     - Prerequisite knowledge needed
     - Reading strategy for this specific document
 
+    Measured from the text: word and sentence counts, readability (grade
+    level), reading time, how much is lists/tables/code, and the difficulty
+    of each section, with a reading plan built from them.
+
     Args:
-        document_content: The document text to analyze
+        document_content: The document text to analyze, or the file:// URI or
+            absolute path of a local file to read it from
         document_title: Document title if available (optional)
+        chunked: Return a section map instead of the full text, for long documents.
+            Each section is then read on demand from comms://doc/{document_id}/section/{n}.
+            Always the case for documents read from a file.
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured document preview with reading strategy
     """
-
-    scaffold_data = {
-        "document_title": document_title if document_title else "Untitled document",
-        "content_length": f"{len(document_content)} characters"
-    }
-
-    return json.dumps({
-        "input": scaffold_data,
-        "scaffolding_framework": {
-            "core_purpose": "What this document is trying to accomplish (1 sentence)",
-            "key_entities": "Main concepts, systems, or terms with brief definitions",
-            "structure_map": {
-                "description": "List sections and what each covers",
-                "format": "Section name → What it contains"
-            },
-            "required_action": "What the reader needs to do after reading",
-            "prerequisite_knowledge": "What you need to know before this makes sense",
-            "reading_strategy": {
-                "start_with": "Which section to read first",
-                "focus_on": "Key information to prioritize",
-                "skip_if_needed": "Less critical parts you can skim",
-                "watch_for": "Important details not to miss"
-            }
+    from src.text_metrics import reading_plan
+
+    budget = Budget(max_tokens, max_bytes)
+
+    source = _file_source(document_content)
+    if chunked or source is not None:
+        text = source.read_text() if source else document_content
+        document, structure = _store_document(text)
+        text_metrics = _text_metrics(text, all_sections=True)
+        # Per-section difficulty goes into the section map instead of a second list
+        for entry, section_metrics in zip(structure, text_metrics.pop("sections")):
+            entry.update({key: section_metrics[key] for key in ("words", "reading_ease", "difficulty", "reading_time_minutes")})
+        return SCAFFOLD_DOCUMENT_CHUNKED_RESPONSE.render(
+            budget=budget,
+            framework_ref=framework_ref,
+            document_title=document_title if document_title else "Untitled document",
+            source=source.uri if source else "inline",
+            content_length=f"{len(text)} characters",
+            document_id=document.doc_id,
+            section_count=len(document.sections),
+            text_metrics=text_metrics,
+            reading_plan=reading_plan(text_metrics),
+            document_structure=structure,
+        )
+
+    text_metrics = _text_metrics(document_content)
+    return SCAFFOLD_DOCUMENT_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        document_title=document_title if document_title else "Untitled document",
+        content_length=f"{len(document_content)} characters",
+        text_metrics=text_metrics,
+        reading_plan=reading_plan(text_metrics),
+        document_content=document_content,
+    )
+
+
+CHECK_TONE_RESPONSE = ResponseTemplate({
+    "input": {
+        "message": Slot("message"),
+        "recipient": Slot("recipient"),
+        "relationship": Slot("relationship")
+    },
+    "tone_assessment_framework": {
+        "professional_level": {
+            "current": "Assess formality (formal/standard/casual)",
+            "appropriate": "Should it be at this level for this recipient?"
         },
-        "document_content": document_content
-    }, indent=2)
+        "emotional_tone": {
+            "perceived_emotion": "What emotion does this convey?",
+            "intended_emotion": "What did you intend?"
+        },
+        "potential_misinterpretations": {
+            "could_sound_rude": "Check if direct language might seem rude",
+            "could_sound_defensive": "Check if explanation sounds defensive",
+            "could_sound_dismissive": "Check if brevity might seem dismissive"
+        },
+        "relationship_match": "Is tone appropriate for your relationship with recipient?"
+    },
+    "red_flags_to_check": {
+        "all_caps": "ALL CAPS (except acronyms)",
+        "multiple_exclamation": "Multiple !!!",
+        "sarcasm": "Sarcastic language",
+        "unintended_curtness": "Accidentally curt/abrupt"
+    },
+    "language": Slot("language"),
+    "detected_red_flags": Slot("detected_red_flags")
+}, elide={"message": ECHOED_INPUT, "detected_red_flags": None})
+frameworks.publish("check_tone", CHECK_TONE_RESPONSE)
 
 
 @mcp.tool()
-def check_tone(message: str, recipient: str = "", relationship: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def check_tone(message: str, recipient: str = "", relationship: str = "", language: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Validate message tone and check if it might be misinterpreted.
 
@@ -297,50 +810,140 @@ def check_tone(message: str, recipient: str = "", relationship: str = "") -> str
     - Missing necessary context that makes it seem abrupt
     - Not following professional norms
 
+    Red flags (ALL CAPS, !!!, sarcastic phrases, curt one-word sentences)
+    are detected locally, with the phrases of the message's language, and
+    returned with their character offsets.
+
     Args:
         message: The message text to check
         recipient: Who will receive this (optional, helps with assessment)
         relationship: Your relationship with recipient (e.g., "manager", "peer", "direct report")
+        language: Locale of the message, e.g. "en", "es", "fr", "de" (optional, detected if not given)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Tone assessment with flags for potential issues
     """
 
-    tone_data = {
+    budget = Budget(max_tokens, max_bytes)
+    pack, detected_language = _language(message, language)
+    return CHECK_TONE_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        **_check_tone_input(message, recipient, relationship),
+        language=detected_language,
+        detected_red_flags=analysis_cache.get(message).red_flags(pack.red_flags),
+    )
+
+
+def _check_tone_input(message: str, recipient: str, relationship: str) -> dict:
+    return {
         "message": message,
         "recipient": recipient if recipient else "Not specified",
         "relationship": relationship if relationship else "Not specified"
     }
 
-    return json.dumps({
-        "input": tone_data,
-        "tone_assessment_framework": {
-            "professional_level": {
-                "current": "Assess formality (formal/standard/casual)",
-                "appropriate": "Should it be at this level for this recipient?"
-            },
-            "emotional_tone": {
-                "perceived_emotion": "What emotion does this convey?",
-                "intended_emotion": "What did you intend?"
-            },
-            "potential_misinterpretations": {
-                "could_sound_rude": "Check if direct language might seem rude",
-                "could_sound_defensive": "Check if explanation sounds defensive",
-                "could_sound_dismissive": "Check if brevity might seem dismissive"
-            },
-            "relationship_match": "Is tone appropriate for your relationship with recipient?"
+
+class ToneCheck(BaseModel):
+    """One message in a check_tone_batch call."""
+
+    message: str
+    recipient: str = ""
+    relationship: str = ""
+    language: str = ""
+
+
+CHECK_TONE_BATCH_RESPONSE = ResponseTemplate({
+    "item_count": Slot("item_count"),
+    **CHECK_TONE_RESPONSE.framework,
+    "items": Slot("items")
+}, elide={"items": "Split the messages into smaller batches"})
+frameworks.publish("check_tone", CHECK_TONE_BATCH_RESPONSE)
+
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def check_tone_batch(messages: list[ToneCheck], framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Check the tone of many messages in one call.
+
+    Same assessment as check_tone. The tone framework and red flags are
+    included once and apply to every item; each item carries its own input.
+
+    Args:
+        messages: Messages to check, each with its own optional recipient, relationship
+            and language (detected if not given)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        Shared tone assessment framework plus one entry per message
+    """
+
+    budget = Budget(max_tokens, max_bytes)
+    _check_batch_size(messages)
+    return CHECK_TONE_BATCH_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        item_count=len(messages),
+        items=[_check_tone_item(i, item) for i, item in enumerate(messages)],
+    )
+
+
+def _check_tone_item(index: int, item: ToneCheck) -> dict:
+    pack, language = _language(item.message, item.language)
+    return {
+        "index": index,
+        "input": _check_tone_input(item.message, item.recipient, item.relationship),
+        "language": language,
+        "detected_red_flags": analysis_cache.get(item.message).red_flags(pack.red_flags)
+    }
+
+
+CALL_OR_TEXT_RESPONSE = ResponseTemplate({
+    "input": {
+        "situation": Slot("situation"),
+        "urgency": Slot("urgency"),
+        "complexity": Slot("complexity")
+    },
+    "recommendation": Slot("recommendation"),
+    "decision_framework": {
+        "urgency_assessment": {
+            "immediate": "Call/video - needs resolution now",
+            "today": "Call or detailed message - needs attention today",
+            "this_week": "Message likely fine - can be async",
+            "no_deadline": "Message - gives them time to process"
+        },
+        "complexity_assessment": {
+            "needs_discussion": "Call/video - multiple decision points",
+            "needs_clarification": "Quick call or video - faster than async",
+            "straightforward": "Message - clear enough for async",
+            "yes_no_question": "Message - simple response needed"
         },
-        "red_flags_to_check": {
-            "all_caps": "ALL CAPS (except acronyms)",
-            "multiple_exclamation": "Multiple !!!",
-            "sarcasm": "Sarcastic language",
-            "unintended_curtness": "Accidentally curt/abrupt"
+        "recommendation": {
+            "method": "call | text | video",
+            "reasoning": "Why this method is best for this situation",
+            "alternative": "If primary method doesn't work, try this"
         }
-    }, indent=2)
+    }
+}, elide={"situation": ECHOED_INPUT})
+frameworks.publish("call_or_text", CALL_OR_TEXT_RESPONSE)
 
 
 @mcp.tool()
-def call_or_text(situation: str, urgency: str = "", complexity: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def call_or_text(situation: str, urgency: str = "", complexity: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Decide communication method - should you call or send a message?
 
@@ -351,47 +954,70 @@ def call_or_text(situation: str, urgency: str = "", complexity: str = "") -> str
     - Your preference (what works better for you?)
     - Their likely preference (what's their communication style?)
 
+    A recommendation is made locally from a decision table
+    (resources/call-or-text.json): urgency and complexity are classified
+    from the arguments, or from the situation where they say nothing, and
+    mapped to a method with reasoning, an alternative and a confidence
+    score. When confidence is low it is marked for review against the
+    decision framework.
+
     Args:
         situation: Description of what you need to communicate
         urgency: How urgent is this? (optional)
         complexity: How complex is the topic? (optional)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Recommendation (call/text/video) with clear reasoning
     """
 
-    decision_data = {
-        "situation": situation,
-        "urgency": urgency if urgency else "Not specified",
-        "complexity": complexity if complexity else "Not specified"
+    budget = Budget(max_tokens, max_bytes)
+    return CALL_OR_TEXT_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        situation=situation,
+        urgency=urgency if urgency else "Not specified",
+        complexity=complexity if complexity else "Not specified",
+        recommendation=call_or_text_table().decide(
+            situation, urgency, complexity, folded_situation=analysis_cache.get(situation).normalized
+        ),
+    )
+
+
+SYNTHESIZE_THOUGHTS_RESPONSE = ResponseTemplate({
+    "input": {
+        "brain_dump": Slot("brain_dump"),
+        "word_count": Slot("word_count")
+    },
+    "text_metrics": Slot("text_metrics"),
+    "synthesis_framework": {
+        "core_message": "Distill to 1-2 sentence essence",
+        "key_themes": "Identify main themes from the details",
+        "logical_structure": {
+            "suggested_flow": "Best order to present these ideas",
+            "groupings": "Which points belong together"
+        },
+        "concise_version": "3-4 sentences hitting the key points",
+        "full_version": "Complete message with all important details organized"
+    },
+    "bottom_up_process": {
+        "details_provided": "The Lego pieces (your brain dump)",
+        "structure_identified": "How the pieces fit together",
+        "final_built": "The finished structure"
     }
-
-    return json.dumps({
-        "input": decision_data,
-        "decision_framework": {
-            "urgency_assessment": {
-                "immediate": "Call/video - needs resolution now",
-                "today": "Call or detailed message - needs attention today",
-                "this_week": "Message likely fine - can be async",
-                "no_deadline": "Message - gives them time to process"
-            },
-            "complexity_assessment": {
-                "needs_discussion": "Call/video - multiple decision points",
-                "needs_clarification": "Quick call or video - faster than async",
-                "straightforward": "Message - clear enough for async",
-                "yes_no_question": "Message - simple response needed"
-            },
-            "recommendation": {
-                "method": "call | text | video",
-                "reasoning": "Why this method is best for this situation",
-                "alternative": "If primary method doesn't work, try this"
-            }
-        }
-    }, indent=2)
+}, elide={"brain_dump": ECHOED_INPUT, "text_metrics": None})
+frameworks.publish("synthesize_thoughts", SYNTHESIZE_THOUGHTS_RESPONSE)
 
 
 @mcp.tool()
-def synthesize_thoughts(brain_dump: str) -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def synthesize_thoughts(brain_dump: str, framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Organize scattered thoughts into clear message.
 
@@ -407,39 +1033,102 @@ def synthesize_thoughts(brain_dump: str) -> str:
 
     Args:
         brain_dump: Unstructured thoughts to organize
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured message with both concise and full versions
     """
 
-    return json.dumps({
-        "input": {
-            "brain_dump": brain_dump,
-            "word_count": len(brain_dump.split())
-        },
-        "synthesis_framework": {
-            "core_message": "Distill to 1-2 sentence essence",
-            "key_themes": "Identify main themes from the details",
-            "logical_structure": {
-                "suggested_flow": "Best order to present these ideas",
-                "groupings": "Which points belong together"
-            },
-            "concise_version": "3-4 sentences hitting the key points",
-            "full_version": "Complete message with all important details organized"
+    budget = Budget(max_tokens, max_bytes)
+    text_metrics = _text_metrics(brain_dump, by_section=False)
+    return SYNTHESIZE_THOUGHTS_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        brain_dump=brain_dump,
+        word_count=text_metrics["words"],
+        text_metrics=text_metrics,
+    )
+
+
+CATCH_UP_THREAD_RESPONSE = ResponseTemplate({
+    "input": {
+        "subject": Slot("subject"),
+        "source": Slot("source"),
+        "message_count": Slot("message_count"),
+        "content_length": Slot("content_length"),
+        "thread_format": Slot("thread_format"),
+        "quoted_lines_removed": Slot("quoted_lines_removed"),
+        "duplicate_messages_removed": Slot("duplicate_messages_removed"),
+        "near_duplicates_collapsed": Slot("near_duplicates_collapsed")
+    },
+    "catch_up_framework": {
+        "current_state": "Where things stand right now",
+        "key_decisions": "Decisions that have been made in this thread",
+        "your_action_items": "What they need from you specifically",
+        "deadlines": "Any timeline or deadline mentioned",
+        "blockers": {
+            "who_is_blocked": "Who is waiting on something",
+            "blocked_on_what": "What they're waiting for",
+            "blocked_on_you": "Are they waiting on you?"
         },
-        "bottom_up_process": {
-            "details_provided": "The Lego pieces (your brain dump)",
-            "structure_identified": "How the pieces fit together",
-            "final_built": "The finished structure"
-        }
-    }, indent=2)
+        "next_response": "What you should respond with"
+    },
+    "detected_in_thread": Slot("detected_in_thread"),
+    "messages": Slot("messages")
+}, elide={"messages": None, "detected_in_thread": None})
+frameworks.publish("catch_up_thread", CATCH_UP_THREAD_RESPONSE)
+
+CATCH_UP_THREAD_UPDATE_RESPONSE = ResponseTemplate({
+    "input": {
+        "subject": Slot("subject"),
+        "thread_id": Slot("thread_id"),
+        "source": Slot("source"),
+        "mode": Slot("mode"),
+        "content_length": Slot("content_length"),
+        "new_content_length": Slot("new_content_length"),
+        "thread_format": Slot("thread_format"),
+        "new_message_count": Slot("new_message_count"),
+        "quoted_lines_removed": Slot("quoted_lines_removed"),
+        "duplicate_messages_removed": Slot("duplicate_messages_removed"),
+        "near_duplicates_collapsed": Slot("near_duplicates_collapsed")
+    },
+    "since_last_call": {
+        "new_decisions": Slot("new_decisions")
+    },
+    "thread_totals": Slot("thread_totals"),
+    "catch_up_framework": {
+        "what_changed": "Only messages since your last catch-up on this thread are included",
+        "new_decisions": "Does anything decided here change what you're doing?",
+        "new_action_items": "Which of these are for you, and by when?",
+        "new_blockers": "Is anyone now waiting on you?",
+        "next_response": "What you should respond with, if anything"
+    },
+    "detected_in_new_messages": Slot("detected_in_new_messages"),
+    "messages": Slot("messages")
+}, elide={"messages": None, "detected_in_new_messages": None, "new_decisions": None})
+frameworks.publish("catch_up_thread_update", CATCH_UP_THREAD_UPDATE_RESPONSE)
 
 
 @mcp.tool()
-def catch_up_thread(thread_content: str, thread_subject: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize(
+    bypass=lambda thread_content, thread_id, **_: thread_id or _is_file_argument(thread_content),
+    vary=lambda reference_date, **_: _reference_day(reference_date),
+)
+def catch_up_thread(thread_content: str, thread_subject: str = "", thread_id: str = "", reference_date: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Catch up on long email/Slack thread.
 
+    The thread is split into messages (email and Slack formats), with quoted
+    reply history stripped and repeated messages kept once. Near duplicates
+    ("+1" restatements, lightly edited forwards) are collapsed into the first
+    of them, which lists how many times and by whom it was repeated.
+
     Extracts:
     - Current state (where things stand now)
     - Key decisions made in the thread
@@ -447,40 +1136,132 @@ def catch_up_thread(thread_content: str, thread_subject: str = "") -> str:
     - Deadlines mentioned
     - Who's blocked on what
 
+    Action items (who / what / due date), deadlines and blockers are also
+    picked out of the messages in one local pass and returned as pre-filled
+    candidates, each pointing back to its message.
+
+    With a thread_id, later calls for the same thread return only what's
+    new since the last call: the new messages and the decisions, action
+    items, deadlines and blockers found in them. thread_content can then be either the whole
+    thread again (only the part after what was already seen is parsed)
+    or just the new messages.
+
     Args:
-        thread_content: The full thread/email chain
+        thread_content: The full thread/email chain, or the file:// URI or absolute
+            path of a local file to read it from
         thread_subject: Subject line if available (optional)
+        thread_id: Any stable id for this thread, to catch up incrementally (optional)
+        reference_date: Date as YYYY-MM-DD that "Friday", "next week" etc. in the
+            thread are counted from (optional, default today)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
-        Structured summary of thread with your action items
+        Structured summary of thread with your action items and the parsed messages
     """
 
-    thread_data = {
-        "subject": thread_subject if thread_subject else "No subject provided",
-        "message_count": thread_content.count("\n\n") + 1,
-        "content_length": f"{len(thread_content)} characters"
-    }
-
-    return json.dumps({
-        "input": thread_data,
-        "catch_up_framework": {
-            "current_state": "Where things stand right now",
-            "key_decisions": "Decisions that have been made in this thread",
-            "your_action_items": "What they need from you specifically",
-            "deadlines": "Any timeline or deadline mentioned",
-            "blockers": {
-                "who_is_blocked": "Who is waiting on something",
-                "blocked_on_what": "What they're waiting for",
-                "blocked_on_you": "Are they waiting on you?"
-            },
-            "next_response": "What you should respond with"
+    from datetime import date
+
+    from src.actions import scan_messages
+    from src.threads import parse_file, parse_thread
+
+    budget = Budget(max_tokens, max_bytes)
+    reference = date.fromisoformat(reference_date) if reference_date else None
+
+    source = _file_source(thread_content)
+    if thread_id:
+        text = source.read_text() if source else thread_content
+        update = thread_sessions().update(
+            thread_id,
+            text,
+            lambda delta, *context: workers.run(parse_thread, delta, *context, size=len(delta)),
+            lambda messages, first: workers.run(
+                scan_messages, messages, reference, first, size=sum(len(message.text) for message in messages)
+            ),
+        )
+        new_messages = update.thread.messages
+        return CATCH_UP_THREAD_UPDATE_RESPONSE.render(
+            budget=budget,
+            framework_ref=framework_ref,
+            subject=thread_subject if thread_subject else "No subject provided",
+            thread_id=thread_id,
+            source=source.uri if source else "inline",
+            mode=update.mode,
+            content_length=f"{len(text)} characters",
+            new_content_length=f"{update.new_content_length} characters",
+            thread_format=update.thread.format,
+            new_message_count=len(update.thread.messages),
+            quoted_lines_removed=update.thread.quoted_lines_removed,
+            duplicate_messages_removed=update.thread.duplicates_removed,
+            near_duplicates_collapsed=update.thread.near_duplicates_collapsed,
+            new_decisions=update.decisions,
+            thread_totals={"calls": update.calls, **update.totals},
+            detected_in_new_messages=update.detected,
+            messages=[message.as_dict() for message in new_messages],
+        )
+
+    if source is not None:
+        # Streamed from the file line by line (in the worker process, for large files)
+        thread = workers.run(parse_file, str(source.path), size=source.size)
+    else:
+        thread = workers.run(parse_thread, thread_content, size=len(thread_content))
+
+    return CATCH_UP_THREAD_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        subject=thread_subject if thread_subject else "No subject provided",
+        source=source.uri if source else "inline",
+        message_count=len(thread.messages),
+        content_length=f"{source.size} bytes" if source else f"{len(thread_content)} characters",
+        thread_format=thread.format,
+        quoted_lines_removed=thread.quoted_lines_removed,
+        duplicate_messages_removed=thread.duplicates_removed,
+        near_duplicates_collapsed=thread.near_duplicates_collapsed,
+        detected_in_thread=workers.run(
+            scan_messages, thread.messages, reference, size=source.size if source else len(thread_content)
+        ),
+        messages=[message.as_dict() for message in thread.messages],
+    )
+
+
+SUMMARIZE_MEETING_RESPONSE = ResponseTemplate({
+    "input": {
+        "title": Slot("title"),
+        "source": Slot("source"),
+        "notes_length": Slot("notes_length"),
+        "repeated_paragraphs_collapsed": Slot("repeated_paragraphs_collapsed")
+    },
+    "summary_framework": {
+        "key_decisions": "Decisions that were made",
+        "action_items": {
+            "format": "List each action with who/what/when",
+            "your_items": "Action items assigned to you",
+            "others_items": "Action items assigned to others"
         },
-        "thread_content": thread_content
-    }, indent=2)
+        "open_questions": "Questions raised but not answered",
+        "blockers": "Issues that could block progress",
+        "your_next_steps": "What you need to do immediately after this meeting"
+    },
+    "detected_in_notes": Slot("detected_in_notes"),
+    "meeting_notes": Slot("meeting_notes")
+}, elide={
+    "meeting_notes": "These are your notes as sent (repeats collapsed); notes from a file are at comms://doc/{document_id}/section/{n}",
+    "detected_in_notes": None,
+})
+frameworks.publish("summarize_meeting", SUMMARIZE_MEETING_RESPONSE)
 
 
 @mcp.tool()
-def summarize_meeting(meeting_notes: str, meeting_title: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize(
+    bypass=lambda meeting_notes, **_: _is_file_argument(meeting_notes),
+    vary=lambda meeting_date, **_: _reference_day(meeting_date),
+)
+def summarize_meeting(meeting_notes: str, meeting_title: str = "", meeting_date: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Organize meeting notes and extract decisions/action items.
 
@@ -491,38 +1272,310 @@ def summarize_meeting(meeting_notes: str, meeting_title: str = "") -> str:
     - Blockers identified
     - What you need to do next
 
+    The notes are scanned once, locally, for action items (who / what /
+    due date), deadlines and blockers; these come back as pre-filled
+    candidates to check and complete, not a finished list.
+
+    Paragraphs repeated in the notes (e.g. copied from the agenda), exactly
+    or nearly, are included once with a note of how often they appeared.
+    Notes read from a file are not echoed back: the response lists their
+    sections, each readable from its comms://doc/... uri.
+
     Args:
-        meeting_notes: Raw meeting notes to organize
+        meeting_notes: Raw meeting notes to organize, or the file:// URI or
+            absolute path of a local file to read them from
         meeting_title: Meeting title if available (optional)
+        meeting_date: Date of the meeting as YYYY-MM-DD, for resolving "Friday",
+            "next week" etc. in the notes (optional, default today)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Structured summary with action items and decisions
     """
 
-    meeting_data = {
-        "title": meeting_title if meeting_title else "Untitled meeting",
-        "notes_length": f"{len(meeting_notes)} characters"
+    from datetime import date
+
+    from src.actions import scan_text
+
+    budget = Budget(max_tokens, max_bytes)
+    reference = date.fromisoformat(meeting_date) if meeting_date else None
+    source = _file_source(meeting_notes)
+    if source is not None:
+        text = source.read_text()
+        document, structure = _store_document(text)
+        return SUMMARIZE_MEETING_RESPONSE.render(
+            budget=budget,
+            framework_ref=framework_ref,
+            title=meeting_title if meeting_title else "Untitled meeting",
+            source=source.uri,
+            notes_length=f"{len(text)} characters",
+            repeated_paragraphs_collapsed="Not checked - the notes are read by section",
+            detected_in_notes=workers.run(scan_text, text, reference, size=len(text)),
+            meeting_notes={
+                "included": "No - read each section's uri when you need it",
+                "document_id": document.doc_id,
+                "sections": structure,
+            },
+        )
+
+    from src.near_duplicates import collapse_paragraphs
+
+    notes, collapsed = workers.run(collapse_paragraphs, meeting_notes, size=len(meeting_notes))
+    return SUMMARIZE_MEETING_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        title=meeting_title if meeting_title else "Untitled meeting",
+        source="inline",
+        notes_length=f"{len(meeting_notes)} characters",
+        repeated_paragraphs_collapsed=collapsed,
+        detected_in_notes=workers.run(scan_text, notes, reference, size=len(notes)),
+        meeting_notes=notes,
+    )
+
+
+SEARCH_RULES_RESPONSE = ResponseTemplate({
+    "query": Slot("query"),
+    "results": Slot("results"),
+    "more": "Each result is one section of a rule file; the whole file is at comms://rules/<topic>"
+}, elide={"results": "Call again with a smaller k, or read a result's uri for its full section"})
+
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+def search_rules(query: str, k: int = 5, max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Find the communication guideline sections most relevant to a query.
+
+    Returns just the matching sections of the rule files (message clarity,
+    context interpretation, tone calibration, meeting structure, document
+    scaffolding) instead of whole files.
+
+    Args:
+        query: What you need guidance on, e.g. "sarcasm" or "meeting follow up"
+        k: Number of sections to return (1-20, default 5)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        The best-matching sections, best first, with their resource URIs
+    """
+
+    budget = Budget(max_tokens, max_bytes)
+    if not 1 <= k <= 20:
+        raise ValueError("k must be between 1 and 20")
+    return SEARCH_RULES_RESPONSE.render(
+        budget=budget,
+        query=query,
+        results=[
+            {
+                "uri": section.uri,
+                "topic": section.topic,
+                "section": section.title,
+                "score": score,
+                "text": section.text,
+            }
+            for score, section in rules_index().search(query, k)
+        ],
+    )
+
+
+OPEN_MEETING_RESPONSE = ResponseTemplate({
+    "meeting_id": Slot("meeting_id"),
+    "title": Slot("title"),
+    "reference_date": Slot("reference_date"),
+    "next_steps": {
+        "append": "Call append_meeting_notes with this meeting_id and each new chunk of notes as you take them",
+        "summary": "Call get_meeting_summary at any time for the decisions, action items and open questions so far",
+        "expiry": Slot("expiry")
     }
+})
 
-    return json.dumps({
-        "input": meeting_data,
-        "summary_framework": {
-            "key_decisions": "Decisions that were made",
-            "action_items": {
-                "format": "List each action with who/what/when",
-                "your_items": "Action items assigned to you",
-                "others_items": "Action items assigned to others"
-            },
-            "open_questions": "Questions raised but not answered",
-            "blockers": "Issues that could block progress",
-            "your_next_steps": "What you need to do immediately after this meeting"
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+def open_meeting(meeting_title: str = "", meeting_date: str = "", max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Start a live meeting session, for notes taken during the meeting.
+
+    Append notes as they are taken with append_meeting_notes; each chunk is
+    scanned once for decisions, action items (who/what/when) and open
+    questions, and get_meeting_summary returns everything found so far.
+
+    Args:
+        meeting_title: Meeting title if available (optional)
+        meeting_date: Date of the meeting as YYYY-MM-DD, for resolving "Friday",
+            "next week" etc. in the notes (optional, default today)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        The meeting_id to pass to the other meeting session tools
+    """
+
+    from datetime import date
+
+    budget = Budget(max_tokens, max_bytes)
+
+    reference = date.fromisoformat(meeting_date) if meeting_date else None
+    sessions = meeting_sessions()
+    session = sessions.open(meeting_title or "Untitled meeting", reference)
+    return OPEN_MEETING_RESPONSE.render(
+        budget=budget,
+        meeting_id=session.meeting_id,
+        title=session.title,
+        reference_date=session.reference.isoformat(),
+        expiry=f"The session is discarded after {sessions.idle_timeout / 3600:g} hours without use",
+    )
+
+
+APPEND_MEETING_NOTES_RESPONSE = ResponseTemplate({
+    "meeting_id": Slot("meeting_id"),
+    "notes_length": Slot("notes_length"),
+    "lines_processed": Slot("lines_processed"),
+    "added": {
+        "decisions": Slot("decisions"),
+        "action_items": Slot("action_items"),
+        "open_questions": Slot("open_questions")
+    }
+}, elide={
+    "open_questions": "Call get_meeting_summary",
+    "action_items": "Call get_meeting_summary",
+    "decisions": "Call get_meeting_summary",
+})
+
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+def append_meeting_notes(meeting_id: str, notes_chunk: str, max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Add the next chunk of notes to a live meeting session.
+
+    Only the new chunk is scanned. A line cut off at the end of a chunk is
+    picked up when the next chunk arrives.
+
+    Args:
+        meeting_id: The id returned by open_meeting
+        notes_chunk: Notes taken since the last append (not the whole notes again)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        The decisions, action items and questions found in this chunk
+    """
+
+    budget = Budget(max_tokens, max_bytes)
+    session = meeting_sessions().get(meeting_id)
+    added = session.append(notes_chunk)
+    return APPEND_MEETING_NOTES_RESPONSE.render(
+        budget=budget,
+        meeting_id=meeting_id,
+        notes_length=f"{session.characters} characters",
+        lines_processed=session.lines,
+        **added,
+    )
+
+
+MEETING_SUMMARY_RESPONSE = ResponseTemplate({
+    "input": {
+        "title": Slot("title"),
+        "meeting_id": Slot("meeting_id"),
+        "notes_length": Slot("notes_length"),
+        "reference_date": Slot("reference_date")
+    },
+    "extracted": {
+        "note": "Found locally by pattern matching; check them against the notes",
+        "decisions": Slot("decisions"),
+        "action_items": Slot("action_items"),
+        "open_questions": Slot("open_questions"),
+        "answered_questions": Slot("answered_questions"),
+        "items_not_kept": Slot("items_not_kept")
+    },
+    **SUMMARIZE_MEETING_RESPONSE.framework
+}, elide={
+    "items_not_kept": None,
+    "answered_questions": None,
+    "open_questions": None,
+    "action_items": None,
+    "decisions": None,
+})
+frameworks.publish("summarize_meeting", MEETING_SUMMARY_RESPONSE)
+
+
+@mcp.tool()
+@workers.offload
+@metrics.instrument("tool")
+def get_meeting_summary(meeting_id: str, framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
+    """
+    Summary of a live meeting session so far.
+
+    Args:
+        meeting_id: The id returned by open_meeting
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
+
+    Returns:
+        Decisions, action items (who/what/when) and open questions found so far
+    """
+
+    budget = Budget(max_tokens, max_bytes)
+    session = meeting_sessions().get(meeting_id)
+    return MEETING_SUMMARY_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        title=session.title,
+        meeting_id=meeting_id,
+        notes_length=f"{session.characters} characters",
+        reference_date=session.reference.isoformat(),
+        answered_questions=session.answered_questions,
+        items_not_kept=session.dropped,
+        **session.summary(),
+    )
+
+
+ASK_CLARITY_RESPONSE = ResponseTemplate({
+    "input": {
+        "situation": Slot("situation"),
+        "asking": Slot("asking")
+    },
+    "clarity_request_framework": {
+        "safe_opening_phrases": [
+            "To confirm...",
+            "Want to make sure I understand...",
+            "Just to clarify...",
+            "Help me understand...",
+            "Quick question to make sure we're aligned..."
+        ],
+        "specific_questions": "List the specific things you need clarified",
+        "collaborative_tone": {
+            "frame_as": "Ensuring alignment, not questioning their clarity",
+            "avoid": "Anything that sounds like 'you were unclear'",
+            "emphasize": "Your need to understand, not their failure to explain"
         },
-        "meeting_notes": meeting_notes
-    }, indent=2)
+        "draft_message": "Complete draft message asking for clarity"
+    },
+    "detected_in_situation": Slot("detected_in_situation")
+}, elide={"situation": ECHOED_INPUT, "detected_in_situation": None})
+frameworks.publish("ask_clarity", ASK_CLARITY_RESPONSE)
 
 
 @mcp.tool()
-def ask_clarity(confusing_situation: str, person_to_ask: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize()
+def ask_clarity(confusing_situation: str, person_to_ask: str = "", language: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Draft a message asking for clarity without seeming difficult.
 
@@ -537,42 +1590,76 @@ def ask_clarity(confusing_situation: str, person_to_ask: str = "") -> str:
     - "Just to clarify the timeline..."
     - "Help me understand..."
 
+    Vague phrases and open questions in the situation (for example a message
+    you were sent) are detected locally, as candidates for what to clarify.
+    When it is not in English, safe opening phrases in its language are
+    included too.
+
     Args:
         confusing_situation: What you're confused about
         person_to_ask: Who you're asking (optional, helps with tone)
+        language: Locale of the situation, e.g. "en", "es", "fr", "de" (optional, detected if not given)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Draft message asking for clarity in a collaborative tone
     """
 
-    clarity_data = {
-        "situation": confusing_situation,
-        "asking": person_to_ask if person_to_ask else "Not specified"
+    budget = Budget(max_tokens, max_bytes)
+    analysis = analysis_cache.get(confusing_situation)
+    pack, detected_language = _language(confusing_situation, language)
+    detected = {
+        "language": detected_language,
+        "vague_phrases": analysis.phrase_hits(pack.vague_phrases),
+        "questions": analysis.questions[:MAX_LISTED_QUESTIONS],
     }
-
-    return json.dumps({
-        "input": clarity_data,
-        "clarity_request_framework": {
-            "safe_opening_phrases": [
-                "To confirm...",
-                "Want to make sure I understand...",
-                "Just to clarify...",
-                "Help me understand...",
-                "Quick question to make sure we're aligned..."
-            ],
-            "specific_questions": "List the specific things you need clarified",
-            "collaborative_tone": {
-                "frame_as": "Ensuring alignment, not questioning their clarity",
-                "avoid": "Anything that sounds like 'you were unclear'",
-                "emphasize": "Your need to understand, not their failure to explain"
-            },
-            "draft_message": "Complete draft message asking for clarity"
-        }
-    }, indent=2)
+    if pack.locale != locale_packs().default:
+        # The framework lists the default (English) ones
+        detected["safe_opening_phrases"] = pack.safe_opening_phrases
+    return ASK_CLARITY_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        situation=confusing_situation,
+        asking=person_to_ask if person_to_ask else "Not specified",
+        detected_in_situation=detected,
+    )
+
+
+UNSTUCK_READING_RESPONSE = ResponseTemplate({
+    "input": {
+        "document": Slot("document"),
+        "blocking_issue": Slot("blocking_issue")
+    },
+    "text_metrics": Slot("text_metrics"),
+    "reading_plan": Slot("reading_plan"),
+    "unstuck_framework": {
+        "identify_blocker": {
+            "lack_of_context": "Don't understand why this document exists",
+            "unclear_purpose": "Don't know what you need from it",
+            "overwhelming_length": "Too long, don't know where to start",
+            "focus_uncertainty": "Don't know what's important vs not"
+        },
+        "concrete_first_step": "Single specific action to take right now",
+        "reading_strategy": {
+            "order": "What to read in what order",
+            "focus": "What to pay attention to",
+            "skip": "What you can skip or skim for now"
+        },
+        "focus_first": "The one thing to focus on first before anything else"
+    }
+}, elide={"document": ECHOED_INPUT, "text_metrics": None})
+frameworks.publish("unstuck_reading", UNSTUCK_READING_RESPONSE)
 
 
 @mcp.tool()
-def unstuck_reading(document_description: str, blocking_issue: str = "") -> str:
+@workers.offload
+@metrics.instrument("tool")
+@result_cache.memoize(bypass=lambda document_description, **_: _is_file_argument(document_description))
+def unstuck_reading(document_description: str, blocking_issue: str = "", framework_ref: bool = False, max_tokens: int = 0, max_bytes: int = 0) -> str:
     """
     Get unstuck when unable to start reading a document.
 
@@ -582,43 +1669,78 @@ def unstuck_reading(document_description: str, blocking_issue: str = "") -> str:
     - Reading strategy for this specific doc
     - What to focus on first (and what to skip for now)
 
+    Given the document itself (or its file), the reading strategy is backed
+    by measurements: reading time, difficulty overall and per section, and
+    how much of it is lists, tables or code.
+
     Args:
-        document_description: Brief description of the document you're stuck on
+        document_description: Brief description of the document you're stuck on, the
+            document itself, or the file:// URI or absolute path of a local copy
         blocking_issue: What's specifically blocking you (optional)
+        framework_ref: Return the link to the guidance framework (a comms://frameworks/...
+            resource) instead of the framework itself, once you have read it (optional)
+        max_tokens: Fit the response into about this many tokens, cutting the least
+            essential fields first (optional, 0 = no limit)
+        max_bytes: Fit the response into this many bytes (optional, 0 = no limit)
 
     Returns:
         Strategy to get unstuck and start reading
     """
+    from src.text_metrics import MIN_MEASURED_WORDS, reading_plan
 
-    unstuck_data = {
-        "document": document_description,
-        "blocking_issue": blocking_issue if blocking_issue else "Not specified"
-    }
+    budget = Budget(max_tokens, max_bytes)
 
-    return json.dumps({
-        "input": unstuck_data,
-        "unstuck_framework": {
-            "identify_blocker": {
-                "lack_of_context": "Don't understand why this document exists",
-                "unclear_purpose": "Don't know what you need from it",
-                "overwhelming_length": "Too long, don't know where to start",
-                "focus_uncertainty": "Don't know what's important vs not"
-            },
-            "concrete_first_step": "Single specific action to take right now",
-            "reading_strategy": {
-                "order": "What to read in what order",
-                "focus": "What to pay attention to",
-                "skip": "What you can skip or skim for now"
-            },
-            "focus_first": "The one thing to focus on first before anything else"
-        }
-    }, indent=2)
+    source = _file_source(document_description)
+    text = source.read_text() if source else document_description
+    text_metrics = _text_metrics(text)
+    if source is None and text_metrics["words"] < MIN_MEASURED_WORDS:
+        text_metrics = plan = "Not measured - pass the document text or its file path for reading time and difficulty"
+    else:
+        plan = reading_plan(text_metrics)
+
+    return UNSTUCK_READING_RESPONSE.render(
+        budget=budget,
+        framework_ref=framework_ref,
+        document=source.uri if source else document_description,
+        blocking_issue=blocking_issue if blocking_issue else "Not specified",
+        text_metrics=text_metrics,
+        reading_plan=plan,
+    )
 
 
 # ============================================================================
 # Server startup
 # ============================================================================
 
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the MCP server (console entry point: neurodivergent-comms-mcp).
+
+    Serves over stdio by default. With --transport streamable-http (or sse)
+    one process serves many concurrent client sessions over HTTP, sharing
+    the rule files, caches and metrics between them.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="neurodivergent-comms-mcp", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"], default="stdio")
+    parser.add_argument("--host", default=mcp.settings.host, help="HTTP bind address (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=mcp.settings.port, help="HTTP port (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    if args.host not in LOCAL_HOSTS:
+        # DNS rebinding protection only allows localhost Host headers; like
+        # FastMCP itself, drop it when deliberately binding another address
+        mcp.settings.transport_security = None
+    try:
+        mcp.run(transport=args.transport)
+    finally:
+        workers.shutdown()
+
+
 if __name__ == "__main__":
-    # Run the MCP server
-    mcp.run()
+    main()
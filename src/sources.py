@@ -0,0 +1,119 @@
+"""
+Large inputs given as a local file instead of inline text.
+
+Tools that take long text (documents, threads, meeting notes) also accept
+a `file://` URI or an absolute path in place of the text. The file is then
+read on the server:
+
+- `FileSource.read_text()` maps the file into memory and decodes it once,
+  without an intermediate copy of the bytes
+- `FileSource.iter_lines()` streams it line by line in fixed-size chunks,
+  for parsers that work a line at a time
+
+and the response refers to the file by URI instead of echoing its text.
+
+Only files under the configured root directories can be read. A plain
+path that isn't a file under one of them is treated as ordinary text (a
+one-line message can look like a path); a `file://` URI that can't be
+read is an error.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import unquote, urlparse
+import mmap
+import os
+
+# Longest argument still considered as a possible path
+_MAX_PATH_CHARS = 4096
+# Read size when streaming a file line by line
+CHUNK_CHARS = 1 << 20
+
+
+@dataclass(frozen=True)
+class FileSource:
+    """A readable local file given in place of inline text."""
+
+    path: Path
+    size: int
+
+    @property
+    def uri(self) -> str:
+        return self.path.as_uri()
+
+    def read_text(self) -> str:
+        """The whole file, decoded as UTF-8 (invalid bytes replaced)."""
+        if self.size == 0:
+            return ""
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8", "replace")
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the file's lines (without the newline), reading one chunk at a time."""
+        return read_lines(self.path)
+
+
+def read_lines(path: str | os.PathLike) -> Iterator[str]:
+    """Yield the lines of a UTF-8 file (without the newline), reading one chunk at a time."""
+    with open(path, encoding="utf-8", errors="replace", newline="") as file:
+        pending = ""
+        while chunk := file.read(CHUNK_CHARS):
+            lines = (pending + chunk).split("\n")
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+
+def looks_like_file(value: str) -> bool:
+    """Whether `value` could be a file reference (cheap check, no file system access)."""
+    if len(value) > _MAX_PATH_CHARS or "\n" in value:
+        return False
+    value = value.strip()
+    return value.startswith(("file://", "/", "~")) or (len(value) > 2 and value[1] == ":" and value[2] in "\\/")
+
+
+def open_source(value: str, roots: Iterable[Path]) -> FileSource | None:
+    """
+    The file `value` refers to, or None if `value` is ordinary text.
+
+    Args:
+        value: A tool's text argument
+        roots: Directories files may be read from (empty: file inputs are disabled)
+
+    Returns:
+        The file, or None
+
+    Raises:
+        ValueError: `value` is a file:// URI that can't be read (outside the roots, missing, not a file)
+    """
+    if not looks_like_file(value):
+        return None
+    value = value.strip()
+    if value.startswith("file://"):
+        parsed = urlparse(value)
+        if parsed.netloc not in ("", "localhost"):
+            raise ValueError(f"Only local file:// URIs are supported, got host '{parsed.netloc}'")
+        path = Path(unquote(parsed.path))
+        explicit = True
+    else:
+        try:
+            path = Path(value).expanduser()
+        except RuntimeError:  # "~name" for a user that doesn't exist
+            return None
+        explicit = False
+
+    roots = [Path(root).expanduser().resolve() for root in roots]
+    path = path.resolve()
+    if not roots or not any(path.is_relative_to(root) for root in roots):
+        if not explicit:
+            return None
+        if not roots:
+            raise ValueError("Reading input from files is disabled on this server; pass the text inline")
+        raise ValueError(f"{value} is outside the directories this server may read (COMMS_FILE_ROOTS)")
+    if not path.is_file():
+        if explicit:
+            raise ValueError(f"File not found: {value}")
+        return None
+    return FileSource(path, path.stat().st_size)
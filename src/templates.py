@@ -0,0 +1,197 @@
+"""
+Pre-serialized JSON response templates.
+
+Most of every tool response is a constant framework; only a few values
+change per call. A `ResponseTemplate` serializes the whole structure once
+(with `json.dumps(indent=2)`, exactly as the tools used to do per call)
+and keeps the text between the per-call values. Rendering then only has
+to JSON-encode those values and join the pieces, which produces the same
+bytes as building the dict and dumping it again.
+
+A template also lists which slots may be cut when a caller sets a size
+budget, in the order they are given up (see `src.budget`).
+
+The constant framework sections can be published once through a
+`FrameworkRegistry`, under a URI that carries a hash of their content.
+Responses rendered with `framework_ref=True` then carry that URI instead
+of the sections; a client that has read it keeps using its copy for as
+long as the URI is unchanged.
+"""
+
+import hashlib
+import json
+import re
+
+_MARKER = "@@slot:{}@@"
+_MARKER_RE = re.compile(r'"@@slot:(\w+)@@"')
+
+
+class Slot:
+    """Placeholder for a per-call value in a response template."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+def _encode_slot(value):
+    if isinstance(value, Slot):
+        return _MARKER.format(value.name)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ResponseTemplate:
+    """A response structure serialized once, with `Slot`s filled in per call.
+
+    Scalar slot values are encoded as-is. Lists and dicts are dumped with
+    the same indent and shifted to the slot's nesting depth.
+
+    `elide` maps the slots that may be shortened to fit a size budget to a
+    hint on how to get them in full (None: the default hint), in the order
+    they are given up: raw content first, derived data later. Everything
+    else is always kept.
+    """
+
+    def __init__(self, structure: dict, elide: dict[str, str | None] | None = None):
+        self.structure = structure
+        text = json.dumps(structure, indent=2, default=_encode_slot)
+        parts = _MARKER_RE.split(text)
+        self._literals = parts[0::2]
+        self._slots = parts[1::2]
+        self.elide = dict(elide or {})
+        # Set when the framework is published (FrameworkRegistry.publish)
+        self.framework_uri: str | None = None
+        self._by_reference: ResponseTemplate | None = None
+        unknown = set(self.elide) - set(self._slots)
+        if unknown:
+            raise ValueError(f"elide names unknown slots: {sorted(unknown)}")
+        # Leading whitespace of the line each slot sits on
+        self._margins = []
+        for literal in self._literals[:-1]:
+            line = literal.rsplit("\n", 1)[-1]
+            self._margins.append("\n" + line[: len(line) - len(line.lstrip(" "))])
+
+    @property
+    def framework(self) -> dict:
+        """The constant top-level sections (everything except `input` and sections holding slots)."""
+        return {
+            key: value for key, value in self.structure.items()
+            if key != "input" and not _has_slot(value)
+        }
+
+    @property
+    def slots(self) -> list[str]:
+        """Slot names in the order they appear in the output."""
+        return list(self._slots)
+
+    def render(self, budget=None, framework_ref: bool = False, **values) -> str:
+        """
+        Return the serialized response with `values` filled in.
+
+        Args:
+            budget: A `src.budget.Budget` to fit the response to (optional)
+            framework_ref: Replace the framework sections with the URI they are published under
+            **values: Slot values
+        """
+        if framework_ref and self.framework_uri:
+            return self._reference_template().render(budget=budget, **values)
+        if budget:
+            from src.budget import fit
+            return fit(self, budget, values)
+        dumps = json.dumps
+        literals = self._literals
+        out = [literals[0]]
+        for i, name in enumerate(self._slots, 1):
+            value = values[name]
+            if isinstance(value, (dict, list)):
+                out.append(dumps(value, indent=2).replace("\n", self._margins[i - 1]))
+            else:
+                out.append(dumps(value))
+            out.append(literals[i])
+        return "".join(out)
+
+    def _reference_template(self) -> "ResponseTemplate":
+        if self._by_reference is None:
+            framework = self.framework
+            structure = {}
+            for key, value in self.structure.items():
+                if key not in framework:
+                    structure[key] = value
+                elif "framework" not in structure:
+                    structure["framework"] = self.framework_uri
+            self._by_reference = ResponseTemplate(structure, self.elide)
+        return self._by_reference
+
+    def as_dict(self, **values) -> dict:
+        """Return the response structure with `values` filled in."""
+        return _fill(self.structure, values)
+
+
+class FrameworkRegistry:
+    """Response frameworks published under `<prefix><name>@<content hash>` URIs."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._frameworks: dict[str, tuple[str, str]] = {}  # name -> (version, JSON text)
+
+    def publish(self, name: str, template: ResponseTemplate) -> None:
+        """
+        Publish `template`'s framework as `name`, so it can be rendered by reference.
+
+        Templates sharing a framework (a tool and its batch variant) are
+        published under the same name.
+
+        Raises:
+            ValueError: `name` is already published with a different framework
+        """
+        text = json.dumps(template.framework, indent=2)
+        version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+        published = self._frameworks.setdefault(name, (version, text))
+        if published[0] != version:
+            raise ValueError(f"Framework '{name}' is already published with different content")
+        template.framework_uri = f"{self.prefix}{name}@{version}"
+
+    def read(self, name: str, version: str) -> str:
+        """
+        The framework published as `name`, as JSON.
+
+        Raises:
+            ValueError: Unknown name, or `version` is not the current one
+        """
+        if name not in self._frameworks:
+            raise ValueError(f"Unknown framework '{name}' - see {self.prefix}manifest")
+        current, text = self._frameworks[name]
+        if version != current:
+            raise ValueError(f"{self.prefix}{name}@{version} is out of date - read {self.prefix}{name}@{current}")
+        return text
+
+    def manifest(self) -> dict:
+        """URI and size of each published framework."""
+        return {
+            name: {"uri": f"{self.prefix}{name}@{version}", "version": version, "bytes": len(text.encode("utf-8"))}
+            for name, (version, text) in self._frameworks.items()
+        }
+
+
+def _has_slot(node) -> bool:
+    if isinstance(node, Slot):
+        return True
+    if isinstance(node, dict):
+        return any(map(_has_slot, node.values()))
+    if isinstance(node, list):
+        return any(map(_has_slot, node))
+    return False
+
+
+def _fill(node, values):
+    if isinstance(node, Slot):
+        return values[node.name]
+    if isinstance(node, dict):
+        return {key: _fill(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill(item, values) for item in node]
+    return node
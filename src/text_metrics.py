@@ -0,0 +1,230 @@
+"""
+Readability and structure metrics for documents and drafts.
+
+`analyze(text)` measures a text in one linear sweep per section. The text
+is encoded once, and each count maps the bytes to a handful of classes
+with `bytes.translate` and counts class pairs with `bytes.count` (word
+starts, vowel groups, sentence ends), so nothing loops over words in
+Python and a 10 MB document takes a fraction of a second. It reports:
+
+- words, sentences and average sentence length
+- a syllable-based readability score (Flesch reading ease) and grade level
+- estimated reading time
+- how much of the text is lists, tables and code blocks
+- the same difficulty numbers per section (sections from `split_sections`)
+
+Syllables are estimated from vowel groups, minus a silent final "e", which
+is close enough for a readability score. Code blocks are left out of the
+prose counts.
+"""
+
+import re
+import string
+
+from src.documents import Section, split_sections
+
+# Words per minute used for reading-time estimates (a relaxed reading pace)
+READING_WPM = 200
+# Most sections listed individually in the result
+MAX_SECTIONS = 50
+# Shorter texts are a description of a document rather than the document
+MIN_MEASURED_WORDS = 100
+
+_LIST_LINE_RE = re.compile(rb"^[ \t]*(?:[-*+]|\xe2\x80\xa2|\d{1,3}[.)])[ \t]+\S", re.MULTILINE)
+
+
+def _table(classes: dict[bytes, bytes], default: bytes) -> bytes:
+    """A bytes.translate table mapping each byte in a key to its class byte, and all others to `default`."""
+    table = bytearray(default * 256)
+    for members, cls in classes.items():
+        for byte in members:
+            table[byte] = cls[0]
+    return bytes(table)
+
+
+_LETTERS = string.ascii_letters.encode()
+_WORD_BYTES = _LETTERS + string.digits.encode() + b"_" + bytes(range(128, 256))  # UTF-8 letters count as word bytes
+# Each scan maps the text to a few byte classes, then counts class pairs with bytes.count:
+# word starts ("w" after " "), vowel-group starts ("v" after " "), silent final e ("<letter>ce "),
+# sentence ends ("." before " ") and lines not ending in punctuation ("x" before "n")
+_WORDS = _table({b" \t\n\r\v\f": b" "}, b"w")
+_VOWELS = _table({b"aeiouyAEIOUY": b"v"}, b" ")
+_SILENT_E = _table({_WORD_BYTES: b"w", _LETTERS: b"c", b"aiouyAIOUY": b"v", b"eE": b"e", b"lL": b"l"}, b" ")
+_SENTENCE_ENDS = _table({b".!?": b".", b" \t\n\r\v\f\"')]": b" "}, b"x")
+_LINE_ENDS = _table({b".!?:\"')]\v\f": b".", b"\n": b"n"}, b"x")
+
+
+def _difficulty(reading_ease: float) -> str:
+    if reading_ease >= 70:
+        return "easy"
+    if reading_ease >= 50:
+        return "moderate"
+    if reading_ease >= 30:
+        return "hard"
+    return "very hard"
+
+
+def _fences(text: bytes) -> list[int]:
+    """Offsets of the ``` / ~~~ fences that start a line."""
+    fences = []
+    for marker in (b"```", b"~~~"):
+        position = text.find(marker)
+        while position != -1:
+            if position == 0 or text[position - 1] == 10:  # "\n"
+                fences.append(position)
+            position = text.find(marker, position + 3)
+    return sorted(fences)
+
+
+def _split_code(text: bytes) -> tuple[bytes, int]:
+    """Text with fenced code blocks removed, and the number of lines they held."""
+    fences = _fences(text)
+    if len(fences) < 2:
+        return text, 0
+    prose, code_lines, position = [], 0, 0
+    for opening, closing in zip(fences[::2], fences[1::2]):
+        prose.append(text[position:opening])
+        code_lines += text.count(b"\n", opening, closing) - 1
+        end = text.find(b"\n", closing)
+        position = len(text) if end == -1 else end + 1
+    prose.append(text[position:])
+    return b"".join(prose), code_lines
+
+
+def _starts(text: bytes, table: bytes, cls: bytes) -> int:
+    """Number of runs of `cls` bytes once `text` is mapped through `table`."""
+    mapped = text.translate(table)
+    return mapped.count(b" " + cls) + mapped.startswith(cls)
+
+
+def _counts(text: str) -> dict:
+    prose, code_lines = _split_code(text.encode("utf-8", "replace"))
+    words = _starts(prose, _WORDS, b"w")
+    if not words:
+        return {"words": 0, "sentences": 0, "syllables": 0, "lines": 0, "list_lines": 0, "table_lines": 0, "code_lines": code_lines}
+
+    marked = (prose + b" ").translate(_SILENT_E)
+    silent_e = sum(marked.count(before + b"ce ") for before in (b"c", b"v", b"e", b"l"))
+    syllables = max(_starts(prose, _VOWELS, b"v") - silent_e, words)
+    ends = (prose + b" ").translate(_SENTENCE_ENDS).count(b". ")
+    # Non-blank lines that don't end in sentence punctuation (headings, bullets) count as a sentence each
+    compact = prose.translate(None, b" \t\r")
+    unterminated = (compact + b"\n").translate(_LINE_ENDS).count(b"xn")
+    return {
+        "words": words,
+        "sentences": ends + unterminated,
+        "syllables": syllables,
+        "lines": compact.count(b"\n") + 1 - compact.count(b"\n\n"),
+        "list_lines": len(_LIST_LINE_RE.findall(prose)),
+        "table_lines": compact.count(b"\n|") + compact.startswith(b"|"),
+        "code_lines": code_lines,
+    }
+
+
+def _scores(counts: dict) -> dict:
+    words, sentences, syllables = counts["words"], max(counts["sentences"], 1), counts["syllables"]
+    if not words:
+        return {"avg_sentence_words": 0.0, "reading_ease": 100.0, "grade_level": 0.0, "difficulty": "easy"}
+    words_per_sentence = words / sentences
+    syllables_per_word = syllables / words
+    reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    grade_level = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return {
+        "avg_sentence_words": round(words_per_sentence, 1),
+        "reading_ease": round(reading_ease, 1),
+        "grade_level": round(max(grade_level, 0.0), 1),
+        "difficulty": _difficulty(reading_ease),
+    }
+
+
+def _reading_minutes(words: int) -> float:
+    return round(words / READING_WPM, 1)
+
+
+def analyze(text: str, sections: list[Section] | None = None, max_sections: int | None = MAX_SECTIONS) -> dict:
+    """
+    Readability and structure metrics for `text`.
+
+    Args:
+        text: Document or draft to measure
+        sections: Its sections (from `split_sections`), to also report difficulty per section
+        max_sections: Most sections listed individually (None: all of them)
+
+    Returns:
+        Counts, readability scores, reading time, structure densities and
+        (if sections were given) per-section difficulty
+    """
+    if sections:
+        per_section = [(section, _counts(text[section.start:section.end])) for section in sections]
+        totals = {key: sum(counts[key] for _, counts in per_section) for key in per_section[0][1]}
+    else:
+        per_section = []
+        totals = _counts(text)
+
+    content_lines = max(totals["lines"] + totals["code_lines"], 1)
+    result = {
+        "words": totals["words"],
+        "sentences": totals["sentences"],
+        **_scores(totals),
+        "reading_time_minutes": _reading_minutes(totals["words"]),
+        "structure": {
+            "list_lines": totals["list_lines"],
+            "table_lines": totals["table_lines"],
+            "code_lines": totals["code_lines"],
+            "list_density": round(totals["list_lines"] / content_lines, 3),
+            "table_density": round(totals["table_lines"] / content_lines, 3),
+            "code_density": round(totals["code_lines"] / content_lines, 3),
+        },
+    }
+    if sections:
+        scored = [(section, counts, _scores(counts)) for section, counts in per_section]
+        result["section_count"] = len(scored)
+        result["sections"] = [
+            {
+                "section": section.index,
+                "title": section.title,
+                "words": counts["words"],
+                **scores,
+                "reading_time_minutes": _reading_minutes(counts["words"]),
+            }
+            for section, counts, scores in scored[:max_sections]
+        ]
+        by_ease = sorted((item for item in scored if item[1]["words"]), key=lambda item: item[2]["reading_ease"])
+        hardest = []
+        for section, _, scores in by_ease:
+            if len(hardest) == 3 or scores["difficulty"] not in ("hard", "very hard"):
+                break
+            if section.title not in hardest:
+                hardest.append(section.title)
+        result["hardest_sections"] = hardest
+        result["easiest_section"] = by_ease[-1][0].title if by_ease else None
+    return result
+
+
+def analyze_document(text: str, max_sections: int | None = MAX_SECTIONS) -> dict:
+    """`analyze` with the per-section breakdown, splitting `text` at its headings."""
+    return analyze(text, split_sections(text), max_sections)
+
+
+def reading_plan(metrics: dict) -> dict:
+    """Concrete reading-strategy hints derived from `analyze` output."""
+    minutes = metrics["reading_time_minutes"]
+    if minutes < 1:
+        time_needed = "Under a minute"
+    elif minutes < 90:
+        time_needed = f"About {minutes:.0f} minutes at {READING_WPM} words per minute"
+    else:
+        time_needed = f"About {minutes / 60:.0f} hours at {READING_WPM} words per minute - plan several sittings"
+    plan = {
+        "time_needed": time_needed,
+        "overall_difficulty": f"{metrics['difficulty']} (grade level {metrics['grade_level']:g})",
+    }
+    if metrics.get("section_count", 0) > 1:
+        plan["warm_up_with"] = metrics["easiest_section"]
+        plan["slow_down_for"] = metrics["hardest_sections"]
+    structure = metrics["structure"]
+    if structure["code_density"] >= 0.3:
+        plan["skim"] = "Much of this is code - read the prose around it first"
+    elif structure["list_density"] + structure["table_density"] >= 0.4:
+        plan["skim"] = "Mostly lists and tables - scan them for what applies to you"
+    return plan
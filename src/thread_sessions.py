@@ -0,0 +1,172 @@
+"""
+Incremental catch-up for threads that keep growing.
+
+`ThreadSessions` remembers, per thread id, what has been processed so far:
+the length and hash of the content seen on the last call, the last
+sender, and a fingerprint of every message. On the next call:
+
+- if the content starts with the stored content, only the appended part
+  is parsed ("appended")
+- otherwise the content is taken to be just the new messages ("delta")
+
+Either way, messages already seen are skipped, so each call's work and
+response are proportional to what's new rather than to the whole thread.
+
+New messages are scanned sentence by sentence for decisions
+(`src.actions.DECISION_RE`), and for action items, deadlines and blockers
+with the same `src.actions` scan catch_up_thread runs on whole threads;
+these are hints for the reader, not a complete summary. Running totals of
+each kind are kept per thread.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+import hashlib
+import re
+import threading
+
+from src.actions import DECISION_RE, scan_messages
+from src.threads import Message, ParsedThread, fingerprint, parse_thread
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+# Counted per thread: messages, decisions and the kinds found by `scan_messages`
+TOTAL_CATEGORIES = ("messages", "decisions", "action_items", "deadlines", "blockers")
+
+# Longest sentence quoted as a decision
+MAX_DECISION_CHARS = 300
+
+
+def find_decisions(messages: list[Message]) -> list[dict]:
+    """Sentences in `messages` that read as decisions."""
+    decisions = []
+    for message in messages:
+        for sentence in _SENTENCE_RE.split(message.text):
+            sentence = sentence.strip()
+            if sentence and DECISION_RE.search(sentence):
+                decisions.append({
+                    "sender": message.sender or "Unknown",
+                    "timestamp": message.timestamp or "Unknown",
+                    "text": sentence[:MAX_DECISION_CHARS],
+                })
+    return decisions
+
+
+@dataclass
+class ThreadState:
+    """What has been processed so far for one thread id."""
+
+    content_length: int = 0
+    content_sha1: Any = field(default_factory=hashlib.sha1)  # running hash of the content so far
+    last_sender: str | None = None
+    last_timestamp: str | None = None
+    seen: set[str] = field(default_factory=set)
+    calls: int = 0
+    totals: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TOTAL_CATEGORIES, 0))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class ThreadUpdate:
+    """Result of one incremental call."""
+
+    mode: str
+    new_content_length: int
+    thread: ParsedThread
+    decisions: list[dict]
+    detected: dict  # `scan_messages` of the new messages
+    calls: int
+    totals: dict[str, int]
+
+
+def _sha1(text: str):
+    return hashlib.sha1(text.encode("utf-8", "surrogatepass"))
+
+
+class ThreadSessions:
+    """Per-thread-id catch-up state, keeping the most recently used threads."""
+
+    def __init__(self, max_threads: int = 256):
+        self.max_threads = max_threads
+        self._states: OrderedDict[str, ThreadState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        thread_id: str,
+        text: str,
+        parse: Callable[..., ParsedThread] = parse_thread,
+        scan: Callable[[list[Message], int], dict] = lambda messages, first: scan_messages(messages, None, first),
+    ) -> ThreadUpdate:
+        """
+        Process the new part of a thread and return only what's new.
+
+        Args:
+            thread_id: Caller-chosen id for the thread
+            text: The full thread so far, or just the messages since the last call
+            parse: Parses text into messages; called as parse(text, sender, timestamp)
+            scan: Finds action items, deadlines and blockers (see `src.actions.scan_messages`);
+                called as scan(new_messages, number of the first new message)
+
+        Returns:
+            The new messages, what was found in them and running totals for the thread
+        """
+        with self._lock:
+            state = self._states.get(thread_id)
+            if state is None:
+                state = self._states[thread_id] = ThreadState()
+                while len(self._states) > self.max_threads:
+                    self._states.popitem(last=False)
+            else:
+                self._states.move_to_end(thread_id)
+
+        # One call at a time per thread, so the stored prefix stays consistent
+        with state.lock:
+            if state.calls == 0:
+                mode, delta = "new", text
+            elif (
+                len(text) >= state.content_length
+                and _sha1(text[:state.content_length]).digest() == state.content_sha1.digest()
+            ):
+                mode, delta = "appended", text[state.content_length:]
+            else:
+                mode, delta = "delta", text
+
+            if delta.strip():
+                parsed = parse(delta, state.last_sender, state.last_timestamp)
+            else:
+                parsed = ParsedThread("plain", [])
+
+            new_messages = []
+            for message in parsed.messages:
+                key = fingerprint(message.text)
+                if key not in state.seen:
+                    state.seen.add(key)
+                    new_messages.append(message)
+            if new_messages:
+                state.last_sender = new_messages[-1].sender or state.last_sender
+                state.last_timestamp = new_messages[-1].timestamp or state.last_timestamp
+
+            if mode == "appended":
+                state.content_sha1.update(delta.encode("utf-8", "surrogatepass"))
+            else:
+                state.content_sha1 = _sha1(text)
+            state.content_length = len(text)
+
+            decisions = find_decisions(new_messages)
+            detected = scan(new_messages, state.totals["messages"] + 1)
+            state.calls += 1
+            state.totals["messages"] += len(new_messages)
+            state.totals["decisions"] += len(decisions)
+            not_listed = detected.get("not_listed", {})
+            for name in ("action_items", "deadlines", "blockers"):
+                state.totals[name] += len(detected[name]) + not_listed.get(name, 0)
+
+            thread = ParsedThread(
+                parsed.format,
+                new_messages,
+                parsed.quoted_lines_removed,
+                parsed.duplicates_removed + len(parsed.messages) - len(new_messages),
+                parsed.near_duplicates_collapsed,
+            )
+            return ThreadUpdate(mode, len(delta), thread, decisions, detected, state.calls, dict(state.totals))
@@ -0,0 +1,350 @@
+"""
+Email and Slack thread parsing.
+
+`ThreadParser` is fed one line at a time and splits a pasted thread into
+messages with sender and timestamp. It understands:
+
+- Email headers (`From:` followed by `Sent:`/`Date:`/`To:`/`Subject:`).
+  A `From:` line starts a message only if it names a sender (a name or
+  address) or a header line follows it, so prose such as "From: the
+  design team's perspective, ..." stays in the message.
+- Reply attributions (`On <date>, <name> wrote:`) followed by `>` quoting.
+  The quoted history is parsed as messages of its own (recursively, for
+  nested quotes), so each message appears once no matter how often it
+  was quoted.
+- Slack copy/paste lines (`[10:42 AM] Alice: ...`, `Alice Smith  10:42 AM`)
+- Slack JSON exports (a list of message objects), via `parse_thread`
+
+Messages whose text is identical after whitespace normalization are kept
+once. Near duplicates (a "+1" restating a message, a lightly edited
+forward) are collapsed into the first of them, which records how many
+times and by whom it was repeated (see `src.near_duplicates`). Threads
+with no recognizable structure fall back to one message per blank-line
+separated block.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+import json
+import re
+
+from src.near_duplicates import fingerprint, group_near_duplicates
+from src.sources import read_lines
+
+_FROM_RE = re.compile(r"^\s*\*?From:\*?\s*(?P<sender>.{1,100}?)\s*$", re.IGNORECASE)
+_HEADER_RE = re.compile(r"^\s*\*?(?P<name>Sent|Date|To|Cc|Subject):\*?\s*(?P<value>.*?)\s*$", re.IGNORECASE)
+_WROTE_RES = (
+    # On Mon, Jan 5, 2024 at 10:42 AM Alice Smith <alice@example.com> wrote:
+    re.compile(r"^\s*On (?P<date>.+?\d{1,2}:\d{2}(?:\s*[AaPp]\.?[Mm]\.?)?),? (?P<sender>.+?) wrote:\s*$"),
+    # On Jan 5, 2024, Alice wrote:
+    re.compile(r"^\s*On (?P<date>.+), (?P<sender>[^,]+?) wrote:\s*$"),
+)
+_SEPARATOR_RE = re.compile(r"^\s*-{2,}\s*(?:Original Message|Forwarded message)\s*-{2,}\s*$", re.IGNORECASE)
+_QUOTE_RE = re.compile(r"^\s*> ?")
+_SLACK_RES = (
+    # [10:42 AM] Alice: message   /   [2024-01-05 10:42] alice: message
+    # (a clock time is required, so "[1] Note: ..." footnotes aren't messages)
+    re.compile(r"^\[(?P<time>[\d/.\- T]*\d{1,2}:\d{2}(?::\d{2})?(?:\s*[AaPp][Mm])?)\]\s*(?P<sender>[^:\[\]]{1,60}):\s?(?P<text>.*)$"),
+    # Alice Smith  10:42 AM   (name and time on their own line, message below)
+    re.compile(r"^(?P<sender>\S[^\t:]{0,60}?)(?:\s{2,}|\t)(?P<time>\d{1,2}:\d{2}\s*[AaPp][Mm])\s*$"),
+)
+# "From:" with something that reads as a name: up to four words (each not lowercase, see
+# `_looks_like_sender`) and no sentence punctuation
+_SENDER_NAME_RE = re.compile(r"^[^\W\d_][^\s,;:!?()]*(?: [^\W\d_][^\s,;:!?()]*){0,3}$")
+_EMAIL_ADDRESS_RE = re.compile(r"\s*[<\[](?:mailto:)?[^<>\[\]\s]+@[^<>\[\]\s]+[>\]]")
+
+
+@dataclass
+class Message:
+    """A single message in a thread."""
+
+    sender: str | None = None
+    timestamp: str | None = None
+    lines: list[str] = field(default_factory=list)
+    # Near duplicates collapsed into this message, and who sent them
+    repeats: int = 0
+    repeated_by: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines).strip()
+
+    def __reduce__(self):
+        # Pickle the lines as one string: much cheaper to send back from the
+        # process pool than thousands of small strings, and `text` is unchanged
+        return Message, (self.sender, self.timestamp, ["\n".join(self.lines)], self.repeats, self.repeated_by)
+
+    def as_dict(self) -> dict:
+        result = {
+            "sender": self.sender or "Unknown",
+            "timestamp": self.timestamp or "Unknown",
+            "text": self.text,
+        }
+        if self.repeats:
+            result["repeated"] = {"times": self.repeats, "by": self.repeated_by}
+        return result
+
+
+@dataclass
+class ParsedThread:
+    """Result of parsing a thread."""
+
+    format: str
+    messages: list[Message]
+    quoted_lines_removed: int = 0
+    duplicates_removed: int = 0
+    near_duplicates_collapsed: int = 0
+
+
+def _clean_sender(sender: str) -> str:
+    name = _EMAIL_ADDRESS_RE.sub("", sender).strip().strip('"')
+    return name or sender.strip("<> ")
+
+
+def _looks_like_sender(raw: str, name: str) -> bool:
+    if _EMAIL_ADDRESS_RE.search(raw) or "@" in name:
+        return True
+    return bool(_SENDER_NAME_RE.match(name)) and not any(word[0].islower() for word in name.split())
+
+
+def collapse_near_duplicates(thread: ParsedThread) -> ParsedThread:
+    """Fold near-duplicate messages into the first of them (in place), counting the repeats."""
+    messages = thread.messages
+    groups = group_near_duplicates([message.text for message in messages])
+    if len(groups) == len(messages):
+        return thread
+    kept = []
+    for group in groups:
+        message = messages[group[0]]
+        for index in group[1:]:
+            repeat = messages[index]
+            message.repeats += 1 + repeat.repeats
+            message.repeated_by.extend([repeat.sender or "Unknown", *repeat.repeated_by])
+        message.repeated_by = list(dict.fromkeys(message.repeated_by))
+        kept.append(message)
+    thread.near_duplicates_collapsed += len(messages) - len(kept)
+    thread.messages = kept
+    return thread
+
+
+class ThreadParser:
+    """Incremental parser: call `feed()` for each line, then `finish()`."""
+
+    def __init__(self, sender: str | None = None, timestamp: str | None = None):
+        self.format = "plain"
+        # Only a top-level thread falls back to splitting on blank lines
+        self._split_plain = sender is None
+        self.quoted_lines_removed = 0
+        self._messages: list[Message] = []
+        self._current = Message(sender=sender, timestamp=timestamp)
+        self._in_headers = False
+        # A "From:" line that doesn't name a sender, held until the next line shows whether headers follow
+        self._pending_from: tuple[str, str] | None = None
+        self._quote: ThreadParser | None = None
+        # Messages found in the current message's quoted history
+        self._quoted_messages: list[Message] = []
+        self._loose_quote_lines = 0
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\r\n")
+
+        if self._pending_from is not None:
+            from_line, sender = self._pending_from
+            self._pending_from = None
+            if _HEADER_RE.match(line):
+                self._start(sender, None, "email")
+                self._in_headers = True
+            else:
+                self._current.lines.append(from_line)
+
+        if self._quote is not None:
+            # Blank lines inside a quoted block belong to it
+            if _QUOTE_RE.match(line) or not line.strip():
+                self._quote.feed(_QUOTE_RE.sub("", line, count=1))
+                return
+            self._close_quote()
+
+        if _QUOTE_RE.match(line):
+            self._loose_quote_lines += 1
+            self.quoted_lines_removed += 1
+            return
+        self._flush_loose_quote()
+
+        if self._in_headers:
+            header = _HEADER_RE.match(line)
+            if header:
+                if header.group("name").lower() in ("sent", "date"):
+                    self._current.timestamp = header.group("value")
+                return
+            self._in_headers = False
+
+        match = _FROM_RE.match(line)
+        if match:
+            sender = _clean_sender(match.group("sender"))
+            if _looks_like_sender(match.group("sender"), sender):
+                self._start(sender, None, "email")
+                self._in_headers = True
+            else:
+                self._pending_from = (line, sender)
+            return
+
+        for pattern in _WROTE_RES:
+            match = pattern.match(line)
+            if match:
+                self._quote = ThreadParser(_clean_sender(match.group("sender")), match.group("date").strip())
+                self._set_format("email")
+                return
+
+        if _SEPARATOR_RE.match(line):
+            self._set_format("email")
+            return
+
+        for pattern in _SLACK_RES:
+            match = pattern.match(line)
+            if match:
+                self._start(match.group("sender").strip(), match.group("time").strip(), "slack")
+                text = match.groupdict().get("text")
+                if text:
+                    self._current.lines.append(text)
+                return
+
+        self._current.lines.append(line)
+
+    def finish(self) -> ParsedThread:
+        """Close the last message and return the de-duplicated result."""
+        if self._pending_from is not None:
+            self._current.lines.append(self._pending_from[0])
+            self._pending_from = None
+        if self._quote is not None:
+            self._close_quote()
+        self._flush_loose_quote()
+        self._push_current()
+
+        messages = self._messages
+        if self._split_plain and self.format == "plain" and len(messages) == 1:
+            messages = _split_paragraphs(messages[0])
+
+        unique, seen, duplicates = [], set(), 0
+        for message in messages:
+            text = message.text
+            if not text:
+                continue
+            key = fingerprint(text)
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            unique.append(message)
+        return ParsedThread(self.format, unique, self.quoted_lines_removed, duplicates)
+
+    def _close_quote(self) -> None:
+        quoted = self._quote.finish()
+        self._quote = None
+        self.quoted_lines_removed += sum(len(m.lines) for m in quoted.messages) + quoted.quoted_lines_removed
+        self._quoted_messages.extend(quoted.messages)
+
+    def _flush_loose_quote(self) -> None:
+        if self._loose_quote_lines:
+            self._current.lines.append(f"[{self._loose_quote_lines} quoted lines removed]")
+            self._loose_quote_lines = 0
+
+    def _set_format(self, fmt: str) -> None:
+        if self.format == "plain":
+            self.format = fmt
+
+    def _push_current(self) -> None:
+        self._messages.append(self._current)
+        self._messages.extend(self._quoted_messages)
+        self._quoted_messages = []
+
+    def _start(self, sender: str, timestamp: str | None, fmt: str) -> None:
+        self._set_format(fmt)
+        self._push_current()
+        self._current = Message(sender=sender, timestamp=timestamp)
+        self._in_headers = False
+
+
+def _split_paragraphs(message: Message) -> list[Message]:
+    messages = [Message()]
+    for line in message.lines:
+        if line.strip():
+            messages[-1].lines.append(line)
+        elif messages[-1].lines:
+            messages.append(Message())
+    return messages
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of `text` without building a list of them."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def parse_lines(lines: Iterable[str], sender: str | None = None, timestamp: str | None = None) -> ParsedThread:
+    """Parse a thread from an iterable of lines.
+
+    `sender` and `timestamp` are given to any lines before the first
+    message header, for parsing the continuation of a thread.
+    """
+    parser = ThreadParser(sender, timestamp)
+    for line in lines:
+        parser.feed(line)
+    return collapse_near_duplicates(parser.finish())
+
+
+def parse_thread(text: str, sender: str | None = None, timestamp: str | None = None) -> ParsedThread:
+    """Parse a pasted email/Slack thread or a Slack JSON export (see `parse_lines`)."""
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        parsed = _parse_slack_export(stripped)
+        if parsed is not None:
+            return parsed
+    return parse_lines(iter_lines(text), sender, timestamp)
+
+
+def parse_file(path: str) -> ParsedThread:
+    """Parse a thread saved to a file, streaming it line by line (Slack exports are read whole)."""
+    with open(path, encoding="utf-8", errors="replace") as file:
+        head = file.read(4096).lstrip()
+    if head.startswith("["):
+        with open(path, encoding="utf-8", errors="replace") as file:
+            return parse_thread(file.read())
+    return parse_lines(read_lines(path))
+
+
+def _parse_slack_export(text: str) -> ParsedThread | None:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, list) or not all(isinstance(item, dict) and "text" in item for item in data):
+        return None
+
+    messages, seen, duplicates = [], set(), 0
+    for item in data:
+        profile = item.get("user_profile") or {}
+        sender = profile.get("real_name") or item.get("user_name") or item.get("user")
+        timestamp = None
+        if item.get("ts"):
+            try:
+                timestamp = datetime.fromtimestamp(float(item["ts"]), tz=timezone.utc).isoformat()
+            except (TypeError, ValueError, OverflowError, OSError):
+                timestamp = str(item["ts"])
+        text = str(item["text"]).strip()
+        if not text:
+            continue
+        key = fingerprint(text)
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        messages.append(Message(sender=sender, timestamp=timestamp, lines=[text]))
+    return collapse_near_duplicates(ParsedThread("slack-export", messages, 0, duplicates))
@@ -0,0 +1,115 @@
+"""
+Local red-flag scanner for check_tone.
+
+Finds the red flags listed in the tone-calibration rules with
+precompiled regexes. Each category is one linear scan; patterns start
+with a literal or character class so the regex engine can skip ahead,
+which measured several times faster than one combined alternation.
+Phrase matching runs on a lowercased copy (`src.phrases.fold`, which
+also folds curly quotes) instead of using IGNORECASE for the same reason.
+
+- all_caps: runs of capitalized words, ignoring known acronyms. A run is
+  flagged if it has 2+ words or a word of 5+ letters, so unknown
+  acronyms up to 4 letters ("SRE", "GDPR") are left alone.
+- multiple_exclamation: two or more `!` in a row (`!!`, `!?!`, ...)
+- sarcasm: common sarcastic / passive-aggressive phrases
+- unintended_curtness: one-word sentences like "Fine." or "Noted.", and
+  very short messages with no greeting or thanks
+
+The sarcastic phrases, curt words and greetings depend on the language;
+`src.locales` loads them from the locale packs, and a `RedFlagScanner`
+compiles one language's set.
+"""
+
+import re
+
+from src.phrases import fold
+
+ACRONYMS = frozenset("""
+    AFAIK AI AKA AM API APIS ASAP AWS CEO CFO CI CD CLI CORS CPU CRM CRUD
+    CSRF CSS CSV CTO DB DEI DM DNS DOD DRI EOD EOM EOQ EOW EOY ERP ETA ETL
+    EU FAQ FTE FYI GA GCP GDPR GPU GRPC GTM GUI HIPAA HR HTML HTTP HTTPS IAM
+    ICYMI ID IDE IIRC IMO IMHO IO IP IT JIRA JSON JWT KPI KPIS LGTM LLM MCP
+    ML MR MVP NDA NPS OAUTH OK OKR OKRS OOO OS PDF PII PM PMS POC PR PRD
+    PRS PST PTO QA QBR QPS RACI RAM RCA REST RFC ROI RSVP SAAS SAML SDK
+    SDLC SEO SLA SLO SLT SOC SOP SOW SOX SQL SRE SSH SSL SSO TBA TBD TCP TL
+    TLDR TL;DR TLS TTL UAT UDP UI URL US USB UTC UUID UX VP VPN WCAG WFH
+    WIP XML XSS YAML YOY YTD
+""".split())
+
+_CAPS_WORD = r"[A-Z][A-Z'’;]*[A-Z](?!\w)"
+_CAPS_RE = re.compile(rf"[A-Z](?<!\w[A-Z])[A-Z'’;]*[A-Z](?!\w)(?:[ \t]+{_CAPS_WORD})*")
+_EXCLAMATION_RE = re.compile(r"!(?:[!?]*!)")
+
+CATEGORIES = ("all_caps", "multiple_exclamation", "sarcasm", "unintended_curtness")
+
+# Matches listed per category (counts are always complete)
+MAX_MATCHES = 20
+
+# Messages with at most this many words and no greeting/thanks read as curt
+SHORT_MESSAGE_WORDS = 3
+
+
+def _is_shouting(run: str) -> bool:
+    words = [w for w in run.split() if w not in ACRONYMS]
+    return len(words) >= 2 or any(len(w) >= 5 for w in words)
+
+
+class RedFlagScanner:
+    """Red-flag patterns for one language, compiled once."""
+
+    def __init__(self, sarcasm_phrases, curt_words, greetings):
+        """
+        Args:
+            sarcasm_phrases: Sarcastic / passive-aggressive phrases
+            curt_words: Words that read as curt when they are a sentence on their own
+            greetings: Greetings and thanks that keep a very short message from reading as curt
+        """
+        sarcasm = sorted({fold(phrase) for phrase in sarcasm_phrases}, key=len, reverse=True)
+        curt = sorted({fold(word) for word in curt_words}, key=len, reverse=True)
+        # Matched against "\n" + text.lower(), so offsets are shifted by one
+        self._sarcasm_re = re.compile(r"(?:" + "|".join(map(re.escape, sarcasm)) + r")(?!\w)")
+        # Sentence boundary followed by a one-word sentence (the word is group 1)
+        self._curt_re = re.compile(
+            r"[.!?\n](?=[ \t]*((?:" + "|".join(map(re.escape, curt)) + r")(?:[.!]+(?=\s|$)|(?=\s*$))))"
+        )
+        self._greeting_re = re.compile(
+            r"\b(?:" + "|".join(re.escape(greeting) for greeting in greetings) + r")\b", re.IGNORECASE
+        )
+
+    def scan(self, text: str, folded: str | None = None) -> dict:
+        """Find tone red flags in `text` (`folded` is `fold(text)`, if the caller already has it).
+
+        Returns:
+            {"total": n, "<category>": {"count": n, "matches": [{"start", "end", "text"}]}}
+        """
+        found = {category: [] for category in CATEGORIES}
+        for match in _CAPS_RE.finditer(text):
+            if _is_shouting(match.group()):
+                found["all_caps"].append(match.span())
+        found["multiple_exclamation"] = [m.span() for m in _EXCLAMATION_RE.finditer(text)]
+
+        lowered = "\n" + (folded if folded is not None else fold(text))
+        for match in self._sarcasm_re.finditer(lowered):
+            start = match.start()
+            if not lowered[start - 1].isalnum():
+                found["sarcasm"].append((start - 1, match.end() - 1))
+        for match in self._curt_re.finditer(lowered):
+            found["unintended_curtness"].append((match.start(1) - 1, match.end(1) - 1))
+
+        if len(text) < 80 and not found["unintended_curtness"]:
+            words = text.split()
+            if 0 < len(words) <= SHORT_MESSAGE_WORDS and not self._greeting_re.search(text):
+                start = len(text) - len(text.lstrip())
+                found["unintended_curtness"].append((start, len(text.rstrip())))
+
+        result = {"total": sum(len(spans) for spans in found.values())}
+        for category, spans in found.items():
+            result[category] = {
+                "count": len(spans),
+                "matches": [
+                    {"start": start, "end": end, "text": text[start:end]}
+                    for start, end in spans[:MAX_MATCHES]
+                ],
+            }
+        return result
@@ -0,0 +1,154 @@
+"""
+Running tool functions off the event loop.
+
+FastMCP calls synchronous tool functions directly on the event loop, so
+while one tool runs, no other session gets served. `Workers.offload`
+turns a synchronous tool into an async handler that runs it in a worker
+thread, with a limit on how many run at once.
+
+Parsing a multi-megabyte input is pure-Python work that holds the GIL, so
+a worker thread alone would still slow every other call down. Inside a
+tool, `Workers.run` sends such work to a small process pool once the input
+is above a size threshold (smaller inputs run inline; the process round
+trip would cost more than it saves). Calls to the pool are bounded:
+
+- backpressure: at most `max_pending` jobs are queued or running (a job
+  whose call timed out or was cancelled keeps its slot until it finishes);
+  further calls wait for a slot and fail with "server busy" if none frees
+  up in time
+- timeout: a job not finished within `timeout` seconds fails the call
+- cancellation: if the client cancels or disconnects, the waiting call
+  stops and a job that hasn't started yet is dropped from the queue
+"""
+
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeout
+import contextvars
+import functools
+import multiprocessing
+import threading
+import time
+
+import anyio
+import anyio.to_thread
+from anyio.lowlevel import RunVar
+
+# Set for each offloaded call; Workers.run polls it while waiting on the pool
+_cancelled: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("cancelled", default=None)
+
+_POLL_INTERVAL = 0.05  # seconds between cancellation checks while waiting
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when the process pool queue stays full for the whole timeout."""
+
+
+class Workers:
+    """Bounded pool of worker threads for tool calls, plus a process pool for large inputs."""
+
+    def __init__(
+        self,
+        max_threads: int = 8,
+        max_processes: int = 2,
+        max_pending: int | None = None,
+        process_threshold: int = 256 * 1024,
+        timeout: float = 60.0,
+    ):
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.max_pending = max_pending if max_pending is not None else max_processes * 2
+        self.process_threshold = process_threshold
+        self.timeout = timeout
+        # One limiter per event loop (a limiter can't be shared across loops)
+        self._limiter = RunVar(f"workers_limiter_{id(self)}")
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(self.max_threads)
+            self._limiter.set(limiter)
+            return limiter
+
+    def offload(self, fn):
+        """Decorator: run the synchronous `fn` in a worker thread when awaited."""
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cancelled = threading.Event()
+            call = functools.partial(_run_with_cancel_event, cancelled, fn, args, kwargs)
+            try:
+                # abandon_on_cancel: return to the client right away; the thread
+                # sees `cancelled` and stops waiting on the process pool
+                return await anyio.to_thread.run_sync(call, limiter=self.limiter, abandon_on_cancel=True)
+            except anyio.get_cancelled_exc_class():
+                cancelled.set()
+                raise
+
+        return wrapper
+
+    def run(self, fn, *args, size: int):
+        """
+        Call `fn(*args)`, in the process pool if `size` is over the threshold.
+
+        `fn` and its arguments and result must be picklable (module-level
+        functions and plain data).
+
+        Args:
+            fn: Function to call
+            size: Size of the input in characters, compared to the threshold
+
+        Returns:
+            Whatever `fn` returns
+        """
+        if size < self.process_threshold or self.max_processes <= 0:
+            return fn(*args)
+
+        cancelled = _cancelled.get()
+        deadline = time.monotonic() + self.timeout
+        if not self._pending.acquire(timeout=self.timeout):
+            raise ServerBusyError(f"Server is busy: {self.max_pending} large inputs are already being processed")
+        try:
+            future = self.pool.submit(fn, *args)
+        except BaseException:
+            self._pending.release()
+            raise
+        # The slot is freed when the job ends, not when this call gives up on it:
+        # cancel() can't stop a job that is already running in the pool
+        future.add_done_callback(lambda _: self._pending.release())
+        while True:
+            if cancelled is not None and cancelled.is_set():
+                future.cancel()
+                raise CancelledError("Call cancelled by the client")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                future.cancel()
+                raise TimeoutError(f"Processing took longer than {self.timeout:g} seconds")
+            try:
+                return future.result(timeout=min(_POLL_INTERVAL, remaining))
+            except FutureTimeout:
+                continue
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """The process pool, started on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn, not fork: forking a process that has threads running can deadlock
+                self._pool = ProcessPoolExecutor(self.max_processes, mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the process pool (if started), dropping queued jobs."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+def _run_with_cancel_event(cancelled: threading.Event, fn, args, kwargs):
+    _cancelled.set(cancelled)
+    return fn(*args, **kwargs)
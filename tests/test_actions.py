@@ -0,0 +1,20 @@
+from datetime import date
+
+from src.actions import decode_agenda, find_action
+
+REFERENCE = date(2026, 10, 14)
+
+
+def test_agenda_owner_before_time_slot():
+    [item] = decode_agenda("Review design doc (Alice) - 10 min", REFERENCE)
+    assert (item["item"], item["owner"], item["minutes"]) == ("Review design doc", "Alice", 10)
+
+
+def test_agenda_owner_after_time_slot():
+    [item] = decode_agenda("- Review design doc - 10 min (Alice)", REFERENCE)
+    assert (item["item"], item["owner"], item["minutes"]) == ("Review design doc", "Alice", 10)
+
+
+def test_due_date_is_the_deadline_phrase():
+    action = find_action("Sam will send the Dec 2 deck to the client by Friday", REFERENCE)
+    assert action.due.phrase == "Friday"
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from src.budget import ELIDED, Budget, estimate_tokens
+from src.templates import ResponseTemplate, Slot
+
+TEMPLATE = ResponseTemplate({
+    "input": {"document": Slot("document")},
+    "framework": {"steps": "Read the outline first, then one section at a time"},
+    "sections": Slot("sections"),
+    "metrics": Slot("metrics"),
+}, elide={"document": "Pass the document again", "sections": None, "metrics": None})
+VALUES = {
+    "document": "word " * 2000,
+    "sections": [{"title": f"Section {i}", "words": 100} for i in range(50)],
+    "metrics": {"words": 2000, "sentences": 100},
+}
+
+
+def test_no_budget_renders_byte_identical_output():
+    assert TEMPLATE.render(budget=Budget(), **VALUES) == TEMPLATE.render(**VALUES)
+    assert TEMPLATE.render(budget=Budget(max_tokens=10**6), **VALUES) == TEMPLATE.render(**VALUES)
+
+
+def test_slots_are_cut_in_elide_order():
+    full = len(TEMPLATE.render(**VALUES).encode())
+    response = json.loads(TEMPLATE.render(budget=Budget(max_bytes=full // 3), **VALUES))
+    assert len(json.dumps(response, indent=2).encode()) <= full // 3
+    fields = response["elided"]["fields"]
+    assert fields[0]["field"] == "document"
+    assert fields[0]["how_to_get_it"] == "Pass the document again"
+    assert response["input"]["document"] == ELIDED or response["input"]["document"].endswith("more characters elided]")
+    # Derived data later in the order is kept once the raw content is cut
+    assert response["metrics"] == VALUES["metrics"]
+    assert response["framework"] == TEMPLATE.structure["framework"]
+
+
+def test_lists_keep_their_first_items():
+    response = json.loads(TEMPLATE.render(budget=Budget(max_tokens=300), **{**VALUES, "document": "short"}))
+    sections = response["sections"]
+    assert sections[:-1] == VALUES["sections"][:len(sections) - 1]
+    assert sections[-1].endswith("more items elided]")
+    assert [field["field"] for field in response["elided"]["fields"]] == ["sections"]
+
+
+def test_token_estimate_is_in_the_right_range():
+    text = "The quick brown fox jumps over the lazy dog. " * 20
+    assert 180 <= estimate_tokens(text) <= 260
+    assert estimate_tokens("") == 0
+
+
+def test_negative_limits_are_rejected():
+    with pytest.raises(ValueError):
+        Budget(max_tokens=-1)
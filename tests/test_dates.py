@@ -0,0 +1,36 @@
+from datetime import date
+
+import pytest
+
+from src.dates import find_dates
+
+# A Wednesday
+REFERENCE = date(2026, 10, 14)
+
+
+def resolved(text):
+    return [(match.phrase, match.date) for match in find_dates(text, REFERENCE)]
+
+
+@pytest.mark.parametrize("text", ["3 separate tickets", "2 decks", "Decision 2", "2 junior devs", "marketing 5"])
+def test_words_starting_like_a_month_are_not_dates(text):
+    assert resolved(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("due 2026-11-02", date(2026, 11, 2)),
+    ("on Dec 2", date(2026, 12, 2)),
+    ("10 Sept. 2027", date(2027, 9, 10)),
+    ("by Friday", date(2026, 10, 16)),
+    ("next Friday", date(2026, 10, 23)),
+    ("tomorrow", date(2026, 10, 15)),
+    ("in 2 weeks", date(2026, 10, 28)),
+    ("by EOD", date(2026, 10, 14)),
+])
+def test_date_phrases_resolve_against_the_reference(text, expected):
+    [(_, value)] = resolved(text)
+    assert value == expected
+
+
+def test_vague_phrases_have_no_date():
+    assert resolved("sometime next sprint, ASAP") == [("next sprint", None), ("ASAP", None)]
@@ -0,0 +1,50 @@
+from pathlib import Path
+import copy
+import json
+
+import pytest
+
+from src.decisions import DecisionTable
+
+TABLE_PATH = Path(__file__).resolve().parent.parent / "src" / "resources" / "call-or-text.json"
+
+
+@pytest.fixture(scope="module")
+def table():
+    return DecisionTable.from_file(TABLE_PATH)
+
+
+def test_every_urgency_complexity_pair_has_a_rule(table):
+    pairs = {(u, c) for u in table.urgency.levels for c in table.complexity.levels}
+    assert pairs <= table.rules.keys()
+    assert all(table.rules[pair]["method"] in ("call", "text", "video") for pair in pairs)
+
+
+def test_a_missing_rule_is_refused():
+    data = json.loads(TABLE_PATH.read_text(encoding="utf-8"))
+    broken = copy.deepcopy(data)
+    broken["rules"] = broken["rules"][1:]
+    with pytest.raises(ValueError, match="No rule for"):
+        DecisionTable(broken)
+
+
+def test_arguments_win_over_the_situation(table):
+    decision = table.decide("just a status update", urgency="asap", complexity="needs discussion")
+    assert decision["urgency"]["level"] == "immediate"
+    assert decision["urgency"]["from"] == "urgency argument"
+    assert decision["complexity"]["level"] == "needs_discussion"
+    assert decision["confidence"] == 1.0
+    assert not decision["needs_review"]
+
+
+def test_negated_phrase_hides_the_shorter_one(table):
+    decision = table.decide("This is not urgent, just a heads up")
+    assert decision["urgency"]["level"] == "no_deadline"
+    assert decision["urgency"]["matched"] == ["not urgent"]
+
+
+def test_nothing_to_go_on_falls_back_to_defaults_for_review(table):
+    decision = table.decide("Hello")
+    assert decision["urgency"]["from"] == decision["complexity"]["from"] == "default"
+    assert decision["needs_review"]
+    assert "review" in decision
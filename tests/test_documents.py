@@ -0,0 +1,49 @@
+from src.documents import DocumentStore, content_hash, split_sections
+
+DOCUMENT = """Intro text before any heading.
+
+# Overview
+Some overview.
+
+```
+# not a heading inside a fence
+```
+
+Details
+-------
+Underlined heading body.
+
+## Next steps ##
+Ship it.
+"""
+
+
+def test_sections_follow_headings_and_skip_fenced_code():
+    sections = split_sections(DOCUMENT)
+    assert [(s.title, s.level) for s in sections] == [("Preamble", 0), ("Overview", 1), ("Details", 2), ("Next steps", 2)]
+    assert sections[0].start == 0
+    assert sections[-1].end == len(DOCUMENT)
+    assert all(a.end == b.start for a, b in zip(sections, sections[1:]))
+
+
+def test_long_sections_split_into_parts_at_paragraphs():
+    text = "# Big\n" + "\n\n".join("word " * 20 for _ in range(10))
+    sections = split_sections(text, max_chars=250)
+    assert len(sections) > 1
+    assert all(s.title.startswith("Big (part ") for s in sections)
+    assert all(s.end - s.start <= 250 for s in sections)
+    assert "".join(text[s.start:s.end] for s in sections) == text
+
+
+def test_store_serves_sections_and_evicts_least_recently_used():
+    store = DocumentStore(max_chars=2 * len(DOCUMENT) + 2)
+    first = store.add(DOCUMENT)
+    assert first.doc_id == content_hash(DOCUMENT)
+    assert first.section_text(1).startswith("# Overview")
+    assert store.add(DOCUMENT) is first
+
+    store.add(DOCUMENT + "a")
+    store.get(first.doc_id)
+    store.add(DOCUMENT + "b")
+    assert store.get(first.doc_id) is first
+    assert store.get(content_hash(DOCUMENT + "a")) is None
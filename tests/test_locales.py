@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+
+from src.locales import LocalePacks
+
+RESOURCES = Path(__file__).resolve().parent.parent / "src" / "resources"
+
+
+@pytest.fixture(scope="module")
+def packs():
+    return LocalePacks(RESOURCES)
+
+
+@pytest.mark.parametrize("text, locale", [
+    ("Could you please send me the updated project plan before the meeting tomorrow?", "en"),
+    ("Könntest du mir bitte den aktualisierten Projektplan vor der Besprechung morgen schicken?", "de"),
+    ("¿Podrías enviarme el plan del proyecto actualizado antes de la reunión de mañana?", "es"),
+    ("Pourrais-tu m'envoyer le plan de projet mis à jour avant la réunion de demain ?", "fr"),
+])
+def test_detects_the_language_of_workplace_text(packs, text, locale):
+    detected = packs.detector().detect(text)
+    assert (detected["locale"], detected["source"]) == (locale, "detected")
+
+
+@pytest.mark.parametrize("text", ["ok", "Thx!", "12345 67890", ""])
+def test_short_text_falls_back_to_the_default_locale(packs, text):
+    assert packs.detector().detect(text) == {"locale": "en", "confidence": 0.0, "source": "default"}
+
+
+def test_packs_load_on_first_use():
+    packs = LocalePacks(RESOURCES)
+    assert packs.locales() == ["de", "en", "es", "fr"]
+    assert packs.loaded() == []
+    assert packs.get("FR ").locale == "fr"
+    assert packs.get() is packs.get("en")
+    assert packs.loaded() == ["en", "fr"]
+    with pytest.raises(ValueError, match="No locale pack for 'xx'"):
+        packs.get("xx")
@@ -0,0 +1,24 @@
+from datetime import date
+
+from src.meetings import MeetingSessions, classify_line
+
+REFERENCE = date(2026, 10, 14)
+
+
+def test_question_lines_starting_with_a_verb_stay_questions():
+    assert classify_line("- Open question: budget?", REFERENCE) == ("question", {"text": "Open question: budget?"})
+    assert classify_line("Review the budget?", REFERENCE) == ("question", {"text": "Review the budget?"})
+
+
+def test_owned_request_is_still_an_action_item():
+    kind, item = classify_line("Can you review the budget?", REFERENCE)
+    assert kind == "action_item"
+    assert item["who"] == "You"
+
+
+def test_session_keeps_questions_out_of_action_items():
+    session = MeetingSessions().open("Budget sync", REFERENCE)
+    session.append("- Open question: budget?\nReview the budget?\nSam will send the deck by Friday\n")
+    summary = session.summary()
+    assert [item["text"] for item in summary["open_questions"]] == ["Open question: budget?", "Review the budget?"]
+    assert [item["who"] for item in summary["action_items"]] == ["Sam"]
@@ -0,0 +1,50 @@
+from pathlib import Path
+import os
+import subprocess
+import sys
+
+from src.near_duplicates import collapse_paragraphs, group_near_duplicates
+from src.threads import parse_thread
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ROLLOUT = "The prod rollout starts Monday at 9am, please make sure the runbook is updated and on-call knows."
+
+
+def test_short_exact_repeats_collapse():
+    notes = "Decision: ship it.\n\nAgenda: budget review\n\nDecision: ship it.\n\nAgenda: budget review\n\nDecision:  Ship it."
+    text, removed = collapse_paragraphs(notes)
+    assert removed == 3
+    assert text.split("\n\n") == [
+        "Decision: ship it.\n[Repeated 2 more times in the notes]",
+        "Agenda: budget review\n[Repeated 1 more time in the notes]",
+    ]
+
+
+def test_short_texts_differing_by_a_date_or_number_stay_apart():
+    assert group_near_duplicates(["Can you review PR 123 by Friday?", "Can you review PR 456 by Friday?"]) == [[0], [1]]
+    notes = "Ship on May 10.\n\nShip on May 12."
+    assert collapse_paragraphs(notes) == (notes, 0)
+
+
+def test_long_near_duplicates_group_but_changed_dates_do_not():
+    texts = [ROLLOUT, ROLLOUT.replace("Monday", "Friday"), ROLLOUT + " Thanks!"]
+    assert group_near_duplicates(texts) == [[0, 2], [1]]
+
+
+def test_signatures_do_not_depend_on_the_hash_seed():
+    code = "from src.near_duplicates import shingles, signature; print(signature(shingles(%r)))" % ROLLOUT
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code], env={**os.environ, "PYTHONHASHSEED": seed}, cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        for seed in ("1", "7")
+    }
+    assert len(outputs) == 1
+
+
+def test_thread_near_duplicates_record_who_repeated_them():
+    thread = parse_thread(f"[10:00 AM] Alice: {ROLLOUT}\n[10:05 AM] Bob: {ROLLOUT} Thanks!\n[10:06 AM] Cal: ok")
+    assert thread.near_duplicates_collapsed == 1
+    assert [(m.sender, m.repeats, m.repeated_by) for m in thread.messages] == [("Alice", 1, ["Bob"]), ("Cal", 0, [])]
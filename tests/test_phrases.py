@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from src.phrases import PhraseMatcher, PhraseTable, fold
+
+RESOURCES = Path(__file__).resolve().parent.parent / "src" / "resources"
+
+
+def test_matches_overlapping_phrases_case_and_whitespace_insensitive():
+    matcher = PhraseMatcher(["no rush", "rush", "when you get a chance"])
+    text = "No   rush, When you get\na chance."
+    assert [(m.phrase, text[m.start:m.end]) for m in matcher.find(text)] == [
+        ("no rush", "No   rush"),
+        ("rush", "rush"),
+        ("when you get a chance", "When you get\na chance"),
+    ]
+
+
+def test_only_whole_words_match():
+    matcher = PhraseMatcher(["eod", "thoughts?"])
+    assert matcher.find("geode period") == []
+    assert [m.phrase for m in matcher.find("Thoughts? By EOD")] == ["thoughts?", "eod"]
+
+
+def test_fold_keeps_offsets_and_straightens_quotes():
+    text = "İt’s done"
+    assert len(fold(text)) == len(text)
+    assert fold("We’ll “see”") == "we'll \"see\""
+
+
+def test_phrase_table_from_locale_file():
+    table = PhraseTable.from_file(RESOURCES / "en" / "vague-phrases.json")
+    assert len(table) > 10
+    [hit] = table.find("Hey, when you get a chance can we talk")
+    assert hit["phrase"] == "when you get a chance"
+    assert hit["text"] == "when you get a chance"
+    assert hit["meaning"]
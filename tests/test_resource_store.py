@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from src.resource_store import ResourceStore
+
+
+def touch(path, text):
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    # Make sure the mtime moves even on filesystems with coarse timestamps
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_files_are_served_from_memory_until_they_change(tmp_path):
+    path = tmp_path / "tone.md"
+    path.write_text("# Tone\n", encoding="utf-8")
+    store = ResourceStore(tmp_path, check_interval=0)
+    assert store.names() == ["tone"]
+    first = store.get("tone")
+    assert store.get("tone") is first
+
+    touch(path, "# Tone v2\n")
+    second = store.get("tone")
+    assert second.text == "# Tone v2\n"
+    assert second.sha256 != first.sha256
+    assert store.manifest() == {"tone": {"sha256": second.sha256, "size": len("# Tone v2\n")}}
+
+
+def test_changes_are_picked_up_only_after_the_check_interval(tmp_path):
+    path = tmp_path / "tone.md"
+    path.write_text("# Tone\n", encoding="utf-8")
+    store = ResourceStore(tmp_path, check_interval=3600)
+    store.get("tone")
+    touch(path, "# Tone v2\n")
+    assert store.read("tone") == "# Tone\n"
+
+
+def test_last_good_copy_is_kept_if_the_file_disappears(tmp_path):
+    path = tmp_path / "tone.md"
+    path.write_text("# Tone\n", encoding="utf-8")
+    store = ResourceStore(tmp_path, check_interval=0)
+    store.get("tone")
+    path.unlink()
+    assert store.read("tone") == "# Tone\n"
+    with pytest.raises(FileNotFoundError):
+        store.get("missing")
@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+
+from src.resource_store import ResourceStore
+from src.rules_index import RulesIndex, keywords, slugify
+
+RESOURCES = Path(__file__).resolve().parent.parent / "src" / "resources"
+
+TONE = """# Tone
+
+## Sarcasm
+Sarcasm reads as hostile in text.
+Say what you mean instead.
+
+## Exclamation marks
+One exclamation mark is friendly.
+Several read as shouting.
+"""
+
+MEETINGS = """# Meetings
+
+## Agenda
+Ask for an agenda before the meeting.
+Note what is expected of you.
+"""
+
+
+def make_index(tmp_path):
+    (tmp_path / "tone.md").write_text(TONE, encoding="utf-8")
+    (tmp_path / "meetings.md").write_text(MEETINGS, encoding="utf-8")
+    return RulesIndex(ResourceStore(tmp_path, check_interval=0))
+
+
+def test_keywords_and_slugs():
+    assert keywords("What are the Deadlines for this?") == ["deadline"]
+    assert slugify("Exclamation marks!") == "exclamation-marks"
+    assert slugify("???") == "section"
+
+
+def test_sections_are_addressed_by_topic_and_heading(tmp_path):
+    index = make_index(tmp_path)
+    assert [section.uri for section in index.sections()] == [
+        "comms://rules/meetings/agenda",
+        "comms://rules/tone/sarcasm",
+        "comms://rules/tone/exclamation-marks",
+    ]
+    assert index.section("tone", "sarcasm").text.startswith("## Sarcasm")
+    assert index.section("tone", "missing") is None
+
+
+def test_search_ranks_matching_sections_and_uses_prefixes(tmp_path):
+    index = make_index(tmp_path)
+    assert [section.slug for _, section in index.search("agenda for the meeting")] == ["agenda"]
+    assert [section.slug for _, section in index.search("sarcastic")] == ["sarcasm"]
+    assert index.search("zebra") == []
+
+
+def test_index_is_rebuilt_when_a_rule_file_changes(tmp_path):
+    index = make_index(tmp_path)
+    assert index.search("calendar") == []
+    path = tmp_path / "meetings.md"
+    path.write_text(MEETINGS + "\n## Calendar\nBlock focus time in your calendar.\nDecline clashes.\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert [section.slug for _, section in index.search("calendar")] == ["calendar"]
+
+
+def test_shipped_rule_files_have_searchable_sections():
+    index = RulesIndex(ResourceStore(RESOURCES))
+    assert {section.topic for section in index.sections()} >= {"message-clarity", "tone-calibration"}
+    assert index.search("sarcasm")[0][1].topic == "tone-calibration"
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from src.templates import FrameworkRegistry, ResponseTemplate, Slot
+
+TEMPLATE = ResponseTemplate({
+    "input": {"draft": Slot("draft"), "length": Slot("length")},
+    "framework": {"clarity": "Is the ask clear?", "steps": ["Read", "Check"]},
+    "detected": Slot("detected"),
+})
+VALUES = {
+    "draft": 'Line one\nwith "quotes" and ünïcode',
+    "length": 42,
+    "detected": {"phrases": [{"phrase": "no rush", "span": [0, 7]}], "empty": [], "none": None},
+}
+
+
+def test_render_is_byte_identical_to_dumping_the_dict():
+    assert TEMPLATE.render(**VALUES) == json.dumps(TEMPLATE.as_dict(**VALUES), indent=2)
+
+
+def test_slots_and_framework():
+    assert TEMPLATE.slots == ["draft", "length", "detected"]
+    assert TEMPLATE.framework == {"framework": {"clarity": "Is the ask clear?", "steps": ["Read", "Check"]}}
+
+
+def test_framework_by_reference_and_stale_versions():
+    registry = FrameworkRegistry("comms://frameworks/")
+    template = ResponseTemplate(TEMPLATE.structure, elide={"detected": None})
+    registry.publish("check", template)
+    name, version = template.framework_uri.removeprefix("comms://frameworks/").split("@")
+    assert name == "check"
+    assert json.loads(registry.read("check", version)) == template.framework
+
+    by_reference = json.loads(template.render(framework_ref=True, **VALUES))
+    assert by_reference["framework"] == template.framework_uri
+    assert by_reference["detected"] == VALUES["detected"]
+
+    with pytest.raises(ValueError, match="out of date"):
+        registry.read("check", "0" * 12)
+    with pytest.raises(ValueError, match="Unknown framework"):
+        registry.read("missing", version)
+
+
+def test_publishing_a_name_twice_needs_the_same_framework():
+    registry = FrameworkRegistry("comms://frameworks/")
+    registry.publish("check", ResponseTemplate(TEMPLATE.structure))
+    registry.publish("check", ResponseTemplate({**TEMPLATE.structure, "input": {"other": Slot("other")}}))
+    with pytest.raises(ValueError, match="different content"):
+        registry.publish("check", ResponseTemplate({**TEMPLATE.structure, "framework": {"changed": True}}))
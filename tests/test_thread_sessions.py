@@ -0,0 +1,17 @@
+from src.thread_sessions import ThreadSessions
+
+THREAD = "[10:02 AM] Alex: We are blocked on legal review.\n[10:05 AM] Sam: Decision: we're going with the vendor plan. Can you send the contract by Friday?"
+
+
+def test_blocker_is_reported_once_and_totals_run_on():
+    sessions = ThreadSessions()
+    update = sessions.update("t1", THREAD)
+    assert [blocker["waiting_on"] for blocker in update.detected["blockers"]] == ["legal review"]
+    assert [decision["sender"] for decision in update.decisions] == ["Sam"]
+    assert update.totals == {"messages": 2, "decisions": 1, "action_items": 1, "deadlines": 1, "blockers": 1}
+
+    update = sessions.update("t1", THREAD + "\n[10:30 AM] Alex: Still blocked on legal review.")
+    assert update.mode == "appended"
+    assert [message.sender for message in update.thread.messages] == ["Alex"]
+    assert update.detected["blockers"][0]["message"] == 3
+    assert update.totals["blockers"] == 2
@@ -0,0 +1,64 @@
+import pytest
+
+from src.threads import parse_thread
+
+REPLY_CHAIN = """Sounds good, let's ship Friday.
+
+On Mon, Jan 5, 2024 at 10:42 AM Alice Smith <alice@example.com> wrote:
+> Can we ship Friday?
+>
+> On Jan 4, 2024, Bob wrote:
+>> Build is green.
+"""
+
+
+def test_quoted_replies_become_their_own_messages():
+    thread = parse_thread(REPLY_CHAIN)
+    assert thread.format == "email"
+    assert [(m.sender, m.timestamp, m.text) for m in thread.messages] == [
+        (None, None, "Sounds good, let's ship Friday."),
+        ("Alice Smith", "Mon, Jan 5, 2024 at 10:42 AM", "Can we ship Friday?"),
+        ("Bob", "Jan 4, 2024", "Build is green."),
+    ]
+
+
+def test_slack_lines_and_repeated_messages():
+    thread = parse_thread("[10:00 AM] Alice: hi all\n[10:01 AM] Bob: Hi  all\nAlice Smith  10:05 AM\nnext message")
+    assert thread.format == "slack"
+    assert thread.duplicates_removed == 1
+    assert [(m.sender, m.timestamp, m.text) for m in thread.messages] == [
+        ("Alice", "10:00 AM", "hi all"),
+        ("Alice Smith", "10:05 AM", "next message"),
+    ]
+
+
+@pytest.mark.parametrize("ts", ["1e20", "inf", "nan"])
+def test_slack_export_keeps_out_of_range_timestamps_as_text(ts):
+    thread = parse_thread('[{"text": "a", "ts": "%s"}]' % ts)
+    assert thread.format == "slack-export"
+    assert thread.messages[0].timestamp == ts
+
+
+def test_from_in_prose_does_not_start_a_message():
+    thread = parse_thread("Hi all,\nFrom: the design team's perspective, this is fine.\nThanks")
+    assert thread.format == "plain"
+    assert [message.sender for message in thread.messages] == [None]
+    assert "From: the design team's perspective" in thread.messages[0].text
+
+
+def test_from_header_starts_a_message():
+    thread = parse_thread(
+        "From: Alice Smith <alice@example.com>\nSent: Monday\n\nHello there.\n\n"
+        "From: the design team\nTo: everyone\n\nReply here."
+    )
+    assert thread.format == "email"
+    assert [(message.sender, message.text) for message in thread.messages] == [
+        ("Alice Smith", "Hello there."),
+        ("the design team", "Reply here."),
+    ]
+
+
+def test_footnote_is_not_a_slack_message():
+    thread = parse_thread("[10:42 AM] Alice: see the notes below\n[1] Note: see appendix")
+    assert [message.sender for message in thread.messages] == ["Alice"]
+    assert thread.messages[0].text == "see the notes below\n[1] Note: see appendix"
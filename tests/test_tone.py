@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+
+from src.locales import LocalePacks
+
+RESOURCES = Path(__file__).resolve().parent.parent / "src" / "resources"
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return LocalePacks(RESOURCES).get("en").red_flags
+
+
+def caps(scanner, text):
+    return [match["text"] for match in scanner.scan(text)["all_caps"]["matches"]]
+
+
+@pytest.mark.parametrize("text", ["We need GDPR sign-off", "update the JIRA ticket", "The SRE team owns the KPI"])
+def test_acronyms_are_not_shouting(scanner, text):
+    assert caps(scanner, text) == []
+
+
+def test_long_words_and_runs_of_caps_are_shouting(scanner):
+    assert caps(scanner, "This is URGENT, I SAID NO and see the API docs") == ["URGENT", "SAID NO"]
+
+
+def test_exclamations_and_curt_replies(scanner):
+    flags = scanner.scan("Thanks for the update!! Fine.")
+    assert [m["text"] for m in flags["multiple_exclamation"]["matches"]] == ["!!"]
+    assert [m["text"] for m in flags["unintended_curtness"]["matches"]] == ["Fine."]
@@ -0,0 +1,42 @@
+import time
+
+import anyio
+import pytest
+
+from src.workers import ServerBusyError, Workers
+
+
+@pytest.fixture
+def workers():
+    pool = Workers(max_processes=1, max_pending=1, process_threshold=100, timeout=1.0)
+    yield pool
+    pool.shutdown()
+
+
+def test_small_inputs_run_inline(workers):
+    assert workers.run(sorted, [3, 1, 2], size=10) == [1, 2, 3]
+    assert workers._pool is None
+
+
+def test_large_inputs_run_in_the_pool(workers):
+    assert workers.run(sorted, [3, 1, 2], size=1000) == [1, 2, 3]
+    assert workers._pool is not None
+
+
+def test_timed_out_job_keeps_its_slot_until_it_ends(workers):
+    workers.timeout = 0.5
+    with pytest.raises(TimeoutError):
+        workers.run(time.sleep, 2, size=1000)
+    # The job is still running in the pool, so the only slot is taken
+    with pytest.raises(ServerBusyError):
+        workers.run(sorted, [1], size=1000)
+    time.sleep(2)
+    assert workers.run(sorted, [2, 1], size=1000) == [1, 2]
+
+
+def test_offload_runs_the_tool_in_a_thread(workers):
+    @workers.offload
+    def tool(text):
+        return text.upper()
+
+    assert anyio.run(tool, "hi") == "HI"